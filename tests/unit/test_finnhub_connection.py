@@ -11,7 +11,8 @@ from datetime import datetime, timedelta
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 try:
-    from tradingagents.live_data_fetchers import live_finnhub
+    from tradingagents.live_data_fetchers import get_live_finnhub
+    live_finnhub = get_live_finnhub()
     print("✅ Successfully imported live_finnhub")
 except Exception as e:
     print(f"❌ Error importing live_finnhub: {e}")
@@ -0,0 +1,291 @@
+"""
+Unit tests for the SmartCache used by the dataflows.
+
+This module tests:
+- Storing and retrieving cached data
+- TTL validation through the binary cache index
+- Invalidation, expiry cleanup and statistics
+- Migration of legacy JSON metadata sidecars
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+import pandas as pd
+
+from tradingagents.dataflows.cache_utils import (
+    SmartCache, CacheIndex, DataType, create_cache_key
+)
+
+
+class TestSmartCache(unittest.TestCase):
+    """Test SmartCache storage and TTL behaviour."""
+
+    def setUp(self):
+        """Create a cache in a temporary directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.config = {
+            "data_cache_dir": self.temp_dir.name,
+            "historical_data_sources": ["stock_price_historical"],
+            "cache_bypass_trading_hours": False,
+        }
+        self.cache = SmartCache(self.config)
+        self.past_date = (datetime.now() - timedelta(days=30)).strftime("%Y-%m-%d")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _store(self, cache_key, data):
+        return self.cache.set_cached_data(
+            cache_key=cache_key,
+            data=data,
+            data_source="stock_price_historical",
+            date_str=self.past_date
+        )
+
+    def test_round_trip_formats(self):
+        """Strings, JSON-compatible objects and bytes are returned as stored."""
+        self.assertTrue(self._store("csv_key", "Date,Close\n2024-01-02,100.0\n"))
+        self.assertTrue(self._store("json_key", {"price": 100.0, "volume": [1, 2]}))
+        self.assertTrue(self._store("bin_key", b"\x00\x01binary"))
+
+        self.assertEqual(self.cache.get_cached_data("csv_key"), "Date,Close\n2024-01-02,100.0\n")
+        self.assertEqual(self.cache.get_cached_data("json_key"), {"price": 100.0, "volume": [1, 2]})
+        self.assertEqual(self.cache.get_cached_data("bin_key"), b"\x00\x01binary")
+        self.assertIsNone(self.cache.get_cached_data("missing_key"))
+
+    def test_dataframe_round_trip(self):
+        """DataFrames are stored as Arrow/Parquet when available, otherwise as CSV text."""
+        frame = pd.DataFrame({
+            "Date": pd.to_datetime(["2024-01-02", "2024-01-03"]),
+            "Close": [100.0, 101.5],
+            "Volume": [1000, 2000],
+        })
+
+        for frame_format in ("arrow", "parquet", "csv"):
+            with self.subTest(frame_format=frame_format):
+                self.cache.frame_format = SmartCache(
+                    dict(self.config, cache_frame_format=frame_format)
+                ).frame_format
+                self.assertTrue(self._store("frame_key", frame))
+
+                cached = self.cache.get_cached_data("frame_key")
+                if self.cache.frame_format == "csv":
+                    self.assertEqual(cached, frame.to_csv(index=False))
+                else:
+                    pd.testing.assert_frame_equal(cached, frame)
+
+    def test_dataframe_index_round_trip(self):
+        """A DatetimeIndex is stored with the frame rather than dropped."""
+        frame = pd.DataFrame(
+            {"Close": [100.0, 101.5]},
+            index=pd.DatetimeIndex(pd.to_datetime(["2024-01-02", "2024-01-03"]), name="Date")
+        )
+
+        for frame_format in ("arrow", "parquet", "csv"):
+            with self.subTest(frame_format=frame_format):
+                self.cache.frame_format = SmartCache(
+                    dict(self.config, cache_frame_format=frame_format)
+                ).frame_format
+                self.assertTrue(self._store("indexed_key", frame))
+
+                cached = self.cache.get_cached_data("indexed_key")
+                if self.cache.frame_format == "csv":
+                    self.assertEqual(cached, frame.to_csv())
+                else:
+                    pd.testing.assert_frame_equal(cached, frame, check_freq=False)
+
+    def test_should_use_cache_respects_ttl(self):
+        """Entries are valid until their TTL elapses."""
+        self._store("ttl_key", "a,b\n1,2\n")
+
+        self.assertTrue(self.cache.should_use_cache("stock_price_historical", self.past_date, "ttl_key"))
+        self.assertFalse(self.cache._is_cache_valid("ttl_key", 0))
+        self.assertFalse(self.cache.should_use_cache("stock_price_historical", self.past_date, "missing"))
+
+    def test_live_data_is_never_cached(self):
+        """Live sources and current-day data bypass the cache."""
+        today = datetime.now().strftime("%Y-%m-%d")
+        self.assertFalse(self.cache.set_cached_data("live_key", "x", "real_time_quote", today))
+        self.assertFalse(self.cache.should_use_cache("stock_price_historical", today))
+        self.assertEqual(self.cache.classify_data_type("stock_price_current_day"), DataType.LIVE)
+        self.assertEqual(self.cache.classify_data_type("Stock_Price_Current_Day"), DataType.LIVE)
+        self.assertEqual(
+            self.cache.classify_data_type("STOCK_PRICE_HISTORICAL", self.past_date), DataType.HISTORICAL
+        )
+
+    def test_index_persists_across_instances(self):
+        """A new SmartCache sees entries written by a previous one."""
+        self._store("persist_key", "a,b\n1,2\n")
+        self.cache.invalidate_cache("persist_key")
+        self._store("other_key", "c,d\n3,4\n")
+
+        reopened = SmartCache(self.config)
+        self.assertIsNone(reopened._index.get("persist_key"))
+        self.assertIsNotNone(reopened._index.get("other_key"))
+        self.assertTrue(reopened.should_use_cache("stock_price_historical", self.past_date, "other_key"))
+
+    def test_instances_see_each_others_writes(self):
+        """Entries written or invalidated through one SmartCache are seen by another."""
+        other = SmartCache(self.config)
+        self._store("shared_key", "a,b\n1,2\n")
+
+        self.assertTrue(other.should_use_cache("stock_price_historical", self.past_date, "shared_key"))
+        self.assertEqual(other.get_cached_data("shared_key"), "a,b\n1,2\n")
+
+        self.cache.invalidate_cache("shared_key")
+        self.assertIsNone(other.get_cached_data("shared_key"))
+
+        # Compaction by one instance replaces the file the other has read
+        self._store("later_key", "c\n3\n")
+        self.cache._index.compact()
+        self._store("after_compact_key", "d\n4\n")
+        self.assertEqual(other.get_cached_data("later_key"), "c\n3\n")
+        self.assertEqual(other.get_cached_data("after_compact_key"), "d\n4\n")
+        self.assertIsNone(other._index.get("shared_key"))
+
+    def test_invalidate_and_clean_expired(self):
+        """Invalidation and expiry cleanup remove both data and index entries."""
+        self._store("drop_key", "a\n1\n")
+        self.assertTrue(self.cache.invalidate_cache("drop_key"))
+        self.assertIsNone(self.cache.get_cached_data("drop_key"))
+        self.assertFalse(self.cache.invalidate_cache("drop_key"))
+
+        expired_key = create_cache_key("stock_price_historical", "OLD")
+        fresh_key = create_cache_key("stock_price_historical", "NEW")
+        orphan_key = create_cache_key("stock_price_historical", "ORPHAN")
+        self._store(expired_key, "a\n1\n")
+        self._store(fresh_key, "a\n1\n")
+        timestamp, ttl, type_id, format_id = self.cache._index.get(expired_key)
+        self.cache._index.put(expired_key, timestamp - (ttl + 1) * 60, ttl, type_id, format_id)
+
+        stats = self.cache.get_cache_stats()
+        self.assertEqual(stats['total_entries'], 2)
+        self.assertEqual(stats['expired_entries'], 1)
+        self.assertEqual(stats['by_type']['historical'], 2)
+
+        # Unindexed and stale-format cache files are swept once past the grace period;
+        # files not named like cache keys are left alone
+        cache_dir = Path(self.temp_dir.name)
+        Path(cache_dir, f"{orphan_key}.csv").write_text("a\n1\n", encoding="utf-8")
+        Path(cache_dir, f"{fresh_key}.json").write_text("{}", encoding="utf-8")
+        Path(cache_dir, "user_notes.csv").write_text("a\n1\n", encoding="utf-8")
+        old = time.time() - 3600
+        for path in cache_dir.iterdir():
+            os.utime(path, (old, old))
+        unindexed_key = create_cache_key("stock_price_historical", "IN_FLIGHT")
+        Path(cache_dir, f"{unindexed_key}.csv").write_text("a\n1\n", encoding="utf-8")
+
+        self.assertEqual(self.cache.clean_expired_cache(), 1)
+        self.assertIsNone(self.cache.get_cached_data(expired_key))
+        self.assertIsNotNone(self.cache.get_cached_data(fresh_key))
+        self.assertEqual(
+            sorted(p.name for p in cache_dir.iterdir() if not p.name.startswith("index.")),
+            sorted([f"{fresh_key}.csv", f"{unindexed_key}.csv", "user_notes.csv"])
+        )
+
+    def test_index_compaction(self):
+        """Superseded records are compacted away without losing live entries."""
+        for i in range(100):
+            self._store("rewritten_key", f"a\n{i}\n")
+
+        index_size = os.path.getsize(self.cache._index.path)
+        self.assertLess(index_size, 100 * (len("rewritten_key") + 16))
+        self.assertEqual(CacheIndex(self.cache._index.path).entries.keys(), {"rewritten_key"})
+        self.assertEqual(self.cache.get_cached_data("rewritten_key"), "a\n99\n")
+
+    def test_compaction_keeps_other_writers_records(self):
+        """Compacting one index handle preserves records appended through another."""
+        path = Path(self.temp_dir.name) / "shared.bin"
+        first, second = CacheIndex(path), CacheIndex(path)
+        first.put("first_key", time.time(), 60, 2, 0)
+        second.put("second_key", time.time(), 60, 2, 0)
+
+        first.compact()
+        self.assertEqual(CacheIndex(path).entries.keys(), {"first_key", "second_key"})
+
+    def test_unreadable_index_starts_empty(self):
+        """A corrupt index record resets the handle instead of keeping stale read state."""
+        path = Path(self.temp_dir.name) / "corrupt.bin"
+        index = CacheIndex(path)
+        index.put("good_key", time.time(), 60, 2, 0)
+        with open(path, 'ab') as f:
+            f.write(CacheIndex._pack("bad_key", time.time(), 60, 2, 0)[:-7] + b"\xff" * 7)
+
+        with self.assertLogs("tradingagents.dataflows.cache_utils", level="WARNING"):
+            self.assertIsNone(index.get("good_key"))
+        self.assertEqual((index._offset, index._record_count), (0, 0))
+
+    def test_concurrent_writes(self):
+        """Threads writing different keys all land in the index and on disk."""
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda i: self._store(f"key_{i}", f"a\n{i}\n"), range(50)))
+
+        self.assertTrue(all(results))
+        reopened = SmartCache(self.config)
+        for i in range(50):
+            self.assertEqual(reopened.get_cached_data(f"key_{i}"), f"a\n{i}\n")
+
+    def test_migrates_legacy_metadata_sidecars(self):
+        """Legacy .meta sidecars are imported into the index once."""
+        with tempfile.TemporaryDirectory() as legacy_dir:
+            Path(legacy_dir, "legacy_key.csv").write_text("a\n1\n", encoding="utf-8")
+            Path(legacy_dir, "legacy_key.meta").write_text(json.dumps({
+                'timestamp': datetime.now().isoformat(),
+                'data_type': 'historical',
+                'data_source': 'stock_price_historical',
+                'date_str': self.past_date,
+                'ttl_minutes': 1440,
+                'file_format': 'csv'
+            }), encoding="utf-8")
+
+            cache = SmartCache(dict(self.config, data_cache_dir=legacy_dir))
+
+            self.assertFalse(Path(legacy_dir, "legacy_key.meta").exists())
+            self.assertTrue(cache.should_use_cache("stock_price_historical", self.past_date, "legacy_key"))
+            self.assertEqual(cache.get_cached_data("legacy_key"), "a\n1\n")
+
+    def test_migrates_epoch_timestamp_sidecars(self):
+        """Sidecars with epoch-second timestamps migrate with the same age."""
+        with tempfile.TemporaryDirectory() as legacy_dir:
+            written_at = time.time() - 120
+            Path(legacy_dir, "epoch_key.csv").write_text("a\n1\n", encoding="utf-8")
+            Path(legacy_dir, "epoch_key.meta").write_text(json.dumps({
+                'timestamp': written_at,
+                'data_type': 'historical',
+                'ttl_minutes': 1440,
+                'file_format': 'csv'
+            }), encoding="utf-8")
+
+            cache = SmartCache(dict(self.config, data_cache_dir=legacy_dir))
+            self.assertEqual(cache._index.get("epoch_key")[0], written_at)
+
+
+class TestCreateCacheKey(unittest.TestCase):
+    """Test cache key construction."""
+
+    def test_keys_are_deterministic_and_distinct(self):
+        key = create_cache_key("stock_price_historical", "AAPL", "2024-01-01", "2024-02-01", indicator="rsi")
+        self.assertEqual(
+            key,
+            create_cache_key("stock_price_historical", "AAPL", "2024-01-01", "2024-02-01", indicator="rsi")
+        )
+        self.assertNotEqual(
+            key,
+            create_cache_key("stock_price_historical", "AAPL", "2024-01-01", "2024-02-01", indicator="macd")
+        )
+        self.assertEqual(len(key), 32)
+        self.assertTrue(all(c in "0123456789abcdef" for c in key))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -8,9 +8,12 @@ This module tests the technical analysis components including:
 - Technical signal generation
 """
 
+import os
+import tempfile
 import unittest
 import pandas as pd
 import numpy as np
+from collections.abc import Mapping
 from datetime import datetime, timedelta
 from unittest.mock import patch, MagicMock
 import warnings
@@ -19,7 +22,9 @@ import warnings
 warnings.filterwarnings("ignore", category=FutureWarning)
 
 try:
-    from tradingagents.technical_patterns import TechnicalPatternAnalyzer, analyze_stock_patterns
+    from tradingagents.technical_patterns import (
+        TechnicalPatternAnalyzer, SRState, analyze_stock_patterns, analyze_stock_patterns_batch
+    )
     from tradingagents.dataflows.talib_utils import (
         TechnicalAnalysisUtils,
         get_technical_analysis_report,
@@ -104,13 +109,25 @@ class TestTechnicalPatternAnalyzer(unittest.TestCase):
         self.assertIn('volume', prepared_incomplete.columns)
         self.assertTrue(all(prepared_incomplete['volume'] == 0))
 
+    def test_ohlcv_extraction(self):
+        """Test extraction of prepared bars as contiguous float64 arrays."""
+        bars = self.analyzer.to_ohlcv(self.test_data)
+        prepared_data = self.analyzer.prepare_data(self.test_data)
+
+        self.assertEqual(len(bars), len(prepared_data))
+        for col in ['open', 'high', 'low', 'close', 'volume']:
+            values = getattr(bars, col)
+            self.assertEqual(values.dtype, np.float64)
+            self.assertTrue(values.flags['C_CONTIGUOUS'])
+            np.testing.assert_array_equal(values, prepared_data[col].to_numpy())
+
     def test_candlestick_pattern_detection(self):
         """Test candlestick pattern detection."""
         try:
             patterns = self.analyzer.detect_candlestick_patterns(self.test_data)
 
             # Should return a dictionary with analysis results
-            self.assertIsInstance(patterns, dict)
+            self.assertIsInstance(patterns, Mapping)
             self.assertIn('patterns_detected', patterns)
             self.assertIn('total_patterns', patterns)
             self.assertIn('analysis_date', patterns)
@@ -140,6 +157,33 @@ class TestTechnicalPatternAnalyzer(unittest.TestCase):
             # Current price should be positive
             self.assertGreater(sr_analysis['current_price'], 0)
 
+    def test_repeated_results_are_read_only(self):
+        """Test that memoized results cannot be changed through a returned copy."""
+        first = self.analyzer.calculate_fibonacci_levels(self.test_data)
+        with self.assertRaises(TypeError):
+            first['fibonacci_levels']['0.0%'] = -1.0
+        with self.assertRaises(TypeError):
+            first['extra'] = True
+
+        second = self.analyzer.calculate_fibonacci_levels(self.test_data)
+        self.assertNotIn('extra', second)
+        self.assertEqual(second['fibonacci_levels']['0.0%'], second['trend_high'])
+
+    def test_results_depend_on_recent_bars(self):
+        """Test that memoized results follow changes to the bars each analysis reads."""
+        first = self.analyzer.analyze_support_resistance(self.test_data)
+        changed = self.test_data.copy()
+        changed.loc[changed.index[-1], 'High'] = changed['High'].max() * 2
+        self.assertGreater(
+            self.analyzer.analyze_support_resistance(changed)['resistance_level'],
+            first['resistance_level']
+        )
+
+        # Earlier bars outside every window leave the result unchanged
+        early = self.test_data.copy()
+        early.loc[early.index[0], 'High'] = early['High'].max() * 2
+        self.assertEqual(self.analyzer.analyze_support_resistance(early), first)
+
     def test_fibonacci_analysis(self):
         """Test Fibonacci retracement calculation."""
         fib_analysis = self.analyzer.calculate_fibonacci_levels(self.test_data)
@@ -182,6 +226,32 @@ class TestTechnicalPatternAnalyzer(unittest.TestCase):
             self.assertGreaterEqual(confidence, 0)
             self.assertLessEqual(confidence, 100)
 
+    def test_technical_summary_incremental_levels(self):
+        """Test that summaries reusing level state match full recomputation."""
+        sr_state, fib_state = SRState(window=20), SRState(window=50)
+
+        for end in (len(self.test_data) - 1, len(self.test_data)):
+            data = self.test_data.iloc[:end]
+            incremental = self.analyzer.generate_technical_summary(
+                data, sr_state=sr_state, fib_state=fib_state
+            )
+            full = self.analyzer.generate_technical_summary(data)
+
+            self.assertEqual(incremental['support_resistance'], full['support_resistance'])
+            self.assertEqual(incremental['fibonacci_analysis'], full['fibonacci_analysis'])
+
+    def test_incremental_levels_across_date_layouts(self):
+        """Test that level state survives switching date types and stepping back in time."""
+        text_dated = self.test_data.assign(Date=self.test_data['Date'].dt.strftime('%Y-%m-%d'))
+        indexed = self.test_data.set_index('Date')
+        state = SRState(window=20)
+
+        for data in (text_dated, indexed.iloc[:90], text_dated.iloc[:80], indexed):
+            self.assertEqual(
+                self.analyzer.update_support_resistance(state, data),
+                self.analyzer.analyze_support_resistance(data)
+            )
+
     def test_trading_signal_generation(self):
         """Test trading signal generation from technical analysis."""
         summary = self.analyzer.generate_technical_summary(self.test_data)
@@ -238,6 +308,20 @@ class TestTechnicalPatternAnalyzer(unittest.TestCase):
             # Should handle errors gracefully
             self.assertIsInstance(str(e), str)
 
+    def test_analyze_stock_patterns_batch(self):
+        """Batch reports match the single-ticker reports, keyed in input order."""
+        frames = {'AAA': self.test_data, 'BBB': self.test_data.head(60), 'CCC': self.test_data.head(5)}
+        reports = analyze_stock_patterns_batch(frames)
+
+        # Drop the generation timestamp line before comparing
+        strip = lambda report: report.split('*Analysis generated on')[0]
+
+        self.assertEqual(list(reports), list(frames))
+        for ticker, data in frames.items():
+            self.assertEqual(strip(reports[ticker]), strip(analyze_stock_patterns(ticker, data)))
+
+        self.assertEqual(analyze_stock_patterns_batch({}), {})
+
 
 class TestTechnicalAnalysisUtils(unittest.TestCase):
     """Test the TechnicalAnalysisUtils dataflow interface."""
@@ -268,7 +352,7 @@ class TestTechnicalAnalysisUtils(unittest.TestCase):
         self.assertIsInstance(data, pd.DataFrame)
         mock_yf_download.assert_called_once()
 
-    @patch('tradingagents.dataflows.talib_utils.TechnicalAnalysisUtils._get_price_data')
+    @patch('tradingagents.dataflows.talib_utils.TechnicalAnalysisUtils._get_base_frame')
     def test_get_technical_analysis(self, mock_get_data):
         """Test technical analysis report generation."""
         # Mock price data
@@ -290,6 +374,66 @@ class TestTechnicalAnalysisUtils(unittest.TestCase):
         if not result.startswith('Technical Analysis Error'):
             self.assertIn('Technical Analysis Report: AAPL', result)
 
+    def test_levels_mix_offline_and_online_data(self):
+        """Test that offline and online level reports for one symbol do not disturb each other."""
+        dates = pd.date_range('2024-01-01', periods=80)
+        online_data = pd.DataFrame({
+            'Open': np.random.uniform(95, 105, 80),
+            'High': np.random.uniform(105, 110, 80),
+            'Low': np.random.uniform(90, 95, 80),
+            'Close': np.random.uniform(95, 105, 80),
+            'Volume': np.random.randint(100000, 1000000, 80)
+        }, index=pd.DatetimeIndex(dates, name='Date'))
+        offline_data = online_data.reset_index().assign(Date=dates.strftime('%Y-%m-%d'))
+
+        calls = [
+            (False, offline_data, '2024-03-20'),
+            (True, online_data, '2024-03-20'),
+            (False, offline_data.iloc[:60], '2024-02-29'),
+            (True, online_data.iloc[:60], '2024-02-29'),
+            (True, online_data, '2024-03-20'),
+        ]
+        for online, data, curr_date in calls:
+            sr_report = TechnicalAnalysisUtils.get_support_resistance_levels(
+                'MIXED', curr_date, 50, online, data=data
+            )
+            fib_report = TechnicalAnalysisUtils.get_fibonacci_analysis(
+                'MIXED', curr_date, 50, online, data=data
+            )
+            self.assertNotIn('Error', sr_report)
+            self.assertNotIn('Error', fib_report)
+
+    def test_reports_from_offline_data(self):
+        """Test that report interface functions read offline CSVs from data_dir or the config."""
+        offline_data = pd.DataFrame({
+            'Date': pd.date_range('2024-01-01', periods=120).strftime('%Y-%m-%d'),
+            'Open': np.random.uniform(95, 105, 120),
+            'High': np.random.uniform(105, 110, 120),
+            'Low': np.random.uniform(90, 95, 120),
+            'Close': np.random.uniform(95, 105, 120),
+            'Volume': np.random.randint(100000, 1000000, 120)
+        })
+
+        with tempfile.TemporaryDirectory() as data_dir:
+            price_dir = os.path.join(data_dir, 'market_data', 'price_data')
+            os.makedirs(price_dir)
+            offline_data.to_csv(
+                os.path.join(price_dir, 'OFFLINE-YFin-data-2015-01-01-2025-03-25.csv'), index=False
+            )
+
+            reports = [
+                get_technical_analysis_report('OFFLINE', '2024-04-29', 100, False, price_dir),
+                get_candlestick_patterns_report('OFFLINE', '2024-04-29', 30, False, price_dir),
+                get_support_resistance_report('OFFLINE', '2024-04-29', 50, False, price_dir),
+                get_fibonacci_levels_report('OFFLINE', '2024-04-29', 50, False, price_dir),
+            ]
+            with patch('tradingagents.dataflows.talib_utils.get_config', return_value={'data_dir': data_dir}):
+                reports.append(get_support_resistance_report('OFFLINE', '2024-04-29', 50, False))
+
+        for report in reports:
+            self.assertNotIn('Error', report)
+            self.assertIn('OFFLINE', report)
+
     def test_interface_functions(self):
         """Test the interface functions exist and are callable."""
         # Test function existence
@@ -18,7 +18,7 @@ from tradingagents.bedrock_news_tools import (
     get_global_news_bedrock,
     get_fundamentals_bedrock
 )
-from tradingagents.live_data_fetchers import live_finnhub, live_reddit
+from tradingagents.live_data_fetchers import get_live_finnhub, get_live_reddit
 from tradingagents.dataflows.talib_utils import (
     get_technical_analysis_report,
     get_candlestick_patterns_report,
@@ -448,7 +448,7 @@ class Toolkit:
         start_date_dt = datetime.strptime(curr_date, "%Y-%m-%d") - timedelta(days=look_back_days)
         start_date = start_date_dt.strftime("%Y-%m-%d")
 
-        result = live_finnhub.get_company_news(ticker, start_date, end_date)
+        result = get_live_finnhub().get_company_news(ticker, start_date, end_date)
         return result
 
     @staticmethod
@@ -473,7 +473,7 @@ class Toolkit:
         start_date_dt = datetime.strptime(curr_date, "%Y-%m-%d") - timedelta(days=look_back_days)
         start_date = start_date_dt.strftime("%Y-%m-%d")
 
-        result = live_finnhub.get_insider_transactions(ticker, start_date, end_date)
+        result = get_live_finnhub().get_insider_transactions(ticker, start_date, end_date)
         return result
 
     @staticmethod
@@ -492,7 +492,7 @@ class Toolkit:
         Returns:
             str: formatted Reddit discussions about the stock
         """
-        result = live_reddit.get_stock_discussions(ticker, days_back)
+        result = get_live_reddit().get_stock_discussions(ticker, days_back)
         return result
 
     @staticmethod
@@ -509,7 +509,7 @@ class Toolkit:
         Returns:
             str: formatted Reddit market sentiment and discussions
         """
-        result = live_reddit.get_market_sentiment(days_back)
+        result = get_live_reddit().get_market_sentiment(days_back)
         return result
 
     @staticmethod
@@ -524,7 +524,7 @@ class Toolkit:
         Returns:
             str: formatted real-time quote data including current price, changes, highs, lows
         """
-        result = live_finnhub.get_real_time_quote(ticker)
+        result = get_live_finnhub().get_real_time_quote(ticker)
         return result
 
     @staticmethod
@@ -539,7 +539,7 @@ class Toolkit:
         Returns:
             str: formatted earnings data including recent earnings and upcoming earnings calendar
         """
-        result = live_finnhub.get_earnings_data(ticker)
+        result = get_live_finnhub().get_earnings_data(ticker)
         return result
 
     @staticmethod
@@ -554,7 +554,7 @@ class Toolkit:
         Returns:
             str: formatted analyst recommendations including buy/hold/sell ratings
         """
-        result = live_finnhub.get_analyst_recommendations(ticker)
+        result = get_live_finnhub().get_analyst_recommendations(ticker)
         return result
 
     @staticmethod
@@ -566,7 +566,7 @@ class Toolkit:
         Returns:
             str: formatted market indicators including S&P 500, Dow Jones, NASDAQ, and VIX
         """
-        result = live_finnhub.get_market_indicators()
+        result = get_live_finnhub().get_market_indicators()
         return result
 
     @staticmethod
@@ -578,7 +578,7 @@ class Toolkit:
         Returns:
             str: formatted sector performance data across major market sectors
         """
-        result = live_finnhub.get_sector_performance()
+        result = get_live_finnhub().get_sector_performance()
         return result
 
 
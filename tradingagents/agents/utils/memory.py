@@ -1,11 +1,17 @@
+from collections import OrderedDict
+
 import chromadb
 from chromadb.config import Settings
 from ...bedrock_embeddings import BedrockEmbeddings
 
 
 class FinancialSituationMemory:
+    # Number of recent text embeddings kept to avoid repeat Bedrock calls
+    EMBEDDING_CACHE_SIZE = 256
+
     def __init__(self, name, config):
         self.config = config
+        self._embedding_cache = OrderedDict()
 
         # Use Bedrock embeddings exclusively
         self.bedrock_embeddings = BedrockEmbeddings(config)
@@ -22,8 +28,21 @@ class FinancialSituationMemory:
         self.situation_collection = self.chroma_client.create_collection(name=name)
 
     def get_embedding(self, text):
-        """Get embedding for a text using Bedrock embeddings"""
-        return self.bedrock_embeddings.get_embedding(text)
+        """Get embedding for a text using Bedrock embeddings, reusing recent results"""
+        embedding = self._embedding_cache.get(text)
+        if embedding is not None:
+            self._embedding_cache.move_to_end(text)
+            return embedding
+
+        embedding = self.bedrock_embeddings.get_embedding(text)
+        self._embedding_cache[text] = embedding
+        if len(self._embedding_cache) > self.EMBEDDING_CACHE_SIZE:
+            self._embedding_cache.popitem(last=False)
+        return embedding
+
+    def get_vector(self, text):
+        """Get an embedding suitable for the Chroma collection (binary embeddings unpacked)"""
+        return self.bedrock_embeddings.to_dense(self.get_embedding(text))
 
     def add_situations(self, situations_and_advice):
         """Add financial situations and their corresponding advice. Parameter is a list of tuples (situation, rec)"""
@@ -39,7 +58,7 @@ class FinancialSituationMemory:
             situations.append(situation)
             advice.append(recommendation)
             ids.append(str(offset + i))
-            embeddings.append(self.get_embedding(situation))
+            embeddings.append(self.get_vector(situation))
 
         self.situation_collection.add(
             documents=situations,
@@ -50,7 +69,7 @@ class FinancialSituationMemory:
 
     def get_memories(self, current_situation, n_matches=1):
         """Find matching recommendations using OpenAI embeddings"""
-        query_embedding = self.get_embedding(current_situation)
+        query_embedding = self.get_vector(current_situation)
 
         results = self.situation_collection.query(
             query_embeddings=[query_embedding],
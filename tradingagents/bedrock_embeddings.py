@@ -6,14 +6,69 @@ to replace the hash-based fallback in the memory system.
 """
 
 import boto3
+from botocore.config import Config
 import json
 import hashlib
 import numpy as np
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
 import logging
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    # orjson is optional - the standard json module is used instead
+
 logger = logging.getLogger(__name__)
 
+# Reuse TCP/TLS connections across embedding calls; the pool is sized for the
+# concurrent fan-out in get_embeddings_batch
+BEDROCK_CLIENT_CONFIG = Config(
+    max_pool_connections=32,
+    retries={"max_attempts": 5, "mode": "adaptive"},
+    tcp_keepalive=True,
+    read_timeout=30,
+    connect_timeout=5,
+)
+
+
+def _json_dumps(obj: Any):
+    """Serialize a Bedrock request body (bytes with orjson, str otherwise)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj)
+
+
+def _json_loads(data) -> Any:
+    """Parse a Bedrock response body from bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _quality_scores(similarities: np.ndarray, categories: np.ndarray) -> np.ndarray:
+    """
+    Score similarities against their expected category ("high", "medium" or "low").
+
+    In-range similarities (high > 0.4, medium 0.2-0.4, low < 0.2) score 1.0; otherwise
+    partial credit is given based on how close the similarity is to the expected range.
+    """
+    high = np.clip(similarities / 0.4, 0.0, 1.0)
+    medium = np.where(
+        (similarities >= 0.2) & (similarities <= 0.4),
+        1.0,
+        np.maximum(0.0, 1 - np.abs(similarities - 0.3) / 0.3)
+    )
+    low = np.where(similarities < 0.2, 1.0, np.maximum(0.0, (0.2 - similarities) / 0.2))
+    return np.select([categories == "high", categories == "medium"], [high, medium], default=low)
+
+
+# Remembers the last working embedding model per (aws_profile, aws_region)
+ACTIVE_MODEL_CACHE_FILE = Path.home() / ".cache" / "tradingagents" / "active_embed_model.txt"
+
 
 class BedrockEmbeddings:
     """AWS Bedrock embeddings client using Titan Embed or other available models."""
@@ -22,20 +77,17 @@ class BedrockEmbeddings:
         self.config = config
         self.aws_profile = config.get("aws_profile")
         self.aws_region = config.get("aws_region", "us-east-1")
+        # Quantized embedding type for Cohere models: "float", "int8" or "binary"
+        self.embedding_dtype = config.get("embedding_dtype", "float")
 
         # Initialize Bedrock client
         try:
-            if self.aws_profile:
-                session = boto3.Session(profile_name=self.aws_profile)
-                self.bedrock_client = session.client(
-                    service_name='bedrock-runtime',
-                    region_name=self.aws_region
-                )
-            else:
-                self.bedrock_client = boto3.client(
-                    service_name='bedrock-runtime',
-                    region_name=self.aws_region
-                )
+            self.session = boto3.Session(profile_name=self.aws_profile) if self.aws_profile else boto3.Session()
+            self.bedrock_client = self.session.client(
+                service_name='bedrock-runtime',
+                region_name=self.aws_region,
+                config=BEDROCK_CLIENT_CONFIG
+            )
 
             # Try different embedding models in order of preference
             # Based on diagnostic testing - prioritize known working models
@@ -54,16 +106,91 @@ class BedrockEmbeddings:
             self.bedrock_client = None
             self.active_model = None
 
+        # Titan v2 is requested with normalize=True, so its vectors are already unit-norm
+        self._normalized = self.active_model == "amazon.titan-embed-text-v2:0"
+
+    def _model_cache_key(self) -> str:
+        """Key for the on-disk active model cache."""
+        return f"{self.aws_profile or 'default'}|{self.aws_region}"
+
+    def _load_cached_model(self) -> Optional[str]:
+        """Return the previously working model for this profile/region, if any."""
+        try:
+            with open(ACTIVE_MODEL_CACHE_FILE, 'r') as f:
+                for line in f:
+                    key, _, model = line.rstrip("\n").partition("\t")
+                    if key == self._model_cache_key() and model in self.embedding_models:
+                        return model
+        except OSError:
+            pass
+        return None
+
+    def _store_cached_model(self, model: Optional[str]):
+        """Persist (or with None, invalidate) the active model for this profile/region."""
+        key = self._model_cache_key()
+        entries = {}
+        try:
+            with open(ACTIVE_MODEL_CACHE_FILE, 'r') as f:
+                for line in f:
+                    k, _, m = line.rstrip("\n").partition("\t")
+                    if k and m:
+                        entries[k] = m
+        except OSError:
+            pass
+
+        if model:
+            entries[key] = model
+        elif entries.pop(key, None) is None:
+            return
+
+        try:
+            ACTIVE_MODEL_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            with open(ACTIVE_MODEL_CACHE_FILE, 'w') as f:
+                f.writelines(f"{k}\t{m}\n" for k, m in entries.items())
+        except OSError as e:
+            logger.debug(f"Could not write embedding model cache: {e}")
+
+    def _list_embedding_models(self) -> Optional[List[str]]:
+        """List embedding models offered in this region with one control-plane call."""
+        try:
+            bedrock = self.session.client(
+                service_name='bedrock',
+                region_name=self.aws_region,
+                config=BEDROCK_CLIENT_CONFIG
+            )
+            response = bedrock.list_foundation_models(byOutputModality='EMBEDDING')
+            return [summary['modelId'] for summary in response.get('modelSummaries', [])]
+        except Exception as e:
+            logger.debug(f"Could not list Bedrock foundation models: {e}")
+            return None
+
     def _find_available_model(self) -> Optional[str]:
         """Find the first available embedding model with detailed error reporting."""
+        # Skip probing entirely when a previously working model is cached
+        cached_model = self._load_cached_model()
+        if cached_model:
+            logger.info(f"✅ Using cached Bedrock embedding model {cached_model}")
+            return cached_model
+
         model_test_results = []
 
-        for model in self.embedding_models:
+        # Narrow the candidates with a single list call before invoking anything
+        candidates = self.embedding_models
+        listed_models = self._list_embedding_models()
+        if listed_models:
+            listed = set(listed_models)
+            available = [model for model in self.embedding_models if model in listed]
+            if available:
+                # Keep unlisted models as a last resort in case the listing is incomplete
+                candidates = available + [model for model in self.embedding_models if model not in listed]
+
+        for model in candidates:
             try:
                 # Test with a simple embedding
                 embedding = self._embed_text("test", model)
                 if embedding and len(embedding) > 0:
                     logger.info(f"✅ Successfully initialized Bedrock embeddings with {model}")
+                    self._store_cached_model(model)
                     return model
                 else:
                     model_test_results.append(f"{model}: Empty embedding returned")
@@ -100,30 +227,27 @@ class BedrockEmbeddings:
         # Prepare request based on model type with model-specific optimizations
         if "titan-embed-text-v2" in model_id.lower():
             # Titan Embed v2 supports custom dimensions and normalization
-            body = json.dumps({
+            body = _json_dumps({
                 "inputText": text,
                 "dimensions": 1024,
                 "normalize": True
             })
         elif "titan-embed-g1-text" in model_id.lower():
             # General availability Titan model - simpler format
-            body = json.dumps({
+            body = _json_dumps({
                 "inputText": text
             })
         elif "titan-embed-text-v1" in model_id.lower():
             # Legacy Titan v1 - basic format only
-            body = json.dumps({
+            body = _json_dumps({
                 "inputText": text
             })
         elif "cohere" in model_id.lower():
             # Cohere models - array format
-            body = json.dumps({
-                "texts": [text],
-                "input_type": "search_document"
-            })
+            body = self._cohere_request_body([text])
         else:
             # Generic fallback
-            body = json.dumps({"inputText": text})
+            body = _json_dumps({"inputText": text})
 
         try:
             response = self.bedrock_client.invoke_model(
@@ -133,13 +257,13 @@ class BedrockEmbeddings:
                 contentType='application/json'
             )
 
-            response_body = json.loads(response.get('body').read())
+            response_body = _json_loads(response['body'].read())
 
             # Extract embeddings based on model response format
             if "titan" in model_id.lower():
                 return response_body.get('embedding', [])
             elif "cohere" in model_id.lower():
-                return response_body.get('embeddings', [[]]) [0]
+                return (self._cohere_embeddings(response_body) or [[]])[0]
             else:
                 return response_body.get('embedding', [])
 
@@ -166,6 +290,7 @@ class BedrockEmbeddings:
             return embedding
         except Exception as e:
             logger.error(f"Bedrock embedding failed for model {self.active_model}: {e}")
+            self._store_cached_model(None)
             raise RuntimeError(
                 f"Failed to generate embedding using Bedrock model {self.active_model}: {str(e)}"
             )
@@ -175,24 +300,122 @@ class BedrockEmbeddings:
         """Get embeddings for multiple texts."""
         return [self.get_embedding(text) for text in texts]
 
+    def get_embeddings_batch(self, texts: List[str], max_workers: int = 8) -> List[List[float]]:
+        """Get embeddings for multiple texts with as few Bedrock round trips as possible.
+
+        Cohere models accept a list of texts in a single request. Titan models only
+        embed one text per request, so those calls are fanned out concurrently.
+        """
+        if not texts:
+            return []
+
+        for text in texts:
+            if not text or not text.strip():
+                raise ValueError("Cannot create embedding for empty or whitespace-only text")
+
+        if not self.active_model or not self.bedrock_client:
+            raise RuntimeError(
+                "AWS Bedrock embeddings are not available. "
+                "Please check your AWS configuration, permissions, and model access. "
+                "Hash-based fallbacks have been removed to ensure consistent data quality."
+            )
+
+        if "cohere" in self.active_model.lower():
+            try:
+                # Cohere accepts up to 96 texts per request
+                embeddings = []
+                for start in range(0, len(texts), 96):
+                    embeddings.extend(self._embed_texts_cohere(texts[start:start + 96], self.active_model))
+                return embeddings
+            except Exception as e:
+                logger.error(f"Bedrock batch embedding failed for model {self.active_model}: {e}")
+                self._store_cached_model(None)
+                raise RuntimeError(
+                    f"Failed to generate embeddings using Bedrock model {self.active_model}: {str(e)}"
+                )
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(texts))) as executor:
+            return list(executor.map(self.get_embedding, texts))
+
+    def _embed_texts_cohere(self, texts: List[str], model_id: str) -> List[List[float]]:
+        """Embed several texts with a single Cohere request."""
+        if not self.bedrock_client:
+            raise Exception("Bedrock client not available")
+
+        response = self.bedrock_client.invoke_model(
+            body=self._cohere_request_body(texts),
+            modelId=model_id,
+            accept='application/json',
+            contentType='application/json'
+        )
+
+        response_body = _json_loads(response['body'].read())
+        embeddings = self._cohere_embeddings(response_body)
+        if len(embeddings) != len(texts) or not all(embeddings):
+            raise RuntimeError(f"Bedrock model {model_id} returned {len(embeddings)} embeddings for {len(texts)} texts")
+        return embeddings
+
+    def _cohere_request_body(self, texts: List[str]):
+        """Build a Cohere embed request, asking for quantized embeddings if configured."""
+        request = {
+            "texts": texts,
+            "input_type": "search_document"
+        }
+        if self.embedding_dtype in ("int8", "binary"):
+            request["embedding_types"] = [self.embedding_dtype]
+        return _json_dumps(request)
+
+    def _cohere_embeddings(self, response_body: Dict[str, Any]) -> List[List[float]]:
+        """Extract embeddings from a Cohere response (typed responses are keyed by dtype)."""
+        embeddings = response_body.get('embeddings', [])
+        if isinstance(embeddings, dict):
+            return embeddings.get(self.embedding_dtype, [])
+        return embeddings
+
+    def _uses_binary_embeddings(self) -> bool:
+        """Whether embeddings are packed sign bits (Cohere binary embeddings)."""
+        return (
+            self.embedding_dtype == "binary"
+            and self.active_model is not None
+            and "cohere" in self.active_model.lower()
+        )
+
+    def to_dense(self, embedding: List[float]) -> List[float]:
+        """Expand packed binary embeddings to +/-1 vectors for vector stores; others pass through."""
+        if not self._uses_binary_embeddings():
+            return embedding
+        bits = np.unpackbits(np.asarray(embedding, dtype=np.int8).view(np.uint8))
+        return (bits.astype(np.float32) * 2 - 1).tolist()
+
     def cosine_similarity(self, embedding1: List[float], embedding2: List[float]) -> float:
-        """Calculate cosine similarity between two embeddings."""
+        """Calculate cosine similarity between two embeddings (lists or 1-D arrays)."""
+        # len() is O(1) for lists and arrays, so mismatches return before any conversion
         if len(embedding1) != len(embedding2):
             return 0.0
 
-        # Convert to numpy arrays for easier calculation
-        a = np.array(embedding1)
-        b = np.array(embedding2)
+        if self._uses_binary_embeddings():
+            # Packed sign bits: cosine of the +/-1 vectors follows from the Hamming distance
+            a = np.asarray(embedding1, dtype=np.int8).view(np.uint8)
+            b = np.asarray(embedding2, dtype=np.int8).view(np.uint8)
+            hamming = int(np.unpackbits(a ^ b).sum())
+            return 1.0 - 2.0 * hamming / (a.size * 8)
+
+        # asarray does not copy float64 arrays, so stored vectors are used in place
+        a = np.asarray(embedding1, dtype=np.float64)
+        b = np.asarray(embedding2, dtype=np.float64)
 
-        # Calculate cosine similarity
-        dot_product = np.dot(a, b)
-        norm_a = np.linalg.norm(a)
-        norm_b = np.linalg.norm(b)
+        # Unit-norm embeddings: cosine similarity is just the dot product
+        if self._normalized:
+            return float(a @ b)
 
-        if norm_a == 0 or norm_b == 0:
+        # Three BLAS dot products: a.b, a.a and b.b
+        dot_product = a @ b
+        norm_product = np.sqrt((a @ a) * (b @ b))
+
+        if norm_product == 0:
             return 0.0
 
-        return dot_product / (norm_a * norm_b)
+        return float(dot_product / norm_product)
 
     def test_embedding_quality(self) -> Dict[str, Any]:
         """Test the quality of embeddings with comprehensive financial text samples."""
@@ -234,41 +457,38 @@ class BedrockEmbeddings:
         }
 
         response_times = []
-        quality_scores = []
 
-        for text1, text2, expected_category in test_cases:
-            start_time = time.time()
+        # Embed every distinct text once in a single batch, then look pairs up
+        all_texts = list(dict.fromkeys(text for text1, text2, _ in test_cases for text in (text1, text2)))
+
+        start_time = time.time()
+        embeddings = dict(zip(all_texts, self.get_embeddings_batch(all_texts)))
+        end_time = time.time()
 
-            emb1 = self.get_embedding(text1)
-            emb2 = self.get_embedding(text2)
+        # Amortize the batched call evenly so timings reflect per-text cost
+        per_text_time = (end_time - start_time) * 1000 / len(all_texts)  # Convert to ms
 
-            end_time = time.time()
-            response_time = (end_time - start_time) * 1000  # Convert to ms
-            response_times.append(response_time)
+        similarities = []
+        for text1, text2, _ in test_cases:
+            emb1 = embeddings[text1]
+            emb2 = embeddings[text2]
+
+            response_times.append(per_text_time)
 
             if results["embedding_dimension"] is None:
                 results["embedding_dimension"] = len(emb1)
 
-            similarity = self.cosine_similarity(emb1, emb2)
-
-            # Calculate quality score based on expected category
-            if expected_category == "high" and similarity > 0.4:
-                quality_score = 1.0
-            elif expected_category == "medium" and 0.2 <= similarity <= 0.4:
-                quality_score = 1.0
-            elif expected_category == "low" and similarity < 0.2:
-                quality_score = 1.0
-            else:
-                # Partial credit based on how close we are to expected range
-                if expected_category == "high":
-                    quality_score = max(0, similarity / 0.4)
-                elif expected_category == "medium":
-                    quality_score = max(0, 1 - abs(similarity - 0.3) / 0.3)
-                else:  # low
-                    quality_score = max(0, (0.2 - similarity) / 0.2)
+            similarities.append(self.cosine_similarity(emb1, emb2))
 
-            quality_scores.append(quality_score)
+        # Score every pair in one vectorized pass
+        quality_scores = _quality_scores(
+            np.asarray(similarities, dtype=np.float64),
+            np.asarray([case[2] for case in test_cases])
+        ).tolist()
 
+        for (text1, text2, expected_category), similarity, quality_score, response_time in zip(
+            test_cases, similarities, quality_scores, response_times
+        ):
             results["similarities"].append({
                 "text1": text1,
                 "text2": text2,
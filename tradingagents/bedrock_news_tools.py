@@ -3,51 +3,21 @@ Bedrock-powered news and analysis functions.
 Enhanced with real data integration from Finnhub, Google News, and Reddit.
 """
 
+import asyncio
+from string import Template
+from concurrent.futures import ThreadPoolExecutor
 from tradingagents.llm_providers import get_configured_llms
 from tradingagents.default_config import DEFAULT_CONFIG
-from tradingagents.live_data_fetchers import live_finnhub, live_reddit
+from tradingagents.live_data_fetchers import get_live_finnhub, get_live_reddit
 from tradingagents.dataflows.interface import get_google_news
 from datetime import datetime, timedelta
 
 
-def get_stock_news_bedrock(ticker, curr_date):
-    """Enhanced Bedrock-powered stock news analysis with real data integration."""
-    # Use the configured Bedrock LLM (quick thinking model for news analysis)
-    quick_thinking_llm, _ = get_configured_llms(DEFAULT_CONFIG)
-    llm = quick_thinking_llm
-
-    # Gather real data from multiple sources
-    real_data = []
-
-    try:
-        # 1. Get Finnhub news data
-        end_date = curr_date
-        start_date = (datetime.strptime(curr_date, "%Y-%m-%d") - timedelta(days=7)).strftime("%Y-%m-%d")
-
-        finnhub_news = live_finnhub.get_company_news(ticker, start_date, end_date)
-        if finnhub_news and "Error" not in finnhub_news:
-            real_data.append(f"=== FINNHUB NEWS DATA ===\n{finnhub_news}")
-
-        # 2. Get Google News data
-        google_news = get_google_news(ticker, curr_date)
-        if google_news and "Error" not in google_news:
-            real_data.append(f"=== GOOGLE NEWS DATA ===\n{google_news}")
-
-        # 3. Get Reddit discussions
-        reddit_discussions = live_reddit.get_stock_discussions(ticker, days_back=7)
-        if reddit_discussions and "not available" not in reddit_discussions:
-            real_data.append(f"=== REDDIT DISCUSSIONS ===\n{reddit_discussions}")
-
-    except Exception as e:
-        real_data.append(f"Note: Some data sources unavailable: {str(e)}")
-
-    # Combine real data
-    data_section = "\n\n".join(real_data) if real_data else "No real-time data available."
-
-    prompt = f"""Analyze the following REAL market data for {ticker} around {curr_date} and provide comprehensive social media sentiment analysis.
+# Static prompt scaffolding; only the data section, ticker and date vary per call
+_STOCK_NEWS_TEMPLATE = Template("""Analyze the following REAL market data for $ticker around $curr_date and provide comprehensive social media sentiment analysis.
 
 === REAL MARKET DATA ===
-{data_section}
+$data_section
 
 === ANALYSIS INSTRUCTIONS ===
 Based on the actual data provided above, analyze:
@@ -72,55 +42,13 @@ Based on the actual data provided above, analyze:
    - Risk factors from social sentiment
    - Opportunities identified from discussions
 
-Provide a structured analysis with clear insights that can inform trading decisions. Focus on actionable intelligence rather than generic commentary."""
-
-    try:
-        response = llm.invoke(prompt)
-        return response.content
-    except Exception as e:
-        return f"Bedrock social media analysis unavailable: {str(e)}. Raw data available: {len(real_data)} sources"
-
-
-def get_global_news_bedrock(curr_date):
-    """Enhanced Bedrock-powered global news analysis with real data integration."""
-    # Use the configured Bedrock LLM (quick thinking model for global news analysis)
-    quick_thinking_llm, _ = get_configured_llms(DEFAULT_CONFIG)
-    llm = quick_thinking_llm
-
-    # Gather real market data
-    real_data = []
+Provide a structured analysis with clear insights that can inform trading decisions. Focus on actionable intelligence rather than generic commentary.""")
 
-    try:
-        # 1. Get market indicators data
-        market_indicators = live_finnhub.get_market_indicators()
-        if market_indicators and "Error" not in market_indicators:
-            real_data.append(f"=== MARKET INDICATORS ===\n{market_indicators}")
-
-        # 2. Get sector performance
-        sector_performance = live_finnhub.get_sector_performance()
-        if sector_performance and "Error" not in sector_performance:
-            real_data.append(f"=== SECTOR PERFORMANCE ===\n{sector_performance}")
-
-        # 3. Get global market sentiment from Reddit
-        market_sentiment = live_reddit.get_market_sentiment(days_back=7)
-        if market_sentiment and "not available" not in market_sentiment:
-            real_data.append(f"=== MARKET SENTIMENT ===\n{market_sentiment}")
-
-        # 4. Get general economic news from Google
-        economic_news = get_google_news("economy market federal reserve", curr_date)
-        if economic_news and "Error" not in economic_news:
-            real_data.append(f"=== ECONOMIC NEWS ===\n{economic_news}")
 
-    except Exception as e:
-        real_data.append(f"Note: Some data sources unavailable: {str(e)}")
-
-    # Combine real data
-    data_section = "\n\n".join(real_data) if real_data else "No real-time data available."
-
-    prompt = f"""Analyze the following REAL market data for {curr_date} and provide comprehensive global macroeconomic analysis.
+_GLOBAL_NEWS_TEMPLATE = Template("""Analyze the following REAL market data for $curr_date and provide comprehensive global macroeconomic analysis.
 
 === REAL MARKET DATA ===
-{data_section}
+$data_section
 
 === ANALYSIS INSTRUCTIONS ===
 Based on the actual market data provided above, analyze:
@@ -150,63 +78,13 @@ Based on the actual market data provided above, analyze:
    - Risk management considerations
    - Short-term vs long-term outlook
 
-Provide actionable insights for trading decisions based on the real market data. Focus on concrete analysis rather than generic commentary."""
-
-    try:
-        response = llm.invoke(prompt)
-        return response.content
-    except Exception as e:
-        return f"Bedrock global news analysis unavailable: {str(e)}. Raw data available: {len(real_data)} sources"
-
+Provide actionable insights for trading decisions based on the real market data. Focus on concrete analysis rather than generic commentary.""")
 
-def get_fundamentals_bedrock(ticker, curr_date):
-    """Enhanced Bedrock-powered fundamental analysis with real data integration."""
-    # Use the configured Bedrock LLM (deep thinking model for fundamental analysis)
-    _, deep_thinking_llm = get_configured_llms(DEFAULT_CONFIG)
-    llm = deep_thinking_llm
-
-    # Gather real fundamental data
-    real_data = []
 
-    try:
-        # 1. Get real-time stock quote
-        stock_quote = live_finnhub.get_real_time_quote(ticker)
-        if stock_quote and "Error" not in stock_quote:
-            real_data.append(f"=== CURRENT STOCK DATA ===\n{stock_quote}")
-
-        # 2. Get earnings data
-        earnings_data = live_finnhub.get_earnings_data(ticker)
-        if earnings_data and "Error" not in earnings_data:
-            real_data.append(f"=== EARNINGS DATA ===\n{earnings_data}")
-
-        # 3. Get analyst recommendations
-        analyst_recs = live_finnhub.get_analyst_recommendations(ticker)
-        if analyst_recs and "Error" not in analyst_recs:
-            real_data.append(f"=== ANALYST RECOMMENDATIONS ===\n{analyst_recs}")
-
-        # 4. Get insider transactions
-        end_date = curr_date
-        start_date = (datetime.strptime(curr_date, "%Y-%m-%d") - timedelta(days=90)).strftime("%Y-%m-%d")
-
-        insider_data = live_finnhub.get_insider_transactions(ticker, start_date, end_date)
-        if insider_data and "Error" not in insider_data:
-            real_data.append(f"=== INSIDER ACTIVITY ===\n{insider_data}")
-
-        # 5. Get company news for fundamental developments
-        company_news = live_finnhub.get_company_news(ticker, start_date, end_date)
-        if company_news and "Error" not in company_news:
-            real_data.append(f"=== COMPANY NEWS ===\n{company_news}")
-
-    except Exception as e:
-        real_data.append(f"Note: Some data sources unavailable: {str(e)}")
-
-    # Combine real data
-    data_section = "\n\n".join(real_data) if real_data else "No real-time data available."
-
-    prompt = f"""Analyze the following REAL fundamental data for {ticker} as of {curr_date} and provide comprehensive fundamental analysis.
+_FUNDAMENTALS_TEMPLATE = Template("""Analyze the following REAL fundamental data for $ticker as of $curr_date and provide comprehensive fundamental analysis.
 
 === REAL FUNDAMENTAL DATA ===
-{data_section}
+$data_section
 
 === ANALYSIS INSTRUCTIONS ===
 Based on the actual fundamental data provided above, analyze:
@@ -241,10 +119,198 @@ Based on the actual fundamental data provided above, analyze:
    - Risk management considerations
    - Time horizon and position sizing
 
-Provide actionable investment insights based on the real fundamental data. Focus on data-driven analysis and specific recommendations."""
+Provide actionable investment insights based on the real fundamental data. Focus on data-driven analysis and specific recommendations.""")
+
+
+async def _gather_sources(sources):
+    """
+    Fetch all data sources concurrently.
 
+    Args:
+        sources: List of (label, fetch_fn, unavailable_marker) tuples. fetch_fn is a
+            blocking callable and runs in a worker thread.
+
+    Returns:
+        List of formatted data sections, in the same order as sources
+    """
+    results = await asyncio.gather(
+        *(asyncio.to_thread(fetch) for _, fetch, _ in sources),
+        return_exceptions=True
+    )
+
+    real_data = []
+    for (label, _, unavailable_marker), result in zip(sources, results):
+        if isinstance(result, Exception):
+            real_data.append(f"Note: Some data sources unavailable: {str(result)}")
+        elif result and unavailable_marker not in result:
+            real_data.append(f"=== {label} ===\n{result}")
+    return real_data
+
+
+def _run_sync(coro):
+    """Run a coroutine to completion from synchronous code."""
     try:
-        response = llm.invoke(prompt)
-        return response.content
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    # Already inside an event loop (e.g. an async agent graph): use a separate thread
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
+def _chunk_text(chunk):
+    """Extract the text from a streamed message chunk (str or content-block list)."""
+    content = chunk.content
+    if isinstance(content, str):
+        return content
+    return "".join(
+        block.get("text", "") if isinstance(block, dict) else str(block)
+        for block in content
+    )
+
+
+class _StreamFailure(str):
+    """Error text a stream yields when the LLM call fails, in place of the rest of the analysis."""
+
+
+async def _collect_stream(stream):
+    """Join a streamed analysis; if it failed partway, return only the error text."""
+    chunks = []
+    async for chunk in stream:
+        if isinstance(chunk, _StreamFailure):
+            return str(chunk)
+        chunks.append(chunk)
+    return "".join(chunks)
+
+
+async def stream_stock_news_bedrock(ticker, curr_date):
+    """Enhanced Bedrock-powered stock news analysis with real data integration."""
+    # Use the configured Bedrock LLM (quick thinking model for news analysis)
+    quick_thinking_llm, _ = get_configured_llms(DEFAULT_CONFIG)
+    llm = quick_thinking_llm
+
+    # Gather real data from multiple sources concurrently
+    end_date = curr_date
+    start_date = (datetime.strptime(curr_date, "%Y-%m-%d") - timedelta(days=7)).strftime("%Y-%m-%d")
+
+    real_data = await _gather_sources([
+        # 1. Finnhub news data
+        ("FINNHUB NEWS DATA", lambda: get_live_finnhub().get_company_news(ticker, start_date, end_date), "Error"),
+        # 2. Google News data
+        ("GOOGLE NEWS DATA", lambda: get_google_news(ticker, curr_date), "Error"),
+        # 3. Reddit discussions
+        ("REDDIT DISCUSSIONS", lambda: get_live_reddit().get_stock_discussions(ticker, days_back=7), "not available"),
+    ])
+
+    # Combine real data
+    data_section = "\n\n".join(real_data) if real_data else "No real-time data available."
+
+    prompt = _STOCK_NEWS_TEMPLATE.substitute(data_section=data_section, ticker=ticker, curr_date=curr_date)
+
+    try:
+        async for chunk in llm.astream(prompt):
+            text = _chunk_text(chunk)
+            if text:
+                yield text
+    except Exception as e:
+        yield _StreamFailure(f"Bedrock social media analysis unavailable: {str(e)}. Raw data available: {len(real_data)} sources")
+
+
+async def get_stock_news_bedrock_async(ticker, curr_date):
+    """Collect the streamed stock news analysis into a single string."""
+    return await _collect_stream(stream_stock_news_bedrock(ticker, curr_date))
+
+
+def get_stock_news_bedrock(ticker, curr_date):
+    """Synchronous wrapper around get_stock_news_bedrock_async."""
+    return _run_sync(get_stock_news_bedrock_async(ticker, curr_date))
+
+
+async def stream_global_news_bedrock(curr_date):
+    """Enhanced Bedrock-powered global news analysis with real data integration."""
+    # Use the configured Bedrock LLM (quick thinking model for global news analysis)
+    quick_thinking_llm, _ = get_configured_llms(DEFAULT_CONFIG)
+    llm = quick_thinking_llm
+
+    # Gather real market data concurrently
+    real_data = await _gather_sources([
+        # 1. Market indicators data
+        ("MARKET INDICATORS", lambda: get_live_finnhub().get_market_indicators(), "Error"),
+        # 2. Sector performance
+        ("SECTOR PERFORMANCE", lambda: get_live_finnhub().get_sector_performance(), "Error"),
+        # 3. Global market sentiment from Reddit
+        ("MARKET SENTIMENT", lambda: get_live_reddit().get_market_sentiment(days_back=7), "not available"),
+        # 4. General economic news from Google
+        ("ECONOMIC NEWS", lambda: get_google_news("economy market federal reserve", curr_date), "Error"),
+    ])
+
+    # Combine real data
+    data_section = "\n\n".join(real_data) if real_data else "No real-time data available."
+
+    prompt = _GLOBAL_NEWS_TEMPLATE.substitute(data_section=data_section, curr_date=curr_date)
+
+    try:
+        async for chunk in llm.astream(prompt):
+            text = _chunk_text(chunk)
+            if text:
+                yield text
     except Exception as e:
-        return f"Bedrock fundamental analysis unavailable: {str(e)}. Raw data available: {len(real_data)} sources"
\ No newline at end of file
+        yield _StreamFailure(f"Bedrock global news analysis unavailable: {str(e)}. Raw data available: {len(real_data)} sources")
+
+
+async def get_global_news_bedrock_async(curr_date):
+    """Collect the streamed global news analysis into a single string."""
+    return await _collect_stream(stream_global_news_bedrock(curr_date))
+
+
+def get_global_news_bedrock(curr_date):
+    """Synchronous wrapper around get_global_news_bedrock_async."""
+    return _run_sync(get_global_news_bedrock_async(curr_date))
+
+
+async def stream_fundamentals_bedrock(ticker, curr_date):
+    """Enhanced Bedrock-powered fundamental analysis with real data integration."""
+    # Use the configured Bedrock LLM (deep thinking model for fundamental analysis)
+    _, deep_thinking_llm = get_configured_llms(DEFAULT_CONFIG)
+    llm = deep_thinking_llm
+
+    # Gather real fundamental data concurrently
+    end_date = curr_date
+    start_date = (datetime.strptime(curr_date, "%Y-%m-%d") - timedelta(days=90)).strftime("%Y-%m-%d")
+
+    real_data = await _gather_sources([
+        # 1. Real-time stock quote
+        ("CURRENT STOCK DATA", lambda: get_live_finnhub().get_real_time_quote(ticker), "Error"),
+        # 2. Earnings data
+        ("EARNINGS DATA", lambda: get_live_finnhub().get_earnings_data(ticker), "Error"),
+        # 3. Analyst recommendations
+        ("ANALYST RECOMMENDATIONS", lambda: get_live_finnhub().get_analyst_recommendations(ticker), "Error"),
+        # 4. Insider transactions
+        ("INSIDER ACTIVITY", lambda: get_live_finnhub().get_insider_transactions(ticker, start_date, end_date), "Error"),
+        # 5. Company news for fundamental developments
+        ("COMPANY NEWS", lambda: get_live_finnhub().get_company_news(ticker, start_date, end_date), "Error"),
+    ])
+
+    # Combine real data
+    data_section = "\n\n".join(real_data) if real_data else "No real-time data available."
+
+    prompt = _FUNDAMENTALS_TEMPLATE.substitute(data_section=data_section, ticker=ticker, curr_date=curr_date)
+
+    try:
+        async for chunk in llm.astream(prompt):
+            text = _chunk_text(chunk)
+            if text:
+                yield text
+    except Exception as e:
+        yield _StreamFailure(f"Bedrock fundamental analysis unavailable: {str(e)}. Raw data available: {len(real_data)} sources")
+
+
+async def get_fundamentals_bedrock_async(ticker, curr_date):
+    """Collect the streamed fundamental analysis into a single string."""
+    return await _collect_stream(stream_fundamentals_bedrock(ticker, curr_date))
+
+
+def get_fundamentals_bedrock(ticker, curr_date):
+    """Synchronous wrapper around get_fundamentals_bedrock_async."""
+    return _run_sync(get_fundamentals_bedrock_async(ticker, curr_date))
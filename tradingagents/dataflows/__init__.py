@@ -20,6 +20,7 @@ from .interface import (
     # Technical analysis functions
     get_stock_stats_indicators_window,
     get_stockstats_indicator,
+    get_stockstats_indicators,
     # Market data functions
     get_YFin_data_window,
     get_YFin_data,
@@ -40,6 +41,7 @@ __all__ = [
     # Technical analysis functions
     "get_stock_stats_indicators_window",
     "get_stockstats_indicator",
+    "get_stockstats_indicators",
     # Market data functions
     "get_YFin_data_window",
     "get_YFin_data",
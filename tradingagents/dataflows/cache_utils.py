@@ -9,11 +9,44 @@ for historical data.
 import os
 import time
 import json
-from datetime import datetime, timedelta
+import hashlib
+import logging
+import mmap
+import re
+import struct
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Any, Dict, List
+from typing import Optional, Any, Dict, List, Tuple
 from enum import Enum
 
+import pandas as pd
+
+try:
+    import pyarrow.feather as feather
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+    # pyarrow is optional - DataFrames are cached as CSV text without it
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+    # msgpack is optional - dict/list data is cached as JSON without it
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False
+    # fcntl is POSIX-only - index writes are then only serialized within a process
+
+logger = logging.getLogger(__name__)
+
 
 class DataType(Enum):
     """Data type classification for cache policies."""
@@ -23,6 +56,215 @@ class DataType(Enum):
     STATIC = "static"       # Long TTL caching (7 days)
 
 
+# Index record header: timestamp, ttl_minutes, data type id, file format id, key length.
+# The UTF-8 cache key follows each header.
+_INDEX_RECORD = struct.Struct("<dIBBH")
+_INDEX_FILENAME = "index.bin"
+_TOMBSTONE = 255  # data type id marking a removed entry
+
+# Only files named like create_cache_key output are ever swept, and only once they
+# are old enough that a writer cannot still be between writing and indexing them
+_CACHE_KEY_PATTERN = re.compile(r"[0-9a-f]{32}")
+_ORPHAN_GRACE_SECONDS = 300
+
+_DATA_TYPE_IDS = {
+    DataType.LIVE: 0,
+    DataType.INTRADAY: 1,
+    DataType.HISTORICAL: 2,
+    DataType.STATIC: 3,
+}
+_DATA_TYPES_BY_ID = {type_id: data_type for data_type, type_id in _DATA_TYPE_IDS.items()}
+
+_FORMAT_IDS = {"csv": 0, "json": 1, "cache": 2, "arrow": 3, "msgpack": 4, "parquet": 5}
+_FORMATS_BY_ID = {format_id: fmt for fmt, format_id in _FORMAT_IDS.items()}
+
+# US market time zone (DST-aware); falls back to fixed EST without tz data
+try:
+    from zoneinfo import ZoneInfo
+    _MARKET_TZ = ZoneInfo("America/New_York")
+except Exception:
+    _MARKET_TZ = timezone(timedelta(hours=-5))
+
+# (minute bucket, result) of the last trading hours check
+_trading_hours_cache: Tuple[int, bool] = (-1, False)
+
+
+@lru_cache(maxsize=4096)
+def _is_current_day(date_str: Optional[str], today_str: str) -> bool:
+    """Whether date_str (YYYY-MM-DD) is today; parsed once per unique date."""
+    if not date_str:
+        return False
+    try:
+        return datetime.strptime(date_str, "%Y-%m-%d").strftime("%Y-%m-%d") == today_str
+    except (ValueError, TypeError):
+        return False
+
+
+class CacheIndex:
+    """
+    Append-only binary index of cache entry metadata.
+
+    The index file is read through mmap into a dict of
+    key -> (timestamp, ttl_minutes, data_type_id, format_id), so validity checks
+    are a dict lookup instead of opening and parsing a metadata file per entry.
+    Updates append a record; removals append a tombstone. The file is compacted
+    when superseded records outnumber live ones. Writers hold a thread lock and,
+    where fcntl is available, an exclusive flock on a sibling lock file so
+    several processes can share one cache directory. Lookups stat the index
+    file and, when another process has appended to or compacted it, read the
+    new records before answering.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.entries: Dict[str, Tuple[float, int, int, int]] = {}
+        self._record_count = 0
+        # Bytes of the index file already read, and (inode, size, mtime) of the
+        # file as of that read
+        self._offset = 0
+        self._signature = None
+        self._lock = threading.RLock()
+        self._load()
+
+    def _file_signature(self) -> Optional[Tuple[int, int, int]]:
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return st.st_ino, st.st_size, st.st_mtime_ns
+
+    def _reset(self):
+        self.entries = {}
+        self._record_count = 0
+        self._offset = 0
+        self._signature = None
+
+    def _load(self):
+        """Read records appended since the last load, starting over if the file was replaced."""
+        try:
+            with open(self.path, 'rb') as f:
+                st = os.fstat(f.fileno())
+                size = st.st_size
+                # A different inode means compaction replaced the file
+                if self._signature is not None and (st.st_ino != self._signature[0] or size < self._offset):
+                    self._reset()
+                self._signature = (st.st_ino, size, st.st_mtime_ns)
+                if size <= self._offset:
+                    return
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+                    offset = self._offset
+                    while offset + _INDEX_RECORD.size <= size:
+                        timestamp, ttl, type_id, format_id, key_len = _INDEX_RECORD.unpack_from(buf, offset)
+                        offset += _INDEX_RECORD.size
+                        if offset + key_len > size:
+                            break  # Truncated tail from an interrupted write
+                        key = buf[offset:offset + key_len].decode('utf-8')
+                        offset += key_len
+
+                        self._record_count += 1
+                        if type_id == _TOMBSTONE:
+                            self.entries.pop(key, None)
+                        else:
+                            self.entries[key] = (timestamp, ttl, type_id, format_id)
+                        self._offset = offset
+        except FileNotFoundError:
+            # Index deleted (e.g. cache directory cleared): nothing is indexed
+            self._reset()
+        except (OSError, ValueError, UnicodeDecodeError) as e:
+            logger.warning("Cache index unreadable, starting empty: %s", e)
+            self._reset()
+
+    def refresh(self):
+        """Read records other processes wrote since this index was last read."""
+        if self._file_signature() != self._signature:
+            with self._exclusive():
+                self._catch_up()
+
+    def _catch_up(self):
+        """Load new records if the file changed; callers hold _exclusive."""
+        if self._file_signature() != self._signature:
+            self._load()
+
+    @staticmethod
+    def _pack(key: str, timestamp: float, ttl: int, type_id: int, format_id: int) -> bytes:
+        key_bytes = key.encode('utf-8')
+        return _INDEX_RECORD.pack(timestamp, ttl, type_id, format_id, len(key_bytes)) + key_bytes
+
+    @contextmanager
+    def _exclusive(self):
+        """Serialize index writers across threads and, with fcntl, across processes."""
+        with self._lock:
+            if not FCNTL_AVAILABLE:
+                yield
+                return
+            # Lock a separate file: compaction replaces the index file itself
+            with open(self.path.with_suffix('.lock'), 'a') as lock_file:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def _append(self, records: bytes, count: int):
+        """Append packed records; callers hold _exclusive and have caught up."""
+        with open(self.path, 'ab') as f:
+            f.write(records)
+            f.flush()
+            st = os.fstat(f.fileno())
+        self._record_count += count
+        self._offset = st.st_size
+        self._signature = (st.st_ino, st.st_size, st.st_mtime_ns)
+
+        if self._record_count > 2 * len(self.entries) + 64:
+            self._compact()
+
+    def get(self, key: str) -> Optional[Tuple[float, int, int, int]]:
+        """Return (timestamp, ttl_minutes, data_type_id, format_id) for a key."""
+        self.refresh()
+        return self.entries.get(key)
+
+    def put(self, key: str, timestamp: float, ttl: int, type_id: int, format_id: int):
+        """Record metadata for a cache entry."""
+        self.put_many([(key, (timestamp, ttl, type_id, format_id))])
+
+    def put_many(self, records: List[Tuple[str, Tuple[float, int, int, int]]]):
+        """Record metadata for several cache entries with a single append."""
+        with self._exclusive():
+            self._catch_up()
+            for key, record in records:
+                self.entries[key] = record
+            self._append(b"".join(self._pack(key, *record) for key, record in records), len(records))
+
+    def remove(self, key: str) -> bool:
+        """Remove a cache entry from the index."""
+        with self._exclusive():
+            self._catch_up()
+            if self.entries.pop(key, None) is None:
+                return False
+            self._append(self._pack(key, 0.0, 0, _TOMBSTONE, 0), 1)
+            return True
+
+    def compact(self):
+        """Rewrite the index with only live records."""
+        with self._exclusive():
+            self._compact()
+
+    def _compact(self):
+        # Re-read first so records appended by other processes are kept
+        self._reset()
+        self._load()
+
+        tmp_path = self.path.with_suffix('.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(b"".join(self._pack(key, *record) for key, record in self.entries.items()))
+            f.flush()
+            st = os.fstat(f.fileno())
+        os.replace(tmp_path, self.path)
+        self._record_count = len(self.entries)
+        self._offset = st.st_size
+        self._signature = (st.st_ino, st.st_size, st.st_mtime_ns)
+
+
 class SmartCache:
     """Smart caching system with TTL and data type classification."""
 
@@ -43,39 +285,95 @@ class SmartCache:
         self.ttl_static = config.get("cache_ttl_static", 10080)  # 7 days
 
         # Data source classifications
-        self.live_sources = set(config.get("live_data_sources", []))
-        self.intraday_sources = set(config.get("intraday_data_sources", []))
-        self.historical_sources = set(config.get("historical_data_sources", []))
+        self.live_sources = frozenset(config.get("live_data_sources", []))
+        self.intraday_sources = frozenset(config.get("intraday_data_sources", []))
+        self.historical_sources = frozenset(config.get("historical_data_sources", []))
+
+        # Lowercase-normalized copies so classification is case-insensitive set lookups
+        self._live_sources_lc = frozenset(s.lower() for s in self.live_sources)
+        self._intraday_sources_lc = frozenset(s.lower() for s in self.intraday_sources)
+        self._historical_sources_lc = frozenset(s.lower() for s in self.historical_sources)
+        self._current_day_marker = "current_day"
+
+        # Classification is pure given today's date, so memoize it per instance
+        self._classify_cached = lru_cache(maxsize=4096)(self._classify)
 
         # Behavior settings
         self.force_live_current_day = config.get("force_live_current_day", True)
         self.bypass_trading_hours = config.get("cache_bypass_trading_hours", True)
         self.max_age_check = config.get("cache_max_age_check", True)
 
-    def classify_data_type(self, data_source: str, date_str: str = None) -> DataType:
-        """Classify data type based on source and date."""
-        # CRITICAL: Always classify current-day data as LIVE (never cache)
-        if date_str:
+        # DataFrames are stored in a binary columnar format when pyarrow is available
+        frame_format = config.get("cache_frame_format", "arrow")
+        if frame_format not in ("arrow", "parquet") or not PYARROW_AVAILABLE:
+            frame_format = "csv"
+        self.frame_format = frame_format
+
+        # Entry metadata lives in a single binary index instead of per-entry sidecars
+        index_path = self.cache_dir / _INDEX_FILENAME
+        needs_migration = not index_path.exists()
+        self._index = CacheIndex(index_path)
+        if needs_migration:
+            self._migrate_metadata_sidecars()
+
+    def _migrate_metadata_sidecars(self):
+        """One-time import of legacy JSON .meta sidecar files into the binary index."""
+        records = []
+        for metadata_file in self.cache_dir.glob("*.meta"):
             try:
-                data_date = datetime.strptime(date_str, "%Y-%m-%d").date()
-                today = datetime.now().date()
-                if data_date == today:
-                    return DataType.LIVE
-            except (ValueError, TypeError):
+                with open(metadata_file, 'r', encoding='utf-8') as f:
+                    metadata = json.load(f)
+
+                timestamp = metadata['timestamp']
+                if not isinstance(timestamp, (int, float)):
+                    # Older sidecars stored an ISO string rather than epoch seconds
+                    timestamp = datetime.fromisoformat(timestamp).timestamp()
+                type_id = _DATA_TYPE_IDS[DataType(metadata['data_type'])]
+                format_id = _FORMAT_IDS[metadata['file_format']]
+                records.append((
+                    metadata_file.stem,
+                    (timestamp, int(metadata.get('ttl_minutes', 0)), type_id, format_id)
+                ))
+            except (OSError, KeyError, ValueError, json.JSONDecodeError):
                 pass
 
+            try:
+                metadata_file.unlink()
+            except OSError:
+                pass
+
+        # Creates the index file even when empty so migration only runs once
+        self._index.put_many(records)
+        if records:
+            print(f"💾 Migrated {len(records)} cache metadata files to {_INDEX_FILENAME}")
+
+    def classify_data_type(self, data_source: str, date_str: str = None,
+                           today_str: str = None) -> DataType:
+        """Classify data type based on source and date."""
+        if today_str is None:
+            today_str = datetime.now().strftime("%Y-%m-%d")
+        return self._classify_cached(data_source, date_str, today_str)
+
+    def _classify(self, data_source: str, date_str: Optional[str], today_str: str) -> DataType:
+        """Uncached classification; see classify_data_type."""
+        # CRITICAL: Always classify current-day data as LIVE (never cache)
+        if _is_current_day(date_str, today_str):
+            return DataType.LIVE
+
+        source = data_source.lower()
+
         # Check if it's explicitly a live data source
-        if data_source in self.live_sources:
+        if source in self._live_sources_lc:
             return DataType.LIVE
 
         # Current day data sources should always be live
-        if "current_day" in data_source.lower():
+        if self._current_day_marker in source:
             return DataType.LIVE
 
         # Check other classifications
-        if data_source in self.intraday_sources:
+        if source in self._intraday_sources_lc:
             return DataType.INTRADAY
-        elif data_source in self.historical_sources:
+        elif source in self._historical_sources_lc:
             return DataType.HISTORICAL
         else:
             # Default to static for unclassified sources
@@ -91,69 +389,53 @@ class SmartCache:
         }
         return ttl_map.get(data_type, 0)
 
-    def _get_cache_path(self, cache_key: str, data_format: str = "cache") -> Path:
+    def _get_cache_path(self, cache_key: str, data_format: str) -> Path:
         """Generate cache file path with appropriate extension."""
         return self.cache_dir / f"{cache_key}.{data_format}"
 
-    def _get_metadata_path(self, cache_key: str) -> Path:
-        """Generate cache metadata file path."""
-        return self.cache_dir / f"{cache_key}.meta"
+    def _entry_path(self, cache_key: str, record: Tuple[float, int, int, int]) -> Path:
+        """Path of the data file for an indexed entry, using its recorded format."""
+        return self._get_cache_path(cache_key, _FORMATS_BY_ID[record[3]])
 
     def _is_cache_valid(self, cache_key: str, ttl_minutes: int) -> bool:
         """Check if cache is valid based on TTL."""
-        metadata_path = self._get_metadata_path(cache_key)
+        record = self._index.get(cache_key)
 
         # Check if metadata exists
-        if not metadata_path.exists():
+        if record is None:
             return False
 
-        # Check if any cache file exists
-        cache_exists = False
-        for ext in ['csv', 'json', 'cache']:
-            if self._get_cache_path(cache_key, ext).exists():
-                cache_exists = True
-                break
-
-        if not cache_exists:
+        # A single stat gives both existence and the write time of the data file
+        try:
+            mtime = os.stat(self._entry_path(cache_key, record)).st_mtime
+        except OSError:
             return False
 
         if not self.max_age_check:
             return True
 
-        try:
-            with open(metadata_path, 'r', encoding='utf-8') as f:
-                metadata = json.load(f)
-
-            cache_time = datetime.fromisoformat(metadata['timestamp'])
-            age_minutes = (datetime.now() - cache_time).total_seconds() / 60
+        age_minutes = (time.time() - mtime) / 60
 
-            is_valid = age_minutes < ttl_minutes
-            if not is_valid:
-                print(f"🕐 Cache expired for {cache_key} (age: {age_minutes:.1f} min, TTL: {ttl_minutes} min)")
+        is_valid = age_minutes < ttl_minutes
+        if not is_valid:
+            print(f"🕐 Cache expired for {cache_key} (age: {age_minutes:.1f} min, TTL: {ttl_minutes} min)")
 
-            return is_valid
-        except (FileNotFoundError, KeyError, ValueError, json.JSONDecodeError) as e:
-            print(f"⚠️ Cache validation failed for {cache_key}: {e}")
-            return False
+        return is_valid
 
     def should_use_cache(self, data_source: str, date_str: str = None, cache_key: str = None) -> bool:
         """Determine if cache should be used for this request."""
         if not self.enabled or self.policy == "disabled":
             return False
 
+        today_str = datetime.now().strftime("%Y-%m-%d")
+
         # CRITICAL: Never cache current-day or time-sensitive data
-        if date_str:
-            try:
-                data_date = datetime.strptime(date_str, "%Y-%m-%d").date()
-                today = datetime.now().date()
-                if data_date == today:
-                    print(f"🔴 Current-day data detected - forcing live fetch for {data_source}")
-                    return False
-            except (ValueError, TypeError):
-                pass
+        if _is_current_day(date_str, today_str):
+            print(f"🔴 Current-day data detected - forcing live fetch for {data_source}")
+            return False
 
         # Never cache live data
-        data_type = self.classify_data_type(data_source, date_str)
+        data_type = self.classify_data_type(data_source, date_str, today_str)
         if data_type == DataType.LIVE:
             print(f"🔴 Live data type detected - forcing live fetch for {data_source}")
             return False
@@ -173,24 +455,42 @@ class SmartCache:
 
     def get_cached_data(self, cache_key: str) -> Optional[Any]:
         """Retrieve data from cache if valid."""
-        # Try different file formats
-        for ext, is_text in [('csv', True), ('json', True), ('cache', False)]:
-            cache_path = self._get_cache_path(cache_key, ext)
-            if cache_path.exists():
-                try:
-                    if is_text:
-                        with open(cache_path, 'r', encoding='utf-8') as f:
-                            if ext == 'json':
-                                return json.load(f)
-                            else:  # CSV
-                                return f.read()
-                    else:
-                        with open(cache_path, 'rb') as f:
-                            return f.read()
-                except (FileNotFoundError, json.JSONDecodeError, UnicodeDecodeError) as e:
-                    print(f"⚠️ Failed to load cached data from {cache_path}: {e}")
-                    continue
-        return None
+        record = self._index.get(cache_key)
+        if record is None:
+            return None
+
+        # Open the single file in the recorded format
+        cache_path = self._entry_path(cache_key, record)
+        data_format = cache_path.suffix[1:]
+        try:
+            if data_format == 'arrow':
+                # Memory-mapped Arrow IPC read; numeric and timestamp columns need no parsing
+                return feather.read_table(cache_path, memory_map=True).to_pandas()
+            if data_format == 'parquet':
+                return pd.read_parquet(cache_path, engine='pyarrow')
+            if data_format == 'msgpack':
+                with open(cache_path, 'rb') as f:
+                    return msgpack.unpackb(f.read(), raw=False, strict_map_key=False)
+            if data_format == 'cache':
+                with open(cache_path, 'rb') as f:
+                    return f.read()
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                if data_format == 'json':
+                    return json.load(f)
+                else:  # CSV
+                    return f.read()
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"⚠️ Failed to load cached data from {cache_path}: {e}")
+            return None
+
+    def get_cached_path(self, cache_key: str) -> Optional[Path]:
+        """Return the data file path for a cached entry, for callers that read it directly."""
+        record = self._index.get(cache_key)
+        if record is None:
+            return None
+        return self._entry_path(cache_key, record)
 
     def set_cached_data(self, cache_key: str, data: Any, data_source: str, date_str: str = None) -> bool:
         """Store data in cache with metadata."""
@@ -205,110 +505,145 @@ class SmartCache:
             return False
 
         try:
-            # Determine file format and store data
-            if isinstance(data, (dict, list)):
-                cache_path = self._get_cache_path(cache_key, "json")
-                with open(cache_path, 'w', encoding='utf-8') as f:
-                    json.dump(data, f, indent=2)
+            # Determine file format
+            if isinstance(data, pd.DataFrame):
+                data_format = self.frame_format
+            elif isinstance(data, (dict, list)):
+                data_format = "msgpack" if MSGPACK_AVAILABLE else "json"
             elif isinstance(data, str):
                 # Assume CSV format for string data
-                cache_path = self._get_cache_path(cache_key, "csv")
-                with open(cache_path, 'w', encoding='utf-8') as f:
-                    f.write(data)
+                data_format = "csv"
             else:
                 # Binary data
-                cache_path = self._get_cache_path(cache_key, "cache")
-                with open(cache_path, 'wb') as f:
-                    f.write(data)
+                data_format = "cache"
+
+            # Write to a temporary file and rename it into place, so concurrent
+            # readers never see a partially written data file
+            cache_path = self._get_cache_path(cache_key, data_format)
+            tmp_path = cache_path.with_name(
+                f"{cache_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+            )
+            try:
+                self._write_data(tmp_path, data, data_format)
+                os.replace(tmp_path, cache_path)
+            except BaseException:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+                raise
 
             # Store metadata
-            metadata_path = self._get_metadata_path(cache_key)
-            metadata = {
-                'timestamp': datetime.now().isoformat(),
-                'data_type': data_type.value,
-                'data_source': data_source,
-                'date_str': date_str,
-                'ttl_minutes': self.get_ttl_minutes(data_type),
-                'file_format': cache_path.suffix[1:]  # Remove the dot
-            }
-
-            with open(metadata_path, 'w', encoding='utf-8') as f:
-                json.dump(metadata, f, indent=2)
+            self._index.put(
+                cache_key,
+                time.time(),
+                self.get_ttl_minutes(data_type),
+                _DATA_TYPE_IDS[data_type],
+                _FORMAT_IDS[cache_path.suffix[1:]]  # Remove the dot
+            )
 
             print(f"💾 Cached {data_type.value} data: {cache_key} ({cache_path.suffix})")
             return True
 
-        except (OSError, TypeError) as e:
+        except (OSError, TypeError, ValueError) as e:
             print(f"⚠️ Failed to cache data for {cache_key}: {e}")
             return False
 
+    @staticmethod
+    def _write_data(path: Path, data: Any, data_format: str):
+        """Serialize data to path in the given cache format."""
+        # Frames keep a meaningful index (e.g. a DatetimeIndex); a RangeIndex is not stored
+        if data_format == "arrow":
+            feather.write_feather(data, path, compression='uncompressed')
+        elif data_format == "parquet":
+            data.to_parquet(path, engine='pyarrow', compression='snappy', index=None)
+        elif data_format == "msgpack":
+            # Binary encoding: no text parsing or per-key string building on reload
+            with open(path, 'wb') as f:
+                f.write(msgpack.packb(data, use_bin_type=True))
+        elif data_format == "json":
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, separators=(',', ':'), ensure_ascii=False)
+        elif data_format == "csv" and isinstance(data, pd.DataFrame):
+            data.to_csv(path, index=not isinstance(data.index, pd.RangeIndex))
+        elif data_format == "csv":
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(data)
+        else:
+            with open(path, 'wb') as f:
+                f.write(data)
+
     def invalidate_cache(self, cache_key: str) -> bool:
         """Invalidate specific cache entry."""
-        metadata_path = self._get_metadata_path(cache_key)
+        record = self._index.get(cache_key)
+        if record is None:
+            return False
 
-        removed = False
-        # Remove all possible cache file formats
-        for ext in ['csv', 'json', 'cache']:
-            cache_path = self._get_cache_path(cache_key, ext)
-            if cache_path.exists():
-                try:
-                    cache_path.unlink()
-                    removed = True
-                except OSError:
-                    pass
+        try:
+            self._entry_path(cache_key, record).unlink()
+        except OSError:
+            pass
 
         # Remove metadata
-        if metadata_path.exists():
-            try:
-                metadata_path.unlink()
-                removed = True
-            except OSError:
-                pass
-
-        return removed
+        return self._index.remove(cache_key)
+
+    def _scan(self) -> Dict[str, List[Tuple[str, str, int]]]:
+        """
+        List cache data files in one directory pass.
+
+        Returns:
+            Dict of cache key -> [(format, path, size_bytes)], sizes taken from the
+            DirEntry stat so no per-file stat calls are needed.
+        """
+        files: Dict[str, List[Tuple[str, str, int]]] = {}
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                stem, dot, data_format = entry.name.rpartition('.')
+                if not dot or data_format not in _FORMAT_IDS:
+                    continue
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                files.setdefault(stem, []).append(
+                    (data_format, entry.path, entry.stat(follow_symlinks=False).st_size)
+                )
+        return files
 
     def clean_expired_cache(self) -> int:
         """Clean all expired cache entries. Returns number of entries removed."""
         removed_count = 0
-
-        for metadata_file in self.cache_dir.glob("*.meta"):
-            cache_key = metadata_file.stem
-
-            try:
-                with open(metadata_file, 'r', encoding='utf-8') as f:
-                    metadata = json.load(f)
-
-                # Check if cache is expired
-                cache_time = datetime.fromisoformat(metadata['timestamp'])
-                ttl_minutes = metadata.get('ttl_minutes', 0)
-                age_minutes = (datetime.now() - cache_time).total_seconds() / 60
-
-                if age_minutes >= ttl_minutes:
-                    # Remove expired cache (all possible formats)
-                    for ext in ['csv', 'json', 'cache']:
-                        cache_path = self._get_cache_path(cache_key, ext)
-                        if cache_path.exists():
-                            cache_path.unlink()
-
-                    # Remove metadata
-                    metadata_file.unlink()
-                    removed_count += 1
-
-            except (json.JSONDecodeError, KeyError, ValueError, OSError):
-                # Remove corrupted cache files
-                for ext in ['csv', 'json', 'cache']:
-                    cache_path = self._get_cache_path(cache_key, ext)
-                    if cache_path.exists():
-                        try:
-                            cache_path.unlink()
-                        except OSError:
-                            pass
-
-                # Remove corrupted metadata
-                if metadata_file.exists():
+        now = time.time()
+        files = self._scan()
+
+        self._index.refresh()
+        for cache_key, record in list(self._index.entries.items()):
+            timestamp, ttl_minutes = record[0], record[1]
+            # Check if cache is expired
+            age_minutes = (now - timestamp) / 60
+
+            if age_minutes >= ttl_minutes:
+                # Remove metadata; the data file is swept below as unindexed
+                self._index.remove(cache_key)
+                removed_count += 1
+
+        # Remove data files without a live index entry: expired entries, plus files
+        # left behind by a format change or an interrupted write
+        for cache_key, key_files in files.items():
+            if not _CACHE_KEY_PATTERN.fullmatch(cache_key):
+                continue  # Not a cache file; the directory may be shared
+            # Re-check under the index lock so entries other processes added
+            # since the scan are not swept
+            with self._index._exclusive():
+                self._index._catch_up()
+                record = self._index.entries.get(cache_key)
+                live_format = _FORMATS_BY_ID[record[3]] if record is not None else None
+                for data_format, path, _ in key_files:
+                    if data_format == live_format:
+                        continue
                     try:
-                        metadata_file.unlink()
-                        removed_count += 1
+                        # Writers index a file only after renaming it into place
+                        if now - os.stat(path).st_mtime < _ORPHAN_GRACE_SECONDS:
+                            continue
+                        os.unlink(path)
                     except OSError:
                         pass
 
@@ -323,58 +658,56 @@ class SmartCache:
             'cache_size_mb': 0
         }
 
-        total_size = 0
-        for metadata_file in self.cache_dir.glob("*.meta"):
-            cache_key = metadata_file.stem
-
-            # Calculate size from all possible cache file formats
-            for ext in ['csv', 'json', 'cache']:
-                cache_path = self._get_cache_path(cache_key, ext)
-                if cache_path.exists():
-                    total_size += cache_path.stat().st_size
-
-            total_size += metadata_file.stat().st_size
-
-            try:
-                with open(metadata_file, 'r', encoding='utf-8') as f:
-                    metadata = json.load(f)
-
-                stats['total_entries'] += 1
-                data_type = metadata.get('data_type', 'unknown')
-                if data_type in stats['by_type']:
-                    stats['by_type'][data_type] += 1
+        now = time.time()
+        self._index.refresh()
+        for timestamp, ttl_minutes, type_id, _ in list(self._index.entries.values()):
+            stats['total_entries'] += 1
+            data_type = _DATA_TYPES_BY_ID.get(type_id)
+            if data_type is not None:
+                stats['by_type'][data_type.value] += 1
 
-                # Check if expired
-                cache_time = datetime.fromisoformat(metadata['timestamp'])
-                ttl_minutes = metadata.get('ttl_minutes', 0)
-                age_minutes = (datetime.now() - cache_time).total_seconds() / 60
+            # Check if expired
+            age_minutes = (now - timestamp) / 60
 
-                if age_minutes >= ttl_minutes:
-                    stats['expired_entries'] += 1
+            if age_minutes >= ttl_minutes:
+                stats['expired_entries'] += 1
 
-            except (json.JSONDecodeError, KeyError, ValueError):
-                pass
+        # One directory pass for data file sizes, plus the index itself
+        total_size = sum(
+            size for key_files in self._scan().values() for _, _, size in key_files
+        )
+        try:
+            total_size += os.stat(self._index.path).st_size
+        except OSError:
+            pass
 
         stats['cache_size_mb'] = round(total_size / (1024 * 1024), 2)
         return stats
 
     def _is_trading_hours(self) -> bool:
-        """Check if current time is during trading hours (9:30 AM - 4:00 PM EST)."""
-        try:
-            from datetime import timezone, timedelta
+        """Check if current time is during trading hours (9:30 AM - 4:00 PM ET)."""
+        global _trading_hours_cache
 
-            # Convert to EST
-            est = timezone(timedelta(hours=-5))  # Simplified - doesn't handle DST
-            now_est = datetime.now(est)
+        # The answer only changes on minute boundaries
+        minute_bucket = int(time.time() // 60)
+        if _trading_hours_cache[0] == minute_bucket:
+            return _trading_hours_cache[1]
+
+        result = self._compute_trading_hours()
+        _trading_hours_cache = (minute_bucket, result)
+        return result
+
+    @staticmethod
+    def _compute_trading_hours() -> bool:
+        """Uncached trading hours check; see _is_trading_hours."""
+        try:
+            now_et = datetime.now(_MARKET_TZ)
 
             # Check if weekday and within trading hours
-            if now_est.weekday() >= 5:  # Saturday = 5, Sunday = 6
+            if now_et.weekday() >= 5:  # Saturday = 5, Sunday = 6
                 return False
 
-            trading_start = now_est.replace(hour=9, minute=30, second=0, microsecond=0)
-            trading_end = now_est.replace(hour=16, minute=0, second=0, microsecond=0)
-
-            return trading_start <= now_est <= trading_end
+            return (9, 30) <= (now_et.hour, now_et.minute) < (16, 0)
         except:
             # If timezone calculation fails, assume it's trading hours to be safe
             return True
@@ -382,7 +715,13 @@ class SmartCache:
 
 def create_cache_key(data_source: str, symbol: str = None, start_date: str = None,
                      end_date: str = None, **kwargs) -> str:
-    """Create a standardized cache key."""
+    """
+    Create a standardized cache key.
+
+    The canonical "source_symbol_start_end_key:value" string is hashed to a
+    fixed-length 32 character BLAKE2b hex digest, which keeps file names short
+    and filesystem-safe regardless of parameters.
+    """
     parts = [data_source]
 
     if symbol:
@@ -397,17 +736,39 @@ def create_cache_key(data_source: str, symbol: str = None, start_date: str = Non
         if value is not None:
             parts.append(f"{key}:{value}")
 
-    return "_".join(parts)
+    canonical = "_".join(parts)
+    return hashlib.blake2b(canonical.encode('utf-8'), digest_size=16).hexdigest()
 
 
 # Global cache instance
 _smart_cache = None
+_smart_cache_lock = threading.Lock()
 
 def get_smart_cache():
     """Get global smart cache instance."""
     global _smart_cache
     if _smart_cache is None:
-        from ..default_config import DEFAULT_CONFIG
-        config = DEFAULT_CONFIG
-        _smart_cache = SmartCache(config)
-    return _smart_cache
\ No newline at end of file
+        with _smart_cache_lock:
+            # Re-check: another thread (e.g. the pre-warm thread) may have built it
+            if _smart_cache is None:
+                from ..default_config import DEFAULT_CONFIG
+                config = DEFAULT_CONFIG
+                _smart_cache = SmartCache(config)
+    return _smart_cache
+
+
+def _prewarm_smart_cache():
+    """Build the global cache and prime the trading hours check off the caller's path."""
+    try:
+        get_smart_cache()._is_trading_hours()
+    except Exception as e:
+        print(f"⚠️ Smart cache pre-warm failed: {e}")
+
+
+def _start_prewarm():
+    from ..default_config import DEFAULT_CONFIG
+    if DEFAULT_CONFIG.get("eager_cache_init", False):
+        threading.Thread(target=_prewarm_smart_cache, name="smart-cache-prewarm", daemon=True).start()
+
+
+_start_prewarm()
\ No newline at end of file
@@ -602,6 +602,35 @@ def get_stockstats_indicator(
     return str(indicator_value)
 
 
+def get_stockstats_indicators(
+    symbol: Annotated[str, "ticker symbol of the company"],
+    indicators: Annotated[list, "technical indicators to get the values of"],
+    curr_date: Annotated[
+        str, "The current trading date you are trading on, YYYY-mm-dd"
+    ],
+    online: Annotated[bool, "to fetch data online or offline"],
+) -> dict:
+
+    curr_date = datetime.strptime(curr_date, "%Y-%m-%d")
+    curr_date = curr_date.strftime("%Y-%m-%d")
+
+    try:
+        indicator_values = StockstatsUtils.get_stock_stats_batch(
+            symbol,
+            indicators,
+            curr_date,
+            os.path.join(DATA_DIR, "market_data", "price_data"),
+            online=online,
+        )
+    except Exception as e:
+        print(
+            f"Error getting stockstats indicator data for indicators {indicators} on {curr_date}: {e}"
+        )
+        return {indicator: "" for indicator in indicators}
+
+    return {indicator: str(value) for indicator, value in indicator_values.items()}
+
+
 def get_YFin_data_window(
     symbol: Annotated[str, "ticker symbol of the company"],
     curr_date: Annotated[str, "Start date in yyyy-mm-dd format"],
@@ -1,8 +1,9 @@
 import pandas as pd
-import yfinance as yf
-from stockstats import wrap
-from typing import Annotated
+from typing import Annotated, Any, Dict, List
 import os
+import time
+import threading
+from collections import OrderedDict
 from ..default_config import DEFAULT_CONFIG
 
 def get_config():
@@ -10,8 +11,252 @@ def get_config():
     return DEFAULT_CONFIG.copy()
 from .cache_utils import get_smart_cache, create_cache_key
 
+# Process-wide LRU of wrapped stockstats DataFrames, keyed by
+# (symbol, data_dir, online, start_date, end_date). Indicator columns computed
+# by stockstats accumulate on the shared frame, so later lookups are reuses.
+DF_CACHE_SIZE = 32
+_df_cache = OrderedDict()
+_df_cache_lock = threading.Lock()
+# Serializes stockstats column computation, which mutates the shared frames
+_indicator_lock = threading.Lock()
+
+# Dates known to have no price row, keyed by (symbol, data_dir, online). A
+# symbol's entry is dropped whenever its frame is reloaded. Guarded by _df_cache_lock.
+_non_trading_days = {}
+
+NOT_TRADING_DAY = "N/A: Not a trading day (weekend or holiday)"
+
+# Short-lived yfinance download results keyed by (symbol, start, end). Coalesces
+# repeated and concurrent downloads, notably current-day requests that bypass
+# the frame LRU above.
+YF_COALESCE_TTL = 60  # seconds
+_yf_downloads = {}
+_yf_key_locks = {}
+_yf_lock = threading.Lock()
+
+
+def _download_history(symbol, start_date_str, end_date_str):
+    """yf.download with per-(symbol, range) coalescing of recent and in-flight calls."""
+    import yfinance as yf  # Deferred: heavy import only needed for online mode
+
+    key = (symbol, start_date_str, end_date_str)
+
+    def recent():
+        hit = _yf_downloads.get(key)
+        if hit is not None and time.time() - hit[0] < YF_COALESCE_TTL:
+            return hit[1]
+        return None
+
+    with _yf_lock:
+        data = recent()
+        if data is not None:
+            return data.copy()
+        key_lock = _yf_key_locks.setdefault(key, threading.Lock())
+
+    # Only one thread downloads a given range; the others wait and reuse its result
+    with key_lock:
+        with _yf_lock:
+            data = recent()
+        if data is None:
+            data = yf.download(
+                symbol,
+                start=start_date_str,
+                end=end_date_str,
+                multi_level_index=False,
+                progress=False,
+                auto_adjust=True,
+            )
+            data = data.reset_index()
+
+            with _yf_lock:
+                now = time.time()
+                for stale_key in [k for k, (ts, _) in _yf_downloads.items() if now - ts >= YF_COALESCE_TTL]:
+                    del _yf_downloads[stale_key]
+                    _yf_key_locks.pop(stale_key, None)
+                _yf_downloads[key] = (now, data)
+
+    return data.copy()
+
+
+class _WrappedFrame:
+    """A wrapped stockstats DataFrame plus lookup tables built once per load."""
+
+    __slots__ = ("df", "row_by_date", "columns")
+
+    def __init__(self, df):
+        self.df = df
+        # First row position for each YYYY-mm-dd date
+        self.row_by_date = {}
+        for position, date in enumerate(df["Date"].astype(str)):
+            self.row_by_date.setdefault(date[:10], position)
+        self.columns = {}
+
+    def column(self, indicator):
+        """Resolve the column holding an indicator's values (case-insensitive)."""
+        key = indicator.lower()
+        if key not in self.columns:
+            # Indicator columns are added lazily by stockstats; refresh the map
+            self.columns = {col.lower(): col for col in self.df.columns}
+        return self.columns.get(key, indicator)
+
 
 class StockstatsUtils:
+    @staticmethod
+    def _cached_df(key, loader):
+        """Return the wrapped frame for key, loading and caching it on a miss."""
+        with _df_cache_lock:
+            frame = _df_cache.get(key)
+            if frame is not None:
+                _df_cache.move_to_end(key)
+                return frame
+
+        df = loader()
+        if df is None:
+            return None
+
+        frame = _WrappedFrame(df)
+        with _df_cache_lock:
+            # Fresh data may include dates previously recorded as missing
+            _non_trading_days.pop(key[:3], None)
+            _df_cache[key] = frame
+            if len(_df_cache) > DF_CACHE_SIZE:
+                _df_cache.popitem(last=False)
+        return frame
+
+    @staticmethod
+    def _load_offline_df(symbol, data_dir):
+        from stockstats import wrap
+
+        try:
+            data = pd.read_csv(
+                os.path.join(
+                    data_dir,
+                    f"{symbol}-YFin-data-2015-01-01-2025-03-25.csv",
+                )
+            )
+            return wrap(data)
+        except FileNotFoundError:
+            raise Exception("Stockstats fail: Yahoo Finance data not fetched yet!")
+
+    @staticmethod
+    def _load_online_df(symbol, start_date_str, end_date_str, curr_date_str, is_current_day):
+        """Fetch price history (through the smart cache for historical data) and wrap it."""
+        from stockstats import wrap
+
+        data_source = "stock_price_current_day" if is_current_day else "stock_price_historical"
+
+        # Create cache key for this request; the price history is shared by all indicators
+        cache_key = create_cache_key(
+            data_source=data_source,
+            symbol=symbol,
+            start_date=start_date_str,
+            end_date=end_date_str
+        )
+
+        # Initialize smart cache
+        smart_cache = get_smart_cache()
+
+        # Check if we should use cache and if cache is valid
+        use_cache = False
+        if not is_current_day:  # Only consider caching for historical data
+            use_cache = smart_cache.should_use_cache(
+                data_source=data_source,
+                date_str=curr_date_str,
+                cache_key=cache_key
+            )
+
+        data = None
+        if use_cache:
+            # Try to get cached data
+            cached_path = smart_cache.get_cached_path(cache_key)
+            if cached_path is not None:
+                try:
+                    if cached_path.suffix == ".csv":
+                        # CSV (no pyarrow, or older caches): let pandas parse the file directly
+                        cached_data = pd.read_csv(cached_path, parse_dates=["Date"])
+                    else:
+                        # Arrow/Parquet-backed DataFrame
+                        cached_data = smart_cache.get_cached_data(cache_key)
+
+                    if isinstance(cached_data, pd.DataFrame):
+                        data = cached_data
+                        print(f"🔄 Using cached historical data for {symbol}")
+                    elif cached_data is not None:
+                        print(f"⚠️ Unexpected cache data type: {type(cached_data)}")
+                        data = None
+                except Exception as e:
+                    print(f"⚠️ Failed to load cached data: {e}")
+                    data = None
+
+        # Fetch fresh data if no valid cache
+        if data is None:
+            data_type = "LIVE" if is_current_day else "historical"
+            print(f"🔴 Fetching {data_type} data for {symbol} ({data_source})")
+
+            data = _download_history(symbol, start_date_str, end_date_str)
+
+            # Only cache historical data (never current-day)
+            if not is_current_day:
+                try:
+                    # Store the DataFrame directly (Arrow IPC when pyarrow is installed)
+                    success = smart_cache.set_cached_data(
+                        cache_key=cache_key,
+                        data=data,
+                        data_source=data_source,
+                        date_str=curr_date_str
+                    )
+                    if not success:
+                        print(f"⚠️ Cache storage was rejected for {symbol}")
+                except Exception as e:
+                    print(f"⚠️ Failed to cache data: {e}")
+            else:
+                print(f"🔴 Current-day data for {symbol} - NOT caching (time-sensitive)")
+
+        if data is not None and not data.empty:
+            df = wrap(data)
+            df["Date"] = df["Date"].dt.strftime("%Y-%m-%d")
+            return df
+
+        print(f"⚠️ No data retrieved for {symbol}")
+        return None
+
+    @staticmethod
+    def _get_wrapped_df(symbol, curr_date, data_dir, online):
+        """Load the wrapped stockstats frame for a symbol, reusing it across indicators."""
+        if not online:
+            return StockstatsUtils._cached_df(
+                (symbol, data_dir, False, None, None),
+                lambda: StockstatsUtils._load_offline_df(symbol, data_dir),
+            )
+
+        # Online data fetching with smart caching
+        today_date = pd.Timestamp.today()
+        curr_date_dt = pd.to_datetime(curr_date)
+
+        end_date = today_date
+        start_date = today_date - pd.DateOffset(years=15)
+        start_date_str = start_date.strftime("%Y-%m-%d")
+        end_date_str = end_date.strftime("%Y-%m-%d")
+        curr_date_str = curr_date_dt.strftime("%Y-%m-%d")
+
+        # CRITICAL: Determine if this is time-sensitive data
+        is_current_day = curr_date_dt.date() == today_date.date()
+
+        # Never cache current-day data - always fetch live
+        if is_current_day:
+            print(f"🔴 Current-day data requested for {symbol} - bypassing cache entirely")
+            df = StockstatsUtils._load_online_df(
+                symbol, start_date_str, end_date_str, curr_date_str, True
+            )
+            return _WrappedFrame(df) if df is not None else None
+
+        return StockstatsUtils._cached_df(
+            (symbol, data_dir, True, start_date_str, end_date_str),
+            lambda: StockstatsUtils._load_online_df(
+                symbol, start_date_str, end_date_str, curr_date_str, False
+            ),
+        )
+
     @staticmethod
     def get_stock_stats(
         symbol: Annotated[str, "ticker symbol for the company"],
@@ -30,143 +275,68 @@ class StockstatsUtils:
             "whether to use online tools to fetch data or offline tools. If True, will use online tools.",
         ] = False,
     ):
-        df = None
-        data = None
+        return StockstatsUtils.get_stock_stats_batch(
+            symbol, [indicator], curr_date, data_dir, online
+        )[indicator]
 
-        if not online:
-            try:
-                data = pd.read_csv(
-                    os.path.join(
-                        data_dir,
-                        f"{symbol}-YFin-data-2015-01-01-2025-03-25.csv",
-                    )
-                )
-                df = wrap(data)
-            except FileNotFoundError:
-                raise Exception("Stockstats fail: Yahoo Finance data not fetched yet!")
-        else:
-            # Online data fetching with smart caching
-            today_date = pd.Timestamp.today()
-            curr_date_dt = pd.to_datetime(curr_date)
-
-            end_date = today_date
-            start_date = today_date - pd.DateOffset(years=15)
-            start_date_str = start_date.strftime("%Y-%m-%d")
-            end_date_str = end_date.strftime("%Y-%m-%d")
-            curr_date_str = curr_date_dt.strftime("%Y-%m-%d")
-
-            # CRITICAL: Determine if this is time-sensitive data
-            is_current_day = curr_date_dt.date() == today_date.date()
-            data_source = "stock_price_current_day" if is_current_day else "stock_price_historical"
-
-            # Never cache current-day data - always fetch live
-            if is_current_day:
-                print(f"🔴 Current-day data requested for {symbol} - bypassing cache entirely")
-
-            # Create cache key for this request
-            cache_key = create_cache_key(
-                data_source=data_source,
-                symbol=symbol,
-                start_date=start_date_str,
-                end_date=end_date_str,
-                indicator=indicator
-            )
+    @staticmethod
+    def get_stock_stats_batch(
+        symbol: Annotated[str, "ticker symbol for the company"],
+        indicators: Annotated[
+            List[str], "quantitative indicators based off of the stock data for the company"
+        ],
+        curr_date: Annotated[
+            str, "curr date for retrieving stock price data, YYYY-mm-dd"
+        ],
+        data_dir: Annotated[
+            str,
+            "directory where the stock data is stored.",
+        ],
+        online: Annotated[
+            bool,
+            "whether to use online tools to fetch data or offline tools. If True, will use online tools.",
+        ] = False,
+    ) -> Dict[str, Any]:
+        """Compute several indicators for one symbol and date from a single wrapped frame."""
+        date_key = curr_date[:10]
+        symbol_key = (symbol, data_dir, online)
+        with _df_cache_lock:
+            if date_key in _non_trading_days.get(symbol_key, ()):
+                return {indicator: NOT_TRADING_DAY for indicator in indicators}
 
-            # Initialize smart cache
-            smart_cache = get_smart_cache()
+        frame = StockstatsUtils._get_wrapped_df(symbol, curr_date, data_dir, online)
+        if frame is None:
+            return {indicator: "N/A: No data available" for indicator in indicators}
 
-            # Check if we should use cache and if cache is valid
-            use_cache = False
-            if not is_current_day:  # Only consider caching for historical data
-                use_cache = smart_cache.should_use_cache(
-                    data_source=data_source,
-                    date_str=curr_date_str,
-                    cache_key=cache_key
-                )
+        df = frame.df
+        results = {}
 
-            data = None
-            if use_cache:
-                # Try to get cached data
-                cached_data = smart_cache.get_cached_data(cache_key)
-                if cached_data is not None:
-                    try:
-                        # Load from cache (CSV format)
-                        if isinstance(cached_data, str):
-                            import io
-                            data = pd.read_csv(io.StringIO(cached_data))
-                            data["Date"] = pd.to_datetime(data["Date"])
-                            print(f"🔄 Using cached historical data for {symbol}")
-                        else:
-                            print(f"⚠️ Unexpected cache data type: {type(cached_data)}")
-                            data = None
-                    except Exception as e:
-                        print(f"⚠️ Failed to load cached data: {e}")
-                        data = None
+        # Trigger stockstats to calculate every requested indicator in one pass
+        with _indicator_lock:
+            for indicator in indicators:
+                try:
+                    df[indicator]  # This calculates the indicator
+                except Exception as e:
+                    print(f"⚠️ StockStats calculation error for {indicator} on {symbol}: {e}")
+                    results[indicator] = f"N/A (Error: {str(e)[:50]})"
 
-            # Fetch fresh data if no valid cache
-            if data is None:
-                data_type = "LIVE" if is_current_day else "historical"
-                print(f"🔴 Fetching {data_type} data for {symbol} ({data_source})")
-
-                data = yf.download(
-                    symbol,
-                    start=start_date_str,
-                    end=end_date_str,
-                    multi_level_index=False,
-                    progress=False,
-                    auto_adjust=True,
-                )
-                data = data.reset_index()
-
-                # Only cache historical data (never current-day)
-                if not is_current_day:
-                    try:
-                        # Store as CSV string for efficient caching
-                        csv_data = data.to_csv(index=False)
-                        success = smart_cache.set_cached_data(
-                            cache_key=cache_key,
-                            data=csv_data,
-                            data_source=data_source,
-                            date_str=curr_date_str
-                        )
-                        if not success:
-                            print(f"⚠️ Cache storage was rejected for {symbol}")
-                    except Exception as e:
-                        print(f"⚠️ Failed to cache data: {e}")
-                else:
-                    print(f"🔴 Current-day data for {symbol} - NOT caching (time-sensitive)")
-
-            if data is not None and not data.empty:
-                df = wrap(data)
-                df["Date"] = df["Date"].dt.strftime("%Y-%m-%d")
-            else:
-                print(f"⚠️ No data retrieved for {symbol}")
-                return "N/A: No data available"
+        # Find the matching row for the current date once for all indicators
+        row_position = frame.row_by_date.get(date_key)
+        if row_position is None and date_key < pd.Timestamp.today().strftime("%Y-%m-%d"):
+            # Past dates without a row won't gain one; today's row may still arrive
+            with _df_cache_lock:
+                _non_trading_days.setdefault(symbol_key, set()).add(date_key)
 
-        try:
-            # Trigger stockstats to calculate the indicator with error handling
-            df[indicator]  # This calculates the indicator
-
-            # Find matching rows for the current date
-            matching_rows = df[df["Date"].str.startswith(curr_date)]
-
-            if not matching_rows.empty:
-                # Handle potential multiple columns by selecting the first one if needed
-                indicator_col = df.columns[df.columns.str.contains(indicator, case=False)]
-                if len(indicator_col) > 1:
-                    # If multiple columns match, use the exact match or first one
-                    exact_match = [col for col in indicator_col if col == indicator]
-                    selected_col = exact_match[0] if exact_match else indicator_col[0]
-                    print(f"⚠️ Multiple columns found for {indicator}, using: {selected_col}")
-                else:
-                    selected_col = indicator
-
-                indicator_value = matching_rows[selected_col].values[0]
-                return indicator_value
-            else:
-                return "N/A: Not a trading day (weekend or holiday)"
+        for indicator in indicators:
+            if indicator in results:
+                continue
+            if row_position is None:
+                results[indicator] = NOT_TRADING_DAY
+                continue
+            try:
+                results[indicator] = df[frame.column(indicator)].values[row_position]
+            except Exception as e:
+                print(f"⚠️ StockStats calculation error for {indicator} on {symbol}: {e}")
+                results[indicator] = f"N/A (Error: {str(e)[:50]})"
 
-        except Exception as e:
-            print(f"⚠️ StockStats calculation error for {indicator} on {symbol}: {e}")
-            # Try fallback calculation or return N/A
-            return f"N/A (Error: {str(e)[:50]})"
+        return {indicator: results[indicator] for indicator in indicators}
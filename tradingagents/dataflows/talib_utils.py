@@ -6,19 +6,100 @@ with the existing dataflow system. It uses the technical_patterns module
 and follows the same caching and data fetching patterns as other utils.
 """
 
+import numpy as np
 import pandas as pd
 import yfinance as yf
-from typing import Annotated, Dict, Any, Optional
+from typing import Annotated, Dict, Any, List, Optional, Tuple
 import os
+import time
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from functools import lru_cache
 from datetime import datetime, timedelta
-from ..default_config import DEFAULT_CONFIG
+from ..default_config import DEFAULT_CONFIG, get_default_config_view
 from .cache_utils import get_smart_cache, create_cache_key
-from ..technical_patterns import TechnicalPatternAnalyzer, analyze_stock_patterns
+from ..technical_patterns import TechnicalPatternAnalyzer, SRState, analyze_stock_patterns
+
+logger = logging.getLogger(__name__)
+
+
+# Size of the in-process memo of price frames keyed by
+# (symbol, curr_date, lookback_days, online, data_dir)
+PRICE_MEMO_SIZE = 128
+
+# Days of history in the shared base frame; every default report lookback
+# (100/30/50/60) is a slice of it
+BASE_LOOKBACK_DAYS = 120
+
+
+# Column dtypes for price CSVs read back from the cache
+_OHLCV_DTYPES = {col: np.float64 for col in ("Open", "High", "Low", "Close", "Adj Close", "Volume")}
+
+
+# Incremental support/resistance and Fibonacci state keyed by
+# (symbol, analysis, window); see TechnicalPatternAnalyzer.update_support_resistance.
+# Each entry is a [lock, SRState] pair: the module lock only guards the table,
+# so updates for different keys run in parallel
+LEVEL_STATE_SIZE = 64
+_level_states = OrderedDict()
+_level_state_lock = threading.Lock()
+
+
+# Downloads that returned no usable prices, keyed by (symbol, curr_date) and
+# timestamped, so known-bad tickers are not re-requested within this window
+NEGATIVE_RESULT_TTL = 300  # seconds
+_failed_downloads = {}
+_failed_downloads_lock = threading.Lock()
+
+
+class _NoPriceData(Exception):
+    """Raised instead of returning None so the price memo does not keep failures."""
 
 
 def get_config():
-    """Get configuration - simplified for Bedrock-only architecture."""
-    return DEFAULT_CONFIG.copy()
+    """Get a read-only view of the configuration; copy it before modifying."""
+    return get_default_config_view()
+
+
+@dataclass(frozen=True)
+class _PriceWindow:
+    """Download window and cache classification for an online price request."""
+    start_date: str
+    end_date: str
+    curr_date: str
+    lookback_days: int
+    is_current_day: bool
+    data_source: str
+
+    def cache_key(self, symbol: str) -> str:
+        return create_cache_key(
+            data_source=self.data_source,
+            symbol=symbol,
+            start_date=self.start_date,
+            end_date=self.end_date,
+            lookback_days=self.lookback_days
+        )
+
+
+@lru_cache(maxsize=512)
+def _parse_date(date_str: str) -> datetime:
+    """Parse a YYYY-mm-dd date; cached as the same dates recur across reports."""
+    return datetime.strptime(date_str, "%Y-%m-%d")
+
+
+def _today() -> Tuple[str, datetime]:
+    """Today's local date as (YYYY-mm-dd, midnight datetime); parsed once per day."""
+    today_str = time.strftime("%Y-%m-%d")
+    return today_str, _parse_date(today_str)
+
+
+@lru_cache(maxsize=1)
+def _get_analyzer() -> TechnicalPatternAnalyzer:
+    """Shared default analyzer; it holds only read-only settings, so it is safe across threads."""
+    return TechnicalPatternAnalyzer()
 
 
 class TechnicalAnalysisUtils:
@@ -30,7 +111,8 @@ class TechnicalAnalysisUtils:
         curr_date: Annotated[str, "current date for analysis, YYYY-mm-dd"],
         lookback_days: Annotated[int, "how many days of data to analyze"] = 100,
         online: Annotated[bool, "whether to use online or offline data"] = True,
-        data_dir: Annotated[str, "directory for offline data"] = None
+        data_dir: Annotated[str, "directory for offline data"] = None,
+        data: Optional[pd.DataFrame] = None
     ) -> str:
         """
         Perform comprehensive technical analysis on a stock.
@@ -41,15 +123,19 @@ class TechnicalAnalysisUtils:
             lookback_days: Number of days of historical data to analyze
             online: Whether to fetch data online or use offline files
             data_dir: Directory for offline data files
+            data: Preloaded price data (e.g. from _get_price_data_bulk) to use
+                instead of fetching
 
         Returns:
             Formatted technical analysis report
         """
         try:
             # Get price data
-            data = TechnicalAnalysisUtils._get_price_data(
-                symbol, curr_date, lookback_days, online, data_dir
-            )
+            if data is None:
+                data = TechnicalAnalysisUtils._get_base_frame(
+                    symbol, curr_date, online, data_dir, lookback_days
+                )
+            data = TechnicalAnalysisUtils._slice_lookback(data, curr_date, lookback_days)
 
             if data is None or data.empty:
                 return f"Technical Analysis Error: No price data available for {symbol}"
@@ -72,7 +158,9 @@ class TechnicalAnalysisUtils:
         symbol: Annotated[str, "ticker symbol for the company"],
         curr_date: Annotated[str, "current date for analysis, YYYY-mm-dd"],
         lookback_days: Annotated[int, "days of data for pattern analysis"] = 30,
-        online: Annotated[bool, "whether to use online data"] = True
+        online: Annotated[bool, "whether to use online data"] = True,
+        data_dir: Annotated[str, "directory for offline data"] = None,
+        data: Optional[pd.DataFrame] = None
     ) -> str:
         """
         Detect candlestick patterns specifically.
@@ -82,75 +170,68 @@ class TechnicalAnalysisUtils:
             curr_date: Current analysis date
             lookback_days: Days of data to analyze
             online: Use online data fetching
+            data_dir: Directory for offline data files
+            data: Preloaded price data to use instead of fetching
 
         Returns:
             Formatted candlestick pattern report
         """
         try:
-            data = TechnicalAnalysisUtils._get_price_data(
-                symbol, curr_date, lookback_days, online
-            )
+            if data is None:
+                data = TechnicalAnalysisUtils._get_base_frame(
+                    symbol, curr_date, online, data_dir, lookback_days=lookback_days
+                )
+            data = TechnicalAnalysisUtils._slice_lookback(data, curr_date, lookback_days)
 
             if data is None or data.empty:
                 return f"Pattern Analysis Error: No data available for {symbol}"
 
-            analyzer = TechnicalPatternAnalyzer()
+            analyzer = _get_analyzer()
             patterns = analyzer.detect_candlestick_patterns(data)
 
             if 'error' in patterns:
                 return f"Pattern Analysis Error for {symbol}: {patterns['error']}"
 
             # Format pattern report
-            report = f"# Candlestick Pattern Analysis: {symbol}\n\n"
+            parts = [f"# Candlestick Pattern Analysis: {symbol}\n\n"]
 
             detected = patterns.get('patterns_detected', {})
             if detected:
-                report += f"**Patterns Detected:** {len(detected)}\n\n"
-
-                # Group by pattern type
-                reversal_patterns = []
-                continuation_patterns = []
-                indecision_patterns = []
+                parts.append(f"**Patterns Detected:** {len(detected)}\n\n")
 
+                # Group by the analyzer's pattern category
+                buckets = {'reversal': [], 'continuation': [], 'indecision': []}
                 for pattern_name, pattern_data in detected.items():
-                    pattern_info = {
-                        'name': pattern_name,
-                        'direction': pattern_data['direction'],
-                        'reliability': pattern_data['reliability'],
-                        'days_ago': pattern_data['days_ago']
-                    }
-
-                    if 'reversal' in pattern_data['type']:
-                        reversal_patterns.append(pattern_info)
-                    elif 'continuation' in pattern_data['type']:
-                        continuation_patterns.append(pattern_info)
-                    else:
-                        indecision_patterns.append(pattern_info)
+                    buckets[pattern_data['bucket']].append((
+                        pattern_name,
+                        pattern_data['direction'],
+                        pattern_data['reliability'],
+                        pattern_data['days_ago']
+                    ))
 
                 # Add pattern sections
-                if reversal_patterns:
-                    report += "## Reversal Patterns\n"
-                    for p in reversal_patterns:
-                        report += f"- **{p['name']}** ({p['direction']}) - {p['reliability']}% reliability, {p['days_ago']} days ago\n"
-                    report += "\n"
-
-                if continuation_patterns:
-                    report += "## Continuation Patterns\n"
-                    for p in continuation_patterns:
-                        report += f"- **{p['name']}** ({p['direction']}) - {p['reliability']}% reliability, {p['days_ago']} days ago\n"
-                    report += "\n"
-
-                if indecision_patterns:
-                    report += "## Indecision Patterns\n"
-                    for p in indecision_patterns:
-                        report += f"- **{p['name']}** ({p['direction']}) - {p['reliability']}% reliability, {p['days_ago']} days ago\n"
-                    report += "\n"
+                for title, bucket in (
+                    ("Reversal Patterns", 'reversal'),
+                    ("Continuation Patterns", 'continuation'),
+                    ("Indecision Patterns", 'indecision'),
+                ):
+                    section = buckets[bucket]
+                    if section:
+                        parts.append(f"## {title}\n")
+                        parts.extend(
+                            f"- **{name}** ({direction}) - {reliability}% reliability, {days_ago} days ago\n"
+                            for name, direction, reliability, days_ago in section
+                        )
+                        parts.append("\n")
 
             else:
-                report += "**No significant candlestick patterns detected in recent trading.**\n\n"
+                parts.append("**No significant candlestick patterns detected in recent trading.**\n\n")
 
-            report += f"*Analysis date: {patterns.get('analysis_date', curr_date)}*"
-            return report
+            analysis_date = patterns.get('analysis_date', curr_date)
+            if isinstance(analysis_date, pd.Timestamp):
+                analysis_date = analysis_date.strftime("%Y-%m-%d")
+            parts.append(f"*Analysis date: {analysis_date}*")
+            return "".join(parts)
 
         except Exception as e:
             return f"Candlestick Pattern Error for {symbol}: {str(e)}"
@@ -160,7 +241,9 @@ class TechnicalAnalysisUtils:
         symbol: Annotated[str, "ticker symbol for the company"],
         curr_date: Annotated[str, "current date for analysis, YYYY-mm-dd"],
         lookback_days: Annotated[int, "days for support/resistance calculation"] = 50,
-        online: Annotated[bool, "whether to use online data"] = True
+        online: Annotated[bool, "whether to use online data"] = True,
+        data_dir: Annotated[str, "directory for offline data"] = None,
+        data: Optional[pd.DataFrame] = None
     ) -> str:
         """
         Calculate support and resistance levels.
@@ -170,46 +253,51 @@ class TechnicalAnalysisUtils:
             curr_date: Current analysis date
             lookback_days: Days of data for level calculation
             online: Use online data fetching
+            data_dir: Directory for offline data files
+            data: Preloaded price data to use instead of fetching
 
         Returns:
             Formatted support/resistance report
         """
         try:
-            data = TechnicalAnalysisUtils._get_price_data(
-                symbol, curr_date, lookback_days, online
-            )
+            if data is None:
+                data = TechnicalAnalysisUtils._get_base_frame(
+                    symbol, curr_date, online, data_dir, lookback_days=lookback_days
+                )
+            data = TechnicalAnalysisUtils._slice_lookback(data, curr_date, lookback_days)
 
             if data is None or data.empty:
                 return f"Support/Resistance Error: No data available for {symbol}"
 
-            analyzer = TechnicalPatternAnalyzer()
-            sr_levels = analyzer.analyze_support_resistance(data, window=20)
+            analyzer = _get_analyzer()
+            sr_levels = TechnicalAnalysisUtils._update_levels(
+                (symbol, online, 'support_resistance', 20), analyzer.update_support_resistance, data
+            )
 
             if 'error' in sr_levels:
                 return f"Support/Resistance Error for {symbol}: {sr_levels['error']}"
 
             # Format report
-            report = f"# Support & Resistance Analysis: {symbol}\n\n"
-            report += f"**Current Price:** ${sr_levels['current_price']}\n\n"
-
-            report += f"**Support Level:** ${sr_levels['support_level']}\n"
-            report += f"- Distance: {sr_levels['support_distance_pct']}% below current price\n"
-
-            report += f"\n**Resistance Level:** ${sr_levels['resistance_level']}\n"
-            report += f"- Distance: {sr_levels['resistance_distance_pct']}% above current price\n\n"
-
-            # Trading implications
-            report += "## Trading Implications\n"
             if sr_levels['support_distance_pct'] <= 2:
-                report += "- 🟢 **Near Support Level** - Potential buying opportunity\n"
+                implication = "- 🟢 **Near Support Level** - Potential buying opportunity\n"
             elif sr_levels['resistance_distance_pct'] <= 2:
-                report += "- 🔴 **Near Resistance Level** - Potential selling opportunity\n"
+                implication = "- 🔴 **Near Resistance Level** - Potential selling opportunity\n"
             elif sr_levels['in_range']:
-                report += "- 📊 **Within Trading Range** - Monitor for breakout\n"
+                implication = "- 📊 **Within Trading Range** - Monitor for breakout\n"
             else:
-                report += "- ⚠️ **Outside Trading Range** - Potential trend continuation\n"
-
-            return report
+                implication = "- ⚠️ **Outside Trading Range** - Potential trend continuation\n"
+
+            return (
+                f"# Support & Resistance Analysis: {symbol}\n\n"
+                f"**Current Price:** ${sr_levels['current_price']:.2f}\n\n"
+                f"**Support Level:** ${sr_levels['support_level']:.2f}\n"
+                f"- Distance: {sr_levels['support_distance_pct']:.2f}% below current price\n"
+                f"\n**Resistance Level:** ${sr_levels['resistance_level']:.2f}\n"
+                f"- Distance: {sr_levels['resistance_distance_pct']:.2f}% above current price\n\n"
+                # Trading implications
+                "## Trading Implications\n"
+                f"{implication}"
+            )
 
         except Exception as e:
             return f"Support/Resistance Error for {symbol}: {str(e)}"
@@ -219,7 +307,9 @@ class TechnicalAnalysisUtils:
         symbol: Annotated[str, "ticker symbol for the company"],
         curr_date: Annotated[str, "current date for analysis, YYYY-mm-dd"],
         trend_window: Annotated[int, "days to determine trend high/low"] = 50,
-        online: Annotated[bool, "whether to use online data"] = True
+        online: Annotated[bool, "whether to use online data"] = True,
+        data_dir: Annotated[str, "directory for offline data"] = None,
+        data: Optional[pd.DataFrame] = None
     ) -> str:
         """
         Calculate Fibonacci retracement levels.
@@ -229,45 +319,55 @@ class TechnicalAnalysisUtils:
             curr_date: Current analysis date
             trend_window: Days to determine trend extremes
             online: Use online data fetching
+            data_dir: Directory for offline data files
+            data: Preloaded price data to use instead of fetching
 
         Returns:
             Formatted Fibonacci analysis report
         """
         try:
-            data = TechnicalAnalysisUtils._get_price_data(
-                symbol, curr_date, trend_window + 10, online
-            )
+            if data is None:
+                data = TechnicalAnalysisUtils._get_base_frame(
+                    symbol, curr_date, online, data_dir, lookback_days=trend_window + 10
+                )
+            data = TechnicalAnalysisUtils._slice_lookback(data, curr_date, trend_window + 10)
 
             if data is None or data.empty:
                 return f"Fibonacci Analysis Error: No data available for {symbol}"
 
-            analyzer = TechnicalPatternAnalyzer()
-            fib_analysis = analyzer.calculate_fibonacci_levels(data, trend_window)
+            analyzer = _get_analyzer()
+            fib_analysis = TechnicalAnalysisUtils._update_levels(
+                (symbol, online, 'fibonacci', trend_window), analyzer.update_fibonacci_levels, data
+            )
 
             if 'error' in fib_analysis:
                 return f"Fibonacci Analysis Error for {symbol}: {fib_analysis['error']}"
 
             # Format report
-            report = f"# Fibonacci Retracement Analysis: {symbol}\n\n"
-
-            report += f"**Current Price:** ${fib_analysis['current_price']}\n"
-            report += f"**Trend High:** ${fib_analysis['trend_high']}\n"
-            report += f"**Trend Low:** ${fib_analysis['trend_low']}\n\n"
-
-            report += "## Fibonacci Levels\n"
-            for level_name, level_price in fib_analysis['fibonacci_levels'].items():
-                report += f"- {level_name}: ${level_price}\n"
+            parts = [
+                f"# Fibonacci Retracement Analysis: {symbol}\n\n",
+                f"**Current Price:** ${fib_analysis['current_price']:.2f}\n",
+                f"**Trend High:** ${fib_analysis['trend_high']:.2f}\n",
+                f"**Trend Low:** ${fib_analysis['trend_low']:.2f}\n\n",
+                "## Fibonacci Levels\n",
+            ]
+            parts.extend(
+                f"- {level_name}: ${level_price:.2f}\n"
+                for level_name, level_price in fib_analysis['fibonacci_levels'].items()
+            )
 
             # Nearby levels
             nearby = fib_analysis.get('nearby_levels', {})
             if nearby:
-                report += "\n## Key Levels Near Current Price\n"
-                for level_name, level_data in nearby.items():
-                    report += f"- **{level_name}**: ${level_data['price']} ({level_data['distance_pct']}% away)\n"
+                parts.append("\n## Key Levels Near Current Price\n")
+                parts.extend(
+                    f"- **{level_name}**: ${level_data['price']:.2f} ({level_data['distance_pct']:.2f}% away)\n"
+                    for level_name, level_data in nearby.items()
+                )
 
-                report += "\n🎯 **Trading Note:** Price is near key Fibonacci levels - watch for potential reversals or continuations.\n"
+                parts.append("\n🎯 **Trading Note:** Price is near key Fibonacci levels - watch for potential reversals or continuations.\n")
 
-            return report
+            return "".join(parts)
 
         except Exception as e:
             return f"Fibonacci Analysis Error for {symbol}: {str(e)}"
@@ -283,6 +383,9 @@ class TechnicalAnalysisUtils:
         """
         Get price data with smart caching, similar to stockstats_utils pattern.
 
+        Results are memoized in-process so sibling reports for the same symbol
+        and date reuse one frame; current-day data is always fetched fresh.
+
         Args:
             symbol: Stock ticker
             curr_date: Current date
@@ -293,114 +396,478 @@ class TechnicalAnalysisUtils:
         Returns:
             DataFrame with OHLCV data or None if error
         """
-        data = None
+        data = TechnicalAnalysisUtils._get_memoized_price_data(
+            symbol, curr_date, lookback_days, online, data_dir
+        )
+        # Callers may modify the frame; keep the memoized copy pristine
+        return None if data is None else data.copy()
 
-        if not online and data_dir:
-            # Try offline data
-            try:
-                file_path = os.path.join(
-                    data_dir,
-                    f"{symbol}-YFin-data-2015-01-01-2025-03-25.csv"
-                )
-                data = pd.read_csv(file_path)
-            except FileNotFoundError:
-                raise Exception("Technical analysis fail: Yahoo Finance data not fetched yet!")
-
-        else:
-            # Online data fetching with smart caching
-            today_date = pd.Timestamp.today()
-            curr_date_dt = pd.to_datetime(curr_date)
-
-            # Calculate date range
-            start_date = curr_date_dt - pd.DateOffset(days=lookback_days)
-            end_date = min(today_date, curr_date_dt + pd.DateOffset(days=1))
-
-            start_date_str = start_date.strftime("%Y-%m-%d")
-            end_date_str = end_date.strftime("%Y-%m-%d")
-            curr_date_str = curr_date_dt.strftime("%Y-%m-%d")
-
-            # Determine if this is time-sensitive data
-            is_current_day = curr_date_dt.date() == today_date.date()
-            data_source = "technical_analysis_current" if is_current_day else "technical_analysis_historical"
-
-            # Create cache key
-            cache_key = create_cache_key(
-                data_source=data_source,
-                symbol=symbol,
-                start_date=start_date_str,
-                end_date=end_date_str,
-                lookback_days=lookback_days
+    @staticmethod
+    def _get_base_frame(
+        symbol: str,
+        curr_date: str,
+        online: bool = True,
+        data_dir: str = None,
+        lookback_days: int = BASE_LOOKBACK_DAYS
+    ) -> Optional[pd.DataFrame]:
+        """
+        Get the shared price frame the four reports slice their lookbacks from.
+
+        The frame spans at least BASE_LOOKBACK_DAYS, so sibling reports for the
+        same symbol and date hit one memo entry instead of one per lookback.
+        Unlike _get_price_data it returns the memoized frame itself: treat it
+        as read-only and trim it with _slice_lookback.
+        """
+        return TechnicalAnalysisUtils._get_memoized_price_data(
+            symbol, curr_date, max(lookback_days, BASE_LOOKBACK_DAYS), online, data_dir
+        )
+
+    @staticmethod
+    def _get_memoized_price_data(
+        symbol: str,
+        curr_date: str,
+        lookback_days: int,
+        online: bool,
+        data_dir: Optional[str]
+    ) -> Optional[pd.DataFrame]:
+        """Look up price data in the per-day memo; current-day data is always fetched."""
+        # Normalize so "2024-1-2" and "2024-01-02" share a memo entry
+        curr_date = f"{_parse_date(curr_date):%Y-%m-%d}"
+
+        if online and curr_date == _today()[0]:
+            return TechnicalAnalysisUtils._fetch_price_data(
+                symbol, curr_date, lookback_days, online, data_dir
             )
 
-            # Initialize smart cache
-            smart_cache = get_smart_cache()
+        try:
+            return _get_price_data_cached(symbol, curr_date, lookback_days, online, data_dir)
+        except _NoPriceData:
+            return None
 
-            # Check cache for historical data only
-            use_cache = False
-            if not is_current_day:
-                use_cache = smart_cache.should_use_cache(
-                    data_source=data_source,
-                    date_str=curr_date_str,
-                    cache_key=cache_key
-                )
+    @staticmethod
+    def _fetch_price_data(
+        symbol: str,
+        curr_date: str,
+        lookback_days: int,
+        online: bool = True,
+        data_dir: str = None
+    ) -> Optional[pd.DataFrame]:
+        """Load price data from offline files, the smart cache or yfinance."""
+        if not online:
+            # Offline data needs no date window, cache key or smart cache
+            return TechnicalAnalysisUtils._downcast_prices(
+                TechnicalAnalysisUtils._load_offline_price_data(symbol, data_dir)
+            )
+
+        # Online data fetching with smart caching
+        window = TechnicalAnalysisUtils._price_window(curr_date, lookback_days)
+        data = TechnicalAnalysisUtils._load_cached_price_data(symbol, window)
+
+        # Fetch fresh data if no valid cache
+        if data is None:
+            if TechnicalAnalysisUtils._recently_failed(symbol, window):
+                return None
+
+            data_type = "LIVE" if window.is_current_day else "historical"
+            logger.info("Fetching %s technical analysis data for %s", data_type, symbol)
+
+            data = yf.download(
+                symbol,
+                start=window.start_date,
+                end=window.end_date,
+                multi_level_index=False,
+                progress=False,
+                auto_adjust=True
+            )
+            if not TechnicalAnalysisUtils._is_valid_ohlcv(data):
+                # Failed tickers come back as empty or all-NaN frames; never cache those
+                TechnicalAnalysisUtils._record_failure(symbol, window)
+                return None
 
-            if use_cache:
-                cached_data = smart_cache.get_cached_data(cache_key)
-                if cached_data is not None:
-                    try:
-                        import io
-                        data = pd.read_csv(io.StringIO(cached_data))
-                        data["Date"] = pd.to_datetime(data["Date"])
-                        print(f"🔄 Using cached technical analysis data for {symbol}")
-                    except Exception as e:
-                        print(f"⚠️ Failed to load cached technical data: {e}")
-                        data = None
-
-            # Fetch fresh data if no valid cache
+            # Dates stay in the DatetimeIndex; the analyzer accepts either layout
+            data = TechnicalAnalysisUtils._downcast_prices(data)
+            TechnicalAnalysisUtils._store_price_data(symbol, window, data)
+
+        return TechnicalAnalysisUtils._downcast_prices(data)
+
+    @staticmethod
+    def _load_offline_price_data(symbol: str, data_dir: Optional[str]) -> pd.DataFrame:
+        """
+        Read the pre-fetched Yahoo Finance CSV for symbol from data_dir.
+
+        Without a data_dir, the price data directory under the configured
+        data_dir is used, as the dataflow interface does for offline prices.
+        """
+        if data_dir is None:
+            data_dir = os.path.join(get_config().get("data_dir", "./data"), "market_data", "price_data")
+
+        try:
+            file_path = os.path.join(
+                data_dir,
+                f"{symbol}-YFin-data-2015-01-01-2025-03-25.csv"
+            )
+            return pd.read_csv(file_path)
+        except FileNotFoundError:
+            raise Exception("Technical analysis fail: Yahoo Finance data not fetched yet!")
+
+    @staticmethod
+    def _downcast_prices(data: Optional[pd.DataFrame]) -> Optional[pd.DataFrame]:
+        """
+        Store OHLCV columns as float32 unless technical_float32_prices is disabled.
+
+        Prices carry far fewer significant digits than float32 holds, and the
+        halved frames are what the memo and the smart cache keep around. TA-Lib
+        inputs are widened back to float64 inside the analyzer.
+        """
+        if data is None or not DEFAULT_CONFIG.get("technical_float32_prices", True):
+            return data
+        dtypes = {col: np.float32 for col in _OHLCV_DTYPES if col in data.columns}
+        return data.astype(dtypes, copy=False) if dtypes else data
+
+    @staticmethod
+    def _get_price_data_bulk(
+        symbols: List[str],
+        curr_date: str,
+        max_lookback: int
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Get online price data for several symbols with a single yfinance request.
+
+        Symbols with a valid smart cache entry are served from the cache; the rest
+        are downloaded together. Each symbol's frame is cached under the same key
+        _get_price_data would use for max_lookback.
+
+        Args:
+            symbols: Stock tickers
+            curr_date: Current date
+            max_lookback: Days of historical data needed by the largest report
+
+        Returns:
+            Dict mapping each symbol to its OHLCV DataFrame (empty if unavailable)
+        """
+        window = TechnicalAnalysisUtils._price_window(curr_date, max_lookback)
+
+        frames = {}
+        missing = []
+        for symbol in dict.fromkeys(symbols):
+            data = TechnicalAnalysisUtils._load_cached_price_data(symbol, window)
             if data is None:
-                data_type = "LIVE" if is_current_day else "historical"
-                print(f"🔴 Fetching {data_type} technical analysis data for {symbol}")
-
-                data = yf.download(
-                    symbol,
-                    start=start_date_str,
-                    end=end_date_str,
-                    multi_level_index=False,
-                    progress=False,
-                    auto_adjust=True
+                if TechnicalAnalysisUtils._recently_failed(symbol, window):
+                    frames[symbol] = pd.DataFrame()
+                else:
+                    missing.append(symbol)
+            else:
+                frames[symbol] = TechnicalAnalysisUtils._downcast_prices(data)
+
+        if missing:
+            data_type = "LIVE" if window.is_current_day else "historical"
+            logger.info("Fetching %s technical analysis data for %s", data_type, ", ".join(missing))
+
+            downloaded = yf.download(
+                " ".join(missing),
+                start=window.start_date,
+                end=window.end_date,
+                group_by='ticker',
+                threads=True,
+                progress=False,
+                auto_adjust=True
+            )
+            tickers = (
+                set(downloaded.columns.get_level_values(0))
+                if isinstance(downloaded.columns, pd.MultiIndex) else set()
+            )
+
+            for symbol in missing:
+                if symbol in tickers:
+                    data = downloaded[symbol].dropna(how='all')
+                elif not tickers and len(missing) == 1:
+                    data = downloaded
+                else:
+                    data = pd.DataFrame()
+                if not TechnicalAnalysisUtils._is_valid_ohlcv(data):
+                    TechnicalAnalysisUtils._record_failure(symbol, window)
+                    frames[symbol] = pd.DataFrame()
+                    continue
+                data.columns.name = None
+                data = TechnicalAnalysisUtils._downcast_prices(data)
+                TechnicalAnalysisUtils._store_price_data(symbol, window, data)
+                frames[symbol] = data
+
+        return frames
+
+    @staticmethod
+    def _price_window(curr_date: str, lookback_days: int) -> _PriceWindow:
+        """Resolve the download window for an online price request."""
+        _, today_date = _today()
+        curr_date_dt = _parse_date(curr_date)
+
+        # Calculate date range
+        start_date = curr_date_dt - timedelta(days=lookback_days)
+        end_date = min(today_date, curr_date_dt + timedelta(days=1))
+
+        # Determine if this is time-sensitive data
+        is_current_day = curr_date_dt == today_date
+        data_source = "technical_analysis_current" if is_current_day else "technical_analysis_historical"
+
+        return _PriceWindow(
+            start_date=f"{start_date:%Y-%m-%d}",
+            end_date=f"{end_date:%Y-%m-%d}",
+            curr_date=f"{curr_date_dt:%Y-%m-%d}",
+            lookback_days=lookback_days,
+            is_current_day=is_current_day,
+            data_source=data_source
+        )
+
+    @staticmethod
+    def _load_cached_price_data(symbol: str, window: _PriceWindow) -> Optional[pd.DataFrame]:
+        """Return cached price data for symbol and window, or None on a miss."""
+        # Check cache for historical data only
+        if window.is_current_day:
+            return None
+
+        cache_key = window.cache_key(symbol)
+        smart_cache = get_smart_cache()
+        if not smart_cache.should_use_cache(
+            data_source=window.data_source,
+            date_str=window.curr_date,
+            cache_key=cache_key
+        ):
+            return None
+
+        cached_path = smart_cache.get_cached_path(cache_key)
+        if cached_path is None:
+            return None
+        try:
+            if cached_path.suffix == ".csv":
+                # CSV (pyarrow unavailable, or entries cached by older versions):
+                # parse straight from disk with dates and dtypes resolved in one pass
+                data = pd.read_csv(
+                    cached_path,
+                    engine="c",
+                    parse_dates=["Date"],
+                    index_col="Date",
+                    dtype=_OHLCV_DTYPES
                 )
-                data = data.reset_index()
-
-                # Cache historical data only
-                if not is_current_day and not data.empty:
-                    try:
-                        csv_data = data.to_csv(index=False)
-                        success = smart_cache.set_cached_data(
-                            cache_key=cache_key,
-                            data=csv_data,
-                            data_source=data_source,
-                            date_str=curr_date_str
-                        )
-                        if not success:
-                            print(f"⚠️ Technical analysis cache storage rejected for {symbol}")
-                    except Exception as e:
-                        print(f"⚠️ Failed to cache technical analysis data: {e}")
+            else:
+                # Arrow/Parquet-backed DataFrame, dtypes preserved
+                data = smart_cache.get_cached_data(cache_key)
+                if not isinstance(data, pd.DataFrame):
+                    return None
+            logger.debug("Using cached technical analysis data for %s", symbol)
+            return data
+        except Exception as e:
+            logger.warning("Failed to load cached technical data: %s", e)
+            return None
+
+    @staticmethod
+    def _is_valid_ohlcv(data: Optional[pd.DataFrame]) -> bool:
+        """Whether a download holds at least one bar with a closing price."""
+        return data is not None and "Close" in data.columns and bool(data["Close"].notna().any())
+
+    @staticmethod
+    def _recently_failed(symbol: str, window: _PriceWindow) -> bool:
+        """Whether symbol returned no usable prices for this date within NEGATIVE_RESULT_TTL."""
+        with _failed_downloads_lock:
+            failed_at = _failed_downloads.get((symbol, window.curr_date))
+        return failed_at is not None and time.time() - failed_at < NEGATIVE_RESULT_TTL
 
-        return data
+    @staticmethod
+    def _record_failure(symbol: str, window: _PriceWindow) -> None:
+        """Remember an unusable download so retries within NEGATIVE_RESULT_TTL are skipped."""
+        logger.warning("No usable price data for %s; not caching", symbol)
+        now = time.time()
+        with _failed_downloads_lock:
+            for stale_key in [k for k, ts in _failed_downloads.items() if now - ts >= NEGATIVE_RESULT_TTL]:
+                del _failed_downloads[stale_key]
+            _failed_downloads[(symbol, window.curr_date)] = now
+
+    @staticmethod
+    def _store_price_data(symbol: str, window: _PriceWindow, data: pd.DataFrame) -> None:
+        """Cache freshly downloaded historical price data."""
+        # Cache historical data only
+        if window.is_current_day or data.empty:
+            return
+        try:
+            # SmartCache stores DataFrames in its configured frame format
+            success = get_smart_cache().set_cached_data(
+                cache_key=window.cache_key(symbol),
+                data=data,
+                data_source=window.data_source,
+                date_str=window.curr_date
+            )
+            if not success:
+                logger.warning("Technical analysis cache storage rejected for %s", symbol)
+        except Exception as e:
+            logger.warning("Failed to cache technical analysis data: %s", e)
+
+    @staticmethod
+    def _update_levels(key, update, data: pd.DataFrame) -> Dict[str, Any]:
+        """
+        Run an incremental level update against the state stored for key.
+
+        Keys carry the data source as well as the symbol, since offline and
+        online frames for one symbol need not share bars; the window comes last.
+        """
+        with _level_state_lock:
+            entry = _level_states.get(key)
+            if entry is None:
+                entry = _level_states[key] = [threading.Lock(), SRState(window=key[-1])]
+                if len(_level_states) > LEVEL_STATE_SIZE:
+                    _level_states.popitem(last=False)
+            else:
+                _level_states.move_to_end(key)
+
+        # States are updated in place, so each update runs under its key's lock
+        with entry[0]:
+            try:
+                return update(entry[1], data)
+            except Exception:
+                # Don't keep a half-updated window; the next call rebuilds it
+                entry[1] = SRState(window=key[-1])
+                raise
+
+    @staticmethod
+    def _slice_lookback(data: pd.DataFrame, curr_date: str, lookback_days: int) -> pd.DataFrame:
+        """
+        Trim a preloaded frame to the rows _get_price_data would return for lookback_days.
+
+        Date-sorted frames are cut with a positional slice, so no rows are copied.
+        """
+        if data is None or data.empty:
+            return data
+        start_date = _parse_date(curr_date) - timedelta(days=lookback_days)
+        if isinstance(data.index, pd.DatetimeIndex):
+            if data.index.is_monotonic_increasing:
+                return data.iloc[data.index.searchsorted(start_date):]
+            return data[data.index >= start_date]
+        # Offline CSVs keep Date as text and are analyzed whole
+        if "Date" not in data.columns or not pd.api.types.is_datetime64_any_dtype(data["Date"]):
+            return data
+        dates = data["Date"]
+        if dates.is_monotonic_increasing:
+            return data.iloc[dates.searchsorted(start_date):].reset_index(drop=True)
+        return data[dates >= start_date].reset_index(drop=True)
+
+    @staticmethod
+    def get_reports_batch(
+        symbols: List[str],
+        curr_date: str,
+        lookback_days: int = 100,
+        pattern_lookback_days: int = 30,
+        sr_lookback_days: int = 50,
+        trend_window: int = 50,
+        online: bool = True,
+        data_dir: Optional[str] = None,
+        max_workers: Optional[int] = None
+    ) -> Dict[str, Dict[str, str]]:
+        """
+        Run all four technical reports for several symbols off one price download.
+
+        Reports run concurrently in a thread pool once the prices are loaded.
+
+        Args:
+            symbols: Ticker symbols
+            curr_date: Current analysis date
+            lookback_days: Days of data for the full technical analysis
+            pattern_lookback_days: Days of data for candlestick patterns
+            sr_lookback_days: Days of data for support/resistance
+            trend_window: Days to determine Fibonacci trend extremes
+            online: Use online data fetching
+            data_dir: Directory for offline data files
+            max_workers: Thread pool size (default: min(32, 4 per symbol))
+
+        Returns:
+            Dict mapping each symbol to its reports, keyed by 'technical_analysis',
+            'candlestick_patterns', 'support_resistance' and 'fibonacci'
+        """
+        frames = {}
+        if online:
+            # Same window as _get_base_frame, so both share smart cache entries
+            max_lookback = max(
+                BASE_LOOKBACK_DAYS, lookback_days, pattern_lookback_days, sr_lookback_days, trend_window + 10
+            )
+            try:
+                frames = TechnicalAnalysisUtils._get_price_data_bulk(symbols, curr_date, max_lookback)
+            except Exception as e:
+                # Fall back to per-report fetching below
+                logger.warning("Bulk technical analysis download failed: %s", e)
+
+        report_calls = (
+            ('technical_analysis', TechnicalAnalysisUtils.get_technical_analysis, lookback_days),
+            ('candlestick_patterns', TechnicalAnalysisUtils.get_candlestick_patterns, pattern_lookback_days),
+            ('support_resistance', TechnicalAnalysisUtils.get_support_resistance_levels, sr_lookback_days),
+            ('fibonacci', TechnicalAnalysisUtils.get_fibonacci_analysis, trend_window),
+        )
+        unique_symbols = list(dict.fromkeys(symbols))
+        if not unique_symbols:
+            return {}
+
+        # Pre-size each symbol's dict so output order does not depend on completion order
+        reports = {symbol: dict.fromkeys(name for name, _, _ in report_calls) for symbol in unique_symbols}
+        workers = max_workers or min(32, len(unique_symbols) * len(report_calls))
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(
+                    report, symbol, curr_date, days, online, data_dir, data=frames.get(symbol)
+                ): (symbol, name)
+                for symbol in unique_symbols
+                for name, report, days in report_calls
+            }
+            for future in as_completed(futures):
+                symbol, name = futures[future]
+                try:
+                    reports[symbol][name] = future.result()
+                except Exception as e:
+                    reports[symbol][name] = f"Technical Analysis Error for {symbol}: {str(e)}"
+
+        return reports
+
+
+@lru_cache(maxsize=PRICE_MEMO_SIZE)
+def _get_price_data_cached(
+    symbol: str,
+    curr_date: str,
+    lookback_days: int,
+    online: bool,
+    data_dir: Optional[str]
+) -> Optional[pd.DataFrame]:
+    """Memoized TechnicalAnalysisUtils._fetch_price_data; clear with cache_clear()."""
+    data = TechnicalAnalysisUtils._fetch_price_data(symbol, curr_date, lookback_days, online, data_dir)
+    if data is None:
+        # Let the next call retry once the negative-result TTL has passed
+        raise _NoPriceData(symbol)
+    return data
 
 
 # Interface functions for integration with existing system
+def get_all_reports_for_symbols(
+    symbols: Annotated[List[str], "ticker symbols to analyze"],
+    curr_date: Annotated[str, "current date for analysis, YYYY-mm-dd"],
+    lookback_days: Annotated[int, "days of data for the full technical analysis"] = 100,
+    online: Annotated[bool, "whether to use online data"] = True,
+    data_dir: Annotated[str, "directory for offline data"] = None
+) -> Dict[str, Dict[str, str]]:
+    """
+    Interface function running all four technical reports for several symbols concurrently.
+    """
+    return TechnicalAnalysisUtils.get_reports_batch(
+        symbols, curr_date, lookback_days=lookback_days, online=online, data_dir=data_dir
+    )
+
+
 def get_technical_analysis_report(
     symbol: Annotated[str, "ticker symbol for the company"],
     curr_date: Annotated[str, "current date for analysis, YYYY-mm-dd"],
     lookback_days: Annotated[int, "days of data to analyze"] = 100,
-    online: Annotated[bool, "whether to use online data"] = True
+    online: Annotated[bool, "whether to use online data"] = True,
+    data_dir: Annotated[str, "directory for offline data"] = None
 ) -> str:
     """
     Main interface function for technical analysis reports.
     """
     return TechnicalAnalysisUtils.get_technical_analysis(
-        symbol, curr_date, lookback_days, online
+        symbol, curr_date, lookback_days, online, data_dir
     )
 
 
@@ -408,13 +875,14 @@ def get_candlestick_patterns_report(
     symbol: Annotated[str, "ticker symbol for the company"],
     curr_date: Annotated[str, "current date for analysis, YYYY-mm-dd"],
     lookback_days: Annotated[int, "days of data for pattern analysis"] = 30,
-    online: Annotated[bool, "whether to use online data"] = True
+    online: Annotated[bool, "whether to use online data"] = True,
+    data_dir: Annotated[str, "directory for offline data"] = None
 ) -> str:
     """
     Interface function for candlestick pattern analysis.
     """
     return TechnicalAnalysisUtils.get_candlestick_patterns(
-        symbol, curr_date, lookback_days, online
+        symbol, curr_date, lookback_days, online, data_dir
     )
 
 
@@ -422,13 +890,14 @@ def get_support_resistance_report(
     symbol: Annotated[str, "ticker symbol for the company"],
     curr_date: Annotated[str, "current date for analysis, YYYY-mm-dd"],
     lookback_days: Annotated[int, "days for level calculation"] = 50,
-    online: Annotated[bool, "whether to use online data"] = True
+    online: Annotated[bool, "whether to use online data"] = True,
+    data_dir: Annotated[str, "directory for offline data"] = None
 ) -> str:
     """
     Interface function for support/resistance analysis.
     """
     return TechnicalAnalysisUtils.get_support_resistance_levels(
-        symbol, curr_date, lookback_days, online
+        symbol, curr_date, lookback_days, online, data_dir
     )
 
 
@@ -436,11 +905,12 @@ def get_fibonacci_levels_report(
     symbol: Annotated[str, "ticker symbol for the company"],
     curr_date: Annotated[str, "current date for analysis, YYYY-mm-dd"],
     trend_window: Annotated[int, "days to determine trend extremes"] = 50,
-    online: Annotated[bool, "whether to use online data"] = True
+    online: Annotated[bool, "whether to use online data"] = True,
+    data_dir: Annotated[str, "directory for offline data"] = None
 ) -> str:
     """
     Interface function for Fibonacci retracement analysis.
     """
     return TechnicalAnalysisUtils.get_fibonacci_analysis(
-        symbol, curr_date, trend_window, online
+        symbol, curr_date, trend_window, online, data_dir
     )
\ No newline at end of file
@@ -5,19 +5,28 @@ This module provides the default configuration for the TradingAgents system.
 It integrates with the environment configuration system to load settings from .env files.
 """
 
+from types import MappingProxyType
+
 from .env_config import get_env_config
 
 # Load environment configuration
 env_config = get_env_config()
 
 # Create DEFAULT_CONFIG from environment configuration
-DEFAULT_CONFIG = env_config.get_config()
+DEFAULT_CONFIG = dict(env_config.get_config())
+
+# Read-only view of DEFAULT_CONFIG; reflects update_default_config changes
+DEFAULT_CONFIG_VIEW = MappingProxyType(DEFAULT_CONFIG)
 
 # Export for backward compatibility
 def get_default_config():
     """Get the default configuration dictionary."""
     return DEFAULT_CONFIG.copy()
 
+def get_default_config_view():
+    """Get a read-only view of the default configuration without copying it."""
+    return DEFAULT_CONFIG_VIEW
+
 def update_default_config(updates):
     """Update default configuration with new values."""
     global DEFAULT_CONFIG
@@ -9,45 +9,139 @@ choosing between Claude models (Haiku, Sonnet, Opus) based on:
 - Performance needs
 """
 
-from enum import Enum
-from typing import Dict, Any, Optional, Tuple
+from collections import deque
+from dataclasses import dataclass
+from enum import IntEnum
+from types import MappingProxyType
+from typing import ClassVar, Dict, Any, List, Optional, Tuple
 import logging
+import threading
+import time
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Number of recent runs averaged into a model/task's performance metrics
+PERFORMANCE_WINDOW = 10
 
-class TaskComplexity(Enum):
-    """Defines different levels of task complexity for model selection."""
-    SIMPLE = "simple"          # Basic data retrieval, simple calculations
-    MODERATE = "moderate"      # Analysis, pattern recognition, moderate reasoning
-    COMPLEX = "complex"        # Deep analysis, multi-step reasoning, trading decisions
-    CRITICAL = "critical"      # High-stakes decisions, comprehensive analysis
+# Seconds the wall-clock hour used for off-peak checks is reused
+HOUR_CACHE_TTL = 60.0
 
 
-class ModelTier(Enum):
-    """Available Claude model tiers with their characteristics."""
-    HAIKU = {
-        "model_id": "claude-3-5-haiku-latest",
-        "cost": "low",
-        "speed": "fast",
-        "reasoning": "basic",
-        "use_case": "Simple tasks, data formatting, quick responses"
-    }
-    SONNET = {
-        "model_id": "claude-3-5-sonnet-latest",
-        "cost": "medium",
-        "speed": "medium",
-        "reasoning": "advanced",
-        "use_case": "Analysis, research, moderate complexity reasoning"
-    }
-    OPUS = {
-        "model_id": "claude-opus-4-0",
-        "cost": "high",
-        "speed": "slow",
-        "reasoning": "superior",
-        "use_case": "Complex analysis, critical decisions, deep reasoning"
-    }
+class TaskComplexity(IntEnum):
+    """
+    Defines different levels of task complexity for model selection.
+
+    Values are consecutive from 0 so a complexity can index a tuple directly.
+    """
+    SIMPLE = 0      # Basic data retrieval, simple calculations
+    MODERATE = 1    # Analysis, pattern recognition, moderate reasoning
+    COMPLEX = 2     # Deep analysis, multi-step reasoning, trading decisions
+    CRITICAL = 3    # High-stakes decisions, comprehensive analysis
+
+    @property
+    def label(self) -> str:
+        """Lower-case name used in reasoning and logs, e.g. 'simple'."""
+        return self.name.lower()
+
+
+# Context adjustments as (context key, trigger value, {base complexity: adjusted}).
+# A trigger of True matches any truthy value. Rules are checked in order and the
+# first one that matches both the context and the base complexity applies.
+_CONTEXT_RULES = (
+    # Market volatility factor
+    ("market_volatility", "high", {
+        TaskComplexity.COMPLEX: TaskComplexity.CRITICAL,
+        TaskComplexity.MODERATE: TaskComplexity.CRITICAL,
+    }),
+    # Data volume factor
+    ("data_volume", "large", {TaskComplexity.MODERATE: TaskComplexity.COMPLEX}),
+    # Time sensitivity factor: use faster Sonnet instead of Opus
+    ("time_sensitive", True, {TaskComplexity.CRITICAL: TaskComplexity.COMPLEX}),
+    # Multi-agent coordination factor
+    ("multi_agent_task", True, {TaskComplexity.SIMPLE: TaskComplexity.MODERATE}),
+)
+
+# Context keys that can affect a selection; contexts without any of them
+# select exactly as if no context were given
+_CONTEXT_KEYS = frozenset(key for key, _, _ in _CONTEXT_RULES)
+
+
+def _context_flags(context: Dict[str, Any]) -> int:
+    """Bitmask of the _CONTEXT_RULES triggered by a context (bit i for rule i)."""
+    flags = 0
+    for bit, (key, trigger, _) in enumerate(_CONTEXT_RULES):
+        value = context.get(key)
+        if bool(value) if trigger is True else value == trigger:
+            flags |= 1 << bit
+    return flags
+
+
+def _apply_context_rules(base_complexity: TaskComplexity, flags: int) -> TaskComplexity:
+    """Complexity after the first triggered rule that applies to base_complexity."""
+    for bit, (_, _, adjustments) in enumerate(_CONTEXT_RULES):
+        if flags >> bit & 1 and base_complexity in adjustments:
+            return adjustments[base_complexity]
+    return base_complexity
+
+
+# Adjusted complexity for every base complexity and context flag combination,
+# indexed as _ADJUSTED_COMPLEXITY[base_complexity][flags]
+_ADJUSTED_COMPLEXITY = tuple(
+    tuple(_apply_context_rules(base, flags) for flags in range(1 << len(_CONTEXT_RULES)))
+    for base in TaskComplexity
+)
+
+
+@dataclass(frozen=True, slots=True)
+class ModelSpec:
+    """A Claude model tier and its characteristics."""
+    name: str
+    model_id: str
+    cost: str
+    speed: str
+    reasoning: str
+    use_case: str
+
+
+HAIKU = ModelSpec(
+    name="HAIKU",
+    model_id="claude-3-5-haiku-latest",
+    cost="low",
+    speed="fast",
+    reasoning="basic",
+    use_case="Simple tasks, data formatting, quick responses"
+)
+SONNET = ModelSpec(
+    name="SONNET",
+    model_id="claude-3-5-sonnet-latest",
+    cost="medium",
+    speed="medium",
+    reasoning="advanced",
+    use_case="Analysis, research, moderate complexity reasoning"
+)
+OPUS = ModelSpec(
+    name="OPUS",
+    model_id="claude-opus-4-0",
+    cost="high",
+    speed="slow",
+    reasoning="superior",
+    use_case="Complex analysis, critical decisions, deep reasoning"
+)
+
+HAIKU_ID = HAIKU.model_id
+SONNET_ID = SONNET.model_id
+OPUS_ID = OPUS.model_id
+
+# Tier metadata by model id, e.g. to report the cost of a selected model
+MODEL_SPECS: Dict[str, ModelSpec] = {spec.model_id: spec for spec in (HAIKU, SONNET, OPUS)}
+
+
+class ModelTier:
+    """Available Claude model tiers as plain class attributes (ModelTier.HAIKU is HAIKU)."""
+    HAIKU = HAIKU
+    SONNET = SONNET
+    OPUS = OPUS
 
 
 class DynamicModelSelector:
@@ -56,13 +150,39 @@ class DynamicModelSelector:
     for different trading agent tasks.
     """
 
+    # Recommended model per agent role, shared by all selectors
+    _AGENT_MODEL_MAP: ClassVar[Dict[str, str]] = {
+        # Simple agents use Haiku
+        "data_fetcher": HAIKU_ID,
+        "formatter": HAIKU_ID,
+
+        # Analysis agents use Sonnet
+        "market_analyst": SONNET_ID,
+        "news_analyst": SONNET_ID,
+        "social_analyst": SONNET_ID,
+        "fundamentals_analyst": SONNET_ID,
+        "bull_researcher": SONNET_ID,
+        "bear_researcher": SONNET_ID,
+
+        # Decision agents use Opus for critical thinking
+        "investment_judge": OPUS_ID,
+        "risk_manager": OPUS_ID,
+        "portfolio_manager": OPUS_ID,
+        "trader": SONNET_ID,  # Sonnet for speed in execution
+    }
+
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self.usage_stats = {}
+        self._total_selections = 0
+        # Guards usage_stats and performance_history, which threads may update concurrently
+        self._stats_lock = threading.Lock()
         self.performance_history = {}
+        # (time.monotonic() when read, hour) for the off-peak check
+        self._hour_cache = (float("-inf"), -1)
 
-        # Task-to-complexity mapping
-        self.task_complexity_map = {
+        # Task-to-complexity mapping; read-only, as _task_selections is derived from it
+        self.task_complexity_map = MappingProxyType({
             # Simple tasks - use Haiku
             "data_retrieval": TaskComplexity.SIMPLE,
             "data_formatting": TaskComplexity.SIMPLE,
@@ -87,15 +207,30 @@ class DynamicModelSelector:
             "portfolio_allocation": TaskComplexity.CRITICAL,
             "risk_management_decision": TaskComplexity.CRITICAL,
             "judge_final_verdict": TaskComplexity.CRITICAL,
-        }
+        })
 
         # Model selection strategy
         self.complexity_to_model = {
-            TaskComplexity.SIMPLE: ModelTier.HAIKU,
-            TaskComplexity.MODERATE: ModelTier.SONNET,
-            TaskComplexity.COMPLEX: ModelTier.SONNET,  # Use high-performance Sonnet
-            TaskComplexity.CRITICAL: ModelTier.OPUS,   # Use Opus for critical decisions
+            TaskComplexity.SIMPLE: HAIKU,
+            TaskComplexity.MODERATE: SONNET,
+            TaskComplexity.COMPLEX: SONNET,  # Use high-performance Sonnet
+            TaskComplexity.CRITICAL: OPUS,   # Use Opus for critical decisions
         }
+        # The same strategy indexed by complexity, for the per-selection lookup
+        self._complexity_models = tuple(self.complexity_to_model[c] for c in TaskComplexity)
+
+        # Without context a task always resolves to the same complexity, model
+        # and reasoning, so resolve each known task once up front
+        self._task_selections = {}
+        # Selections for known tasks under context, keyed by (task_type, context flags)
+        self._context_selections = {}
+        for task_type, complexity in self.task_complexity_map.items():
+            selected_model = self.complexity_to_model[complexity]
+            self._task_selections[task_type] = (
+                complexity,
+                selected_model.model_id,
+                self._generate_selection_reasoning(task_type, complexity, selected_model, None)
+            )
 
         # Performance thresholds for dynamic adjustment
         self.performance_thresholds = {
@@ -124,22 +259,67 @@ class DynamicModelSelector:
         if force_model:
             return force_model, f"Forced selection: {force_model}"
 
-        # Get task complexity
-        complexity = self.task_complexity_map.get(task_type, TaskComplexity.MODERATE)
+        return self._select(task_type, context, self._current_hour())
 
-        # Apply dynamic adjustments based on context
-        if context:
-            complexity = self._adjust_complexity_for_context(complexity, context)
+    def select_models_for_tasks(
+        self,
+        tasks: List[Tuple[str, Optional[Dict[str, Any]]]]
+    ) -> List[Tuple[str, str]]:
+        """
+        Select models for several tasks at once, e.g. every agent in a pipeline.
+
+        Equivalent to calling select_model_for_task for each task, but the
+        clock is read once for the whole batch.
+
+        Args:
+            tasks: (task_type, context) pairs; context may be None
+
+        Returns:
+            List of (model_id, reasoning) tuples in the order of tasks
+        """
+        current_hour = self._current_hour()
+        select = self._select
+        return [select(task_type, context, current_hour) for task_type, context in tasks]
+
+    def _select(
+        self,
+        task_type: str,
+        context: Optional[Dict[str, Any]],
+        current_hour: int
+    ) -> Tuple[str, str]:
+        """Select and log the model for one task; see select_model_for_task."""
+        # A selection depends only on the task and which context rules fire
+        # (the reasoning names only rule triggers), so both are memoized per flags
+        if not context or context.keys().isdisjoint(_CONTEXT_KEYS):
+            flags = 0
+        else:
+            flags = _context_flags(context)
+        if flags:
+            selection = self._context_selections.get((task_type, flags))
+        else:
+            selection = self._task_selections.get(task_type)
+
+        if selection is None:
+            # Get task complexity and apply dynamic adjustments based on context
+            base_complexity = self.task_complexity_map.get(task_type, TaskComplexity.MODERATE)
+            complexity = _ADJUSTED_COMPLEXITY[base_complexity][flags]
+
+            # Select model based on complexity
+            selected_model = self._complexity_models[complexity]
+            selection = (
+                complexity,
+                selected_model.model_id,
+                self._generate_selection_reasoning(task_type, complexity, selected_model, context)
+            )
+            # Only known tasks are memoized, which bounds the table
+            if flags and task_type in self.task_complexity_map:
+                self._context_selections[(task_type, flags)] = selection
 
-        # Select model based on complexity
-        selected_model = self.complexity_to_model[complexity]
-        model_id = selected_model.value["model_id"]
+        complexity, model_id, reasoning = selection
 
         # Apply cost optimization if enabled
         if self.performance_thresholds["cost_optimization_enabled"]:
-            model_id = self._apply_cost_optimization(model_id, task_type, context)
-
-        reasoning = self._generate_selection_reasoning(task_type, complexity, selected_model, context)
+            model_id = self._apply_cost_optimization(model_id, task_type, context, current_hour)
 
         # Log the selection
         self._log_model_selection(task_type, model_id, complexity, reasoning)
@@ -152,70 +332,59 @@ class DynamicModelSelector:
         context: Dict[str, Any]
     ) -> TaskComplexity:
         """Adjust complexity based on contextual factors."""
-
-        # Market volatility factor
-        if context.get("market_volatility") == "high":
-            if base_complexity in [TaskComplexity.COMPLEX, TaskComplexity.MODERATE]:
-                return TaskComplexity.CRITICAL
-
-        # Data volume factor
-        data_volume = context.get("data_volume", "medium")
-        if data_volume == "large" and base_complexity == TaskComplexity.MODERATE:
-            return TaskComplexity.COMPLEX
-
-        # Time sensitivity factor
-        if context.get("time_sensitive", False):
-            if base_complexity == TaskComplexity.CRITICAL:
-                return TaskComplexity.COMPLEX  # Use faster Sonnet instead of Opus
-
-        # Multi-agent coordination factor
-        if context.get("multi_agent_task", False):
-            if base_complexity == TaskComplexity.SIMPLE:
-                return TaskComplexity.MODERATE
-
-        return base_complexity
+        if context.keys().isdisjoint(_CONTEXT_KEYS):
+            return base_complexity
+        return _ADJUSTED_COMPLEXITY[base_complexity][_context_flags(context)]
 
     def _apply_cost_optimization(
         self,
         model_id: str,
         task_type: str,
-        context: Optional[Dict[str, Any]]
+        context: Optional[Dict[str, Any]],
+        current_hour: Optional[int] = None
     ) -> str:
         """Apply cost optimization strategies."""
 
         # Check if we can use a cheaper model based on recent performance
-        if model_id == ModelTier.OPUS.value["model_id"]:
+        if model_id == OPUS_ID:
             # Check if Sonnet has been performing well for similar tasks
-            sonnet_performance = self._get_recent_performance(
-                ModelTier.SONNET.value["model_id"],
-                task_type
-            )
+            sonnet_performance = self._get_recent_performance(SONNET_ID, task_type)
             if sonnet_performance and sonnet_performance > self.performance_thresholds["accuracy_threshold"]:
-                logger.info(f"Cost optimization: Using Sonnet instead of Opus for {task_type}")
-                return ModelTier.SONNET.value["model_id"]
+                logger.info("Cost optimization: Using Sonnet instead of Opus for %s", task_type)
+                return SONNET_ID
 
         # During off-peak hours, we might use higher-tier models for better results
-        current_hour = datetime.now().hour
+        if current_hour is None:
+            current_hour = self._current_hour()
         if 2 <= current_hour <= 6:  # Off-peak hours
-            if model_id == ModelTier.HAIKU.value["model_id"]:
-                logger.info(f"Off-peak optimization: Upgrading to Sonnet for {task_type}")
-                return ModelTier.SONNET.value["model_id"]
+            if model_id == HAIKU_ID:
+                logger.info("Off-peak optimization: Upgrading to Sonnet for %s", task_type)
+                return SONNET_ID
 
         return model_id
 
+    def _current_hour(self) -> int:
+        """Current local hour, re-read from the clock at most every HOUR_CACHE_TTL seconds."""
+        now = time.monotonic()
+        cached_at, hour = self._hour_cache
+        if now - cached_at > HOUR_CACHE_TTL:
+            hour = datetime.now().hour
+            self._hour_cache = (now, hour)
+        return hour
+
     def _generate_selection_reasoning(
         self,
         task_type: str,
         complexity: TaskComplexity,
-        selected_model: ModelTier,
+        selected_model: ModelSpec,
         context: Optional[Dict[str, Any]]
     ) -> str:
         """Generate human-readable reasoning for model selection."""
 
         reasoning_parts = [
-            f"Task '{task_type}' classified as {complexity.value} complexity",
-            f"Selected {selected_model.name} model ({selected_model.value['model_id']})",
-            f"Reasoning: {selected_model.value['use_case']}"
+            f"Task '{task_type}' classified as {complexity.label} complexity",
+            f"Selected {selected_model.name} model ({selected_model.model_id})",
+            f"Reasoning: {selected_model.use_case}"
         ]
 
         if context:
@@ -234,8 +403,8 @@ class DynamicModelSelector:
 
     def _get_recent_performance(self, model_id: str, task_type: str) -> Optional[float]:
         """Get recent performance metrics for a model-task combination."""
-        key = f"{model_id}_{task_type}"
-        return self.performance_history.get(key, {}).get("recent_accuracy")
+        history = self.performance_history.get((model_id, task_type))
+        return None if history is None else history["recent_accuracy"]
 
     def _log_model_selection(
         self,
@@ -246,31 +415,35 @@ class DynamicModelSelector:
     ):
         """Log model selection for analytics and debugging."""
 
-        log_entry = {
-            "timestamp": datetime.now().isoformat(),
-            "task_type": task_type,
-            "selected_model": model_id,
-            "complexity": complexity.value,
-            "reasoning": reasoning
-        }
-
         # Update usage statistics
-        if model_id not in self.usage_stats:
-            self.usage_stats[model_id] = {"count": 0, "tasks": {}}
-        self.usage_stats[model_id]["count"] += 1
-
-        if task_type not in self.usage_stats[model_id]["tasks"]:
-            self.usage_stats[model_id]["tasks"][task_type] = 0
-        self.usage_stats[model_id]["tasks"][task_type] += 1
-
-        logger.info(f"Model selection: {reasoning}")
+        with self._stats_lock:
+            if model_id not in self.usage_stats:
+                self.usage_stats[model_id] = {"count": 0, "tasks": {}}
+            self.usage_stats[model_id]["count"] += 1
+            self._total_selections += 1
+
+            if task_type not in self.usage_stats[model_id]["tasks"]:
+                self.usage_stats[model_id]["tasks"][task_type] = 0
+            self.usage_stats[model_id]["tasks"][task_type] += 1
+
+        logger.info("Model selection: %s", reasoning)
+
+        # Structured record for debugging; the timestamp is only taken when emitted
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Model selection record: %s", {
+                "timestamp": datetime.now().isoformat(),
+                "task_type": task_type,
+                "selected_model": model_id,
+                "complexity": complexity.label,
+                "reasoning": reasoning
+            })
 
     def get_usage_statistics(self) -> Dict[str, Any]:
         """Get current usage statistics for analysis."""
         return {
             "usage_stats": self.usage_stats,
             "performance_history": self.performance_history,
-            "total_selections": sum(stats["count"] for stats in self.usage_stats.values())
+            "total_selections": self._total_selections
         }
 
     def update_performance_metrics(
@@ -281,51 +454,45 @@ class DynamicModelSelector:
         response_time: float
     ):
         """Update performance metrics for continuous improvement."""
-        key = f"{model_id}_{task_type}"
-
-        if key not in self.performance_history:
-            self.performance_history[key] = {
-                "accuracy_history": [],
-                "response_time_history": [],
-                "recent_accuracy": 0.0,
-                "recent_response_time": 0.0
-            }
-
-        history = self.performance_history[key]
-        history["accuracy_history"].append(accuracy)
-        history["response_time_history"].append(response_time)
-
-        # Keep only recent history (last 10 runs)
-        if len(history["accuracy_history"]) > 10:
-            history["accuracy_history"] = history["accuracy_history"][-10:]
-        if len(history["response_time_history"]) > 10:
-            history["response_time_history"] = history["response_time_history"][-10:]
-
-        # Calculate recent averages
-        history["recent_accuracy"] = sum(history["accuracy_history"]) / len(history["accuracy_history"])
-        history["recent_response_time"] = sum(history["response_time_history"]) / len(history["response_time_history"])
+        key = (model_id, task_type)
+
+        with self._stats_lock:
+            if key not in self.performance_history:
+                self.performance_history[key] = {
+                    # Bounded deques keep only the last PERFORMANCE_WINDOW runs
+                    "accuracy_history": deque(maxlen=PERFORMANCE_WINDOW),
+                    "response_time_history": deque(maxlen=PERFORMANCE_WINDOW),
+                    "accuracy_sum": 0.0,
+                    "response_time_sum": 0.0,
+                    "updates": 0,
+                    "recent_accuracy": 0.0,
+                    "recent_response_time": 0.0
+                }
+
+            history = self.performance_history[key]
+            accuracy_history = history["accuracy_history"]
+            response_time_history = history["response_time_history"]
+
+            # Maintain running sums, dropping the run a full window is about to evict
+            if len(accuracy_history) == PERFORMANCE_WINDOW:
+                history["accuracy_sum"] -= accuracy_history[0]
+                history["response_time_sum"] -= response_time_history[0]
+            accuracy_history.append(accuracy)
+            response_time_history.append(response_time)
+            history["accuracy_sum"] += accuracy
+            history["response_time_sum"] += response_time
+
+            # Re-sum once per full window so rounding error in the running sums
+            # cannot accumulate; amortized this stays O(1) per update
+            history["updates"] += 1
+            if history["updates"] % PERFORMANCE_WINDOW == 0:
+                history["accuracy_sum"] = sum(accuracy_history)
+                history["response_time_sum"] = sum(response_time_history)
+
+            # Calculate recent averages
+            history["recent_accuracy"] = history["accuracy_sum"] / len(accuracy_history)
+            history["recent_response_time"] = history["response_time_sum"] / len(response_time_history)
 
     def get_recommended_model_for_agent(self, agent_role: str) -> str:
         """Get recommended model for specific agent roles."""
-
-        agent_model_map = {
-            # Simple agents use Haiku
-            "data_fetcher": ModelTier.HAIKU.value["model_id"],
-            "formatter": ModelTier.HAIKU.value["model_id"],
-
-            # Analysis agents use Sonnet
-            "market_analyst": ModelTier.SONNET.value["model_id"],
-            "news_analyst": ModelTier.SONNET.value["model_id"],
-            "social_analyst": ModelTier.SONNET.value["model_id"],
-            "fundamentals_analyst": ModelTier.SONNET.value["model_id"],
-            "bull_researcher": ModelTier.SONNET.value["model_id"],
-            "bear_researcher": ModelTier.SONNET.value["model_id"],
-
-            # Decision agents use Opus for critical thinking
-            "investment_judge": ModelTier.OPUS.value["model_id"],
-            "risk_manager": ModelTier.OPUS.value["model_id"],
-            "portfolio_manager": ModelTier.OPUS.value["model_id"],
-            "trader": ModelTier.SONNET.value["model_id"],  # Sonnet for speed in execution
-        }
-
-        return agent_model_map.get(agent_role, ModelTier.SONNET.value["model_id"])
\ No newline at end of file
+        return self._AGENT_MODEL_MAP.get(agent_role, SONNET_ID)
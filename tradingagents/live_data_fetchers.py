@@ -2,12 +2,151 @@
 Live data fetchers for Finnhub and Reddit APIs.
 """
 
+import heapq
 import os
+import re
+import time
+import threading
 import praw
 import finnhub
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime, timedelta
 from typing import List, Dict, Any
 import json
+from collections import OrderedDict
+from functools import lru_cache
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import chain, islice
+from operator import itemgetter
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+    # ijson is optional - responses are decoded whole with response.json() instead
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    # orjson is optional - the standard json module is used instead
+
+# YYYY-MM-DD request dates; like strptime, month and day may be unpadded
+_DATE_RE = re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2})")
+
+
+def _parse_ymd(value: str) -> datetime:
+    """Parse a YYYY-MM-DD date without strptime's per-call format parsing."""
+    match = _DATE_RE.fullmatch(value)
+    if match:
+        try:
+            return datetime(int(match[1]), int(match[2]), int(match[3]))
+        except ValueError:
+            pass
+    # Anything unusual goes through strptime for its exact behaviour and errors
+    return datetime.strptime(value, "%Y-%m-%d")
+
+
+def _json_loads(data) -> Any:
+    """Parse a JSON response body from bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _orjson_response_hook(response, *args, **kwargs):
+    """Decode JSON bodies with orjson when the Finnhub SDK calls response.json()."""
+    response.json = lambda **_: orjson.loads(response.content)
+    return response
+
+
+# Connection pool sizing for the live data APIs; calls to the same host
+# reuse keep-alive connections instead of paying a TCP/TLS handshake each
+HTTP_POOL_CONNECTIONS = 4
+HTTP_POOL_MAXSIZE = 32
+
+
+def _pooled_adapter() -> HTTPAdapter:
+    """Build an HTTPS adapter with a sized connection pool and retries on transient errors."""
+    retry = Retry(total=2, backoff_factor=0.3, status_forcelist=(429, 502, 503))
+    return HTTPAdapter(
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        max_retries=retry
+    )
+
+
+# One adapter (and so one pool manager) shared by the Finnhub and Reddit sessions.
+# The sessions themselves stay separate: Finnhub's carries the API token as a
+# default query parameter, which must not be sent to Reddit.
+_SHARED_ADAPTER = _pooled_adapter()
+
+
+# Process-wide LRU of Finnhub responses keyed by (call name, args). Agents query the
+# same tickers repeatedly within a session: quotes are reused briefly, news and
+# fundamentals for longer. Failed calls are never cached.
+QUOTE_CACHE_TTL = 30  # seconds
+DATA_CACHE_TTL = 900  # seconds
+FINNHUB_CACHE_SIZE = 512
+_response_cache = OrderedDict()
+_response_cache_lock = threading.Lock()
+
+
+# Requests in progress. Concurrent identical requests (several agents asking for
+# the same quote or subreddit at once) wait for the first one's result instead
+# of issuing their own.
+_inflight = {}
+_inflight_lock = threading.Lock()
+
+
+def _clear_response_cache():
+    """Drop all cached Finnhub responses."""
+    with _response_cache_lock:
+        _response_cache.clear()
+
+
+def _cached_response(key, ttl: float):
+    """Return the (timestamp, response) cache entry for key if younger than ttl, else None."""
+    with _response_cache_lock:
+        hit = _response_cache.get(key)
+        if hit is not None and time.time() - hit[0] < ttl:
+            _response_cache.move_to_end(key)
+            return hit
+    return None
+
+
+def _single_flight(key, fn, *args, **kwargs):
+    """Run fn(*args, **kwargs) once for all concurrent callers sharing key."""
+    with _inflight_lock:
+        future = _inflight.get(key)
+        owner = future is None
+        if owner:
+            future = _inflight[key] = Future()
+
+    if not owner:
+        # Re-raises the first caller's exception, if any
+        return future.result()
+
+    try:
+        result = fn(*args, **kwargs)
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        with _inflight_lock:
+            del _inflight[key]
+
+
+# Reports returned when a client is not configured
+_FINNHUB_UNAVAILABLE = "Finnhub API not available (no API key). Please set FINNHUB_API_KEY environment variable."
+_REDDIT_UNAVAILABLE = "Reddit API not available. Please configure Reddit API credentials."
 
 
 class LiveFinnhubFetcher:
@@ -15,12 +154,14 @@ class LiveFinnhubFetcher:
 
     def __init__(self, config=None):
         # Get API key from environment configuration
-        if config:
-            self.api_key = config.get("finnhub_api_key")
-        else:
+        if not config:
             from .env_config import get_env_config
-            env_config = get_env_config()
-            self.api_key = env_config.get("finnhub_api_key")
+            config = get_env_config()
+        self.api_key = config.get("finnhub_api_key")
+
+        # How long responses are reused, in seconds; 0 disables caching
+        self.quote_cache_ttl = config.get("finnhub_quote_cache_ttl", QUOTE_CACHE_TTL)
+        self.data_cache_ttl = config.get("finnhub_data_cache_ttl", DATA_CACHE_TTL)
 
         if not self.api_key:
             print("Warning: FINNHUB_API_KEY not configured. Live data will be unavailable.")
@@ -29,11 +170,98 @@ class LiveFinnhubFetcher:
 
         try:
             self.client = finnhub.Client(api_key=self.api_key)
+            # The client keeps one requests.Session for its lifetime; give it a pooled adapter
+            self.client._session.mount("https://", _SHARED_ADAPTER)
+            if ORJSON_AVAILABLE:
+                self.client._session.hooks["response"].append(_orjson_response_hook)
             print(f"✅ Finnhub client initialized with API key: {self.api_key[:10]}...")
         except Exception as e:
             print(f"Error initializing Finnhub client: {e}")
             self.client = None
 
+    def _call(self, ttl: float, fn, *args, **kwargs):
+        """Call a Finnhub request function, reusing a cached response younger than ttl seconds."""
+        key = (fn.__name__, args, tuple(sorted(kwargs.items())))
+        if ttl > 0:
+            hit = _cached_response(key, ttl)
+            if hit is not None:
+                return hit[1]
+        return _single_flight(key, self._fetch, key, ttl, fn, args, kwargs)
+
+    def _fetch(self, key, ttl: float, fn, args, kwargs):
+        """Issue a Finnhub request and cache its response."""
+        if ttl > 0:
+            # A request that just finished may have filled the cache
+            hit = _cached_response(key, ttl)
+            if hit is not None:
+                return hit[1]
+
+        response = fn(*args, **kwargs)
+
+        if ttl > 0:
+            with _response_cache_lock:
+                _response_cache[key] = (time.time(), response)
+                _response_cache.move_to_end(key)
+                while len(_response_cache) > FINNHUB_CACHE_SIZE:
+                    _response_cache.popitem(last=False)
+        return response
+
+    def _get_items(self, path: str, params: Dict[str, Any], prefix: str, limit: int) -> List[Dict[str, Any]]:
+        """GET a Finnhub endpoint and return the first `limit` items of the JSON array at prefix.
+
+        With ijson the body is parsed incrementally and reading stops once
+        `limit` items are decoded, instead of building every item in the payload.
+        """
+        response = self.client._session.get(
+            f"{self.client.API_URL}{path}",
+            params=params,
+            timeout=self.client.DEFAULT_TIMEOUT,
+            stream=True
+        )
+        with response:
+            if not response.ok:
+                raise finnhub.FinnhubAPIException(response)
+
+            if IJSON_AVAILABLE:
+                response.raw.decode_content = True
+                return list(islice(ijson.items(response.raw, prefix, use_float=True), limit))
+
+            data = _json_loads(response.content)
+            for field in prefix.split(".")[:-1]:
+                data = data.get(field) or []
+            return data[:limit]
+
+    def _company_news(self, symbol: str, _from, to, limit: int) -> List[Dict[str, Any]]:
+        """Fetch at most `limit` company news articles."""
+        return self._get_items(
+            "/company-news", {"symbol": symbol, "from": _from, "to": to}, "item", limit
+        )
+
+    def _earnings_calendar(self, symbol: str, _from: str, to: str, limit: int) -> List[Dict[str, Any]]:
+        """Fetch at most `limit` earnings calendar entries."""
+        return self._get_items(
+            "/calendar/earnings", {"symbol": symbol, "from": _from, "to": to}, "earningsCalendar.item", limit
+        )
+
+    def _batch_quote(self, tickers: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Fetch quotes for several tickers in one fan-out.
+
+        Finnhub's /quote takes a single symbol, so the requests are issued
+        concurrently over the pooled keep-alive session. Tickers whose quote
+        fails are left out of the result.
+        """
+        with ThreadPoolExecutor(max_workers=len(tickers)) as executor:
+            futures = {ticker: executor.submit(self._call, self.quote_cache_ttl, self.client.quote, ticker)
+                       for ticker in tickers}
+
+        quotes = {}
+        for ticker, future in futures.items():
+            try:
+                quotes[ticker] = future.result()
+            except Exception:
+                continue
+        return quotes
+
     def get_company_news(self, ticker: str, start_date: str, end_date: str) -> str:
         """
         Get live company news from Finnhub.
@@ -47,47 +275,39 @@ class LiveFinnhubFetcher:
             Formatted string of news articles
         """
         if not self.client:
-            return f"Finnhub API not available (no API key). Please set FINNHUB_API_KEY environment variable."
+            return _FINNHUB_UNAVAILABLE
 
         try:
             # Convert dates to datetime objects for API
-            start_dt = datetime.strptime(start_date, "%Y-%m-%d")
-            end_dt = datetime.strptime(end_date, "%Y-%m-%d")
+            start_dt = _parse_ymd(start_date)
+            end_dt = _parse_ymd(end_date)
 
             # Finnhub company_news expects date strings, but let's try both formats
             try:
                 # First try with date strings
-                news = self.client.company_news(ticker, _from=start_date, to=end_date)
+                news = self._call(self.data_cache_ttl, self._company_news, ticker, start_date, end_date, 10)
             except Exception as e1:
                 # If that fails, try with Unix timestamps
                 from_timestamp = int(start_dt.timestamp())
                 to_timestamp = int(end_dt.timestamp())
-                news = self.client.company_news(ticker, _from=from_timestamp, to=to_timestamp)
+                news = self._call(self.data_cache_ttl, self._company_news, ticker, from_timestamp, to_timestamp, 10)
 
             if not news:
                 return f"No news found for {ticker} between {start_date} and {end_date}"
 
-            # Format the results
-            formatted_news = []
-            for article in news[:10]:  # Limit to 10 articles
-                formatted_article = {
-                    'headline': article.get('headline', 'N/A'),
-                    'summary': article.get('summary', 'N/A'),
-                    'source': article.get('source', 'N/A'),
-                    'datetime': datetime.fromtimestamp(article.get('datetime', 0)).strftime('%Y-%m-%d %H:%M:%S'),
-                    'url': article.get('url', 'N/A')
-                }
-                formatted_news.append(formatted_article)
-
-            # Convert to readable format
-            result = f"=== FINNHUB NEWS for {ticker} ({start_date} to {end_date}) ===\n\n"
-            for i, article in enumerate(formatted_news, 1):
-                result += f"{i}. {article['headline']}\n"
-                result += f"   Source: {article['source']} | Date: {article['datetime']}\n"
-                result += f"   Summary: {article['summary']}\n"
-                result += f"   URL: {article['url']}\n\n"
+            # Format the results in a single pass
+            parts = [f"=== FINNHUB NEWS for {ticker} ({start_date} to {end_date}) ===", ""]
+            for i, article in enumerate(news, 1):  # At most 10 articles are fetched
+                parts.extend((
+                    f"{i}. {article.get('headline', 'N/A')}",
+                    f"   Source: {article.get('source', 'N/A')} | "
+                    f"Date: {datetime.fromtimestamp(article.get('datetime', 0)):%Y-%m-%d %H:%M:%S}",
+                    f"   Summary: {article.get('summary', 'N/A')}",
+                    f"   URL: {article.get('url', 'N/A')}",
+                    "",
+                ))
 
-            return result
+            return "\n".join(parts) + "\n"
 
         except Exception as e:
             return f"Error fetching Finnhub news for {ticker}: {str(e)}"
@@ -95,30 +315,33 @@ class LiveFinnhubFetcher:
     def get_insider_transactions(self, ticker: str, start_date: str, end_date: str) -> str:
         """Get insider transactions from Finnhub."""
         if not self.client:
-            return f"Finnhub API not available (no API key). Please set FINNHUB_API_KEY environment variable."
+            return _FINNHUB_UNAVAILABLE
 
         try:
-            start_dt = datetime.strptime(start_date, "%Y-%m-%d")
-            end_dt = datetime.strptime(end_date, "%Y-%m-%d")
+            start_dt = _parse_ymd(start_date)
+            end_dt = _parse_ymd(end_date)
 
-            from_date = start_dt.strftime("%Y-%m-%d")
-            to_date = end_dt.strftime("%Y-%m-%d")
+            from_date = f"{start_dt:%Y-%m-%d}"
+            to_date = f"{end_dt:%Y-%m-%d}"
 
             # Get insider transactions
-            transactions = self.client.stock_insider_transactions(ticker, from_date, to_date)
+            transactions = self._call(self.data_cache_ttl, self.client.stock_insider_transactions, ticker, from_date, to_date)
 
             if not transactions or not transactions.get('data'):
                 return f"No insider transactions found for {ticker} between {start_date} and {end_date}"
 
-            result = f"=== INSIDER TRANSACTIONS for {ticker} ({start_date} to {end_date}) ===\n\n"
+            parts = [f"=== INSIDER TRANSACTIONS for {ticker} ({start_date} to {end_date}) ===", ""]
 
             for i, trans in enumerate(transactions['data'][:10], 1):  # Limit to 10 transactions
-                result += f"{i}. {trans.get('name', 'N/A')} - {trans.get('title', 'N/A')}\n"
-                result += f"   Transaction Date: {trans.get('transactionDate', 'N/A')}\n"
-                result += f"   Shares: {trans.get('share', 'N/A')} | Price: ${trans.get('transactionPrice', 'N/A')}\n"
-                result += f"   Transaction Code: {trans.get('transactionCode', 'N/A')}\n\n"
+                parts.extend((
+                    f"{i}. {trans.get('name', 'N/A')} - {trans.get('title', 'N/A')}",
+                    f"   Transaction Date: {trans.get('transactionDate', 'N/A')}",
+                    f"   Shares: {trans.get('share', 'N/A')} | Price: ${trans.get('transactionPrice', 'N/A')}",
+                    f"   Transaction Code: {trans.get('transactionCode', 'N/A')}",
+                    "",
+                ))
 
-            return result
+            return "\n".join(parts) + "\n"
 
         except Exception as e:
             return f"Error fetching insider transactions for {ticker}: {str(e)}"
@@ -126,25 +349,27 @@ class LiveFinnhubFetcher:
     def get_real_time_quote(self, ticker: str) -> str:
         """Get real-time stock quote from Finnhub."""
         if not self.client:
-            return f"Finnhub API not available (no API key). Please set FINNHUB_API_KEY environment variable."
+            return _FINNHUB_UNAVAILABLE
 
         try:
-            quote = self.client.quote(ticker)
+            quote = self._call(self.quote_cache_ttl, self.client.quote, ticker)
 
             if not quote or 'c' not in quote:
                 return f"No quote data available for {ticker}"
 
-            result = f"=== REAL-TIME QUOTE for {ticker} ===\n\n"
-            result += f"Current Price: ${quote.get('c', 'N/A')}\n"
-            result += f"Change: ${quote.get('d', 'N/A')}\n"
-            result += f"Percent Change: {quote.get('dp', 'N/A')}%\n"
-            result += f"High: ${quote.get('h', 'N/A')}\n"
-            result += f"Low: ${quote.get('l', 'N/A')}\n"
-            result += f"Open: ${quote.get('o', 'N/A')}\n"
-            result += f"Previous Close: ${quote.get('pc', 'N/A')}\n"
-            result += f"Timestamp: {datetime.fromtimestamp(quote.get('t', 0)).strftime('%Y-%m-%d %H:%M:%S')}\n"
+            parts = [
+                f"=== REAL-TIME QUOTE for {ticker} ===", "",
+                f"Current Price: ${quote.get('c', 'N/A')}",
+                f"Change: ${quote.get('d', 'N/A')}",
+                f"Percent Change: {quote.get('dp', 'N/A')}%",
+                f"High: ${quote.get('h', 'N/A')}",
+                f"Low: ${quote.get('l', 'N/A')}",
+                f"Open: ${quote.get('o', 'N/A')}",
+                f"Previous Close: ${quote.get('pc', 'N/A')}",
+                f"Timestamp: {datetime.fromtimestamp(quote.get('t', 0)):%Y-%m-%d %H:%M:%S}",
+            ]
 
-            return result
+            return "\n".join(parts) + "\n"
 
         except Exception as e:
             return f"Error fetching real-time quote for {ticker}: {str(e)}"
@@ -152,44 +377,53 @@ class LiveFinnhubFetcher:
     def get_earnings_data(self, ticker: str) -> str:
         """Get earnings data and estimates from Finnhub."""
         if not self.client:
-            return f"Finnhub API not available (no API key). Please set FINNHUB_API_KEY environment variable."
+            return _FINNHUB_UNAVAILABLE
 
         try:
-            result = f"=== EARNINGS DATA for {ticker} ===\n\n"
+            parts = [f"=== EARNINGS DATA for {ticker} ===", ""]
 
             # Try to get earnings calendar (this method exists)
             try:
-                from_date = (datetime.now() - timedelta(days=90)).strftime("%Y-%m-%d")
-                to_date = (datetime.now() + timedelta(days=30)).strftime("%Y-%m-%d")
-
-                calendar = self.client.earnings_calendar(_from=from_date, to=to_date, symbol=ticker)
-
-                if calendar and calendar.get('earningsCalendar'):
-                    result += "Earnings Calendar:\n"
-                    for i, earning in enumerate(calendar['earningsCalendar'][:5], 1):
-                        result += f"{i}. Date: {earning.get('date', 'N/A')}\n"
-                        result += f"   EPS Estimate: ${earning.get('epsEstimate', 'N/A')}\n"
-                        result += f"   Revenue Estimate: ${earning.get('revenueEstimate', 'N/A')}\n"
-                        result += f"   Revenue Actual: ${earning.get('revenueActual', 'N/A')}\n\n"
+                now = datetime.now()
+                from_date = (now - timedelta(days=90)).strftime("%Y-%m-%d")
+                to_date = (now + timedelta(days=30)).strftime("%Y-%m-%d")
+
+                earnings = self._call(
+                    self.data_cache_ttl, self._earnings_calendar, ticker, from_date, to_date, 5
+                )
+
+                if earnings:
+                    parts.append("Earnings Calendar:")
+                    for i, earning in enumerate(earnings, 1):
+                        parts.extend((
+                            f"{i}. Date: {earning.get('date', 'N/A')}",
+                            f"   EPS Estimate: ${earning.get('epsEstimate', 'N/A')}",
+                            f"   Revenue Estimate: ${earning.get('revenueEstimate', 'N/A')}",
+                            f"   Revenue Actual: ${earning.get('revenueActual', 'N/A')}",
+                            "",
+                        ))
                 else:
-                    result += "No earnings calendar data available.\n"
+                    parts.append("No earnings calendar data available.")
             except Exception as e:
-                result += f"Could not fetch earnings calendar: {str(e)}\n"
+                parts.append(f"Could not fetch earnings calendar: {str(e)}")
 
             # Try to get basic earnings (earnings surprises)
             try:
-                surprises = self.client.earnings_surprises(ticker, limit=4)
+                surprises = self._call(self.data_cache_ttl, self.client.earnings_surprises, ticker, limit=4)
                 if surprises:
-                    result += "\nRecent Earnings Surprises:\n"
+                    parts.extend(("", "Recent Earnings Surprises:"))
                     for i, surprise in enumerate(surprises, 1):
-                        result += f"{i}. Period: {surprise.get('period', 'N/A')}\n"
-                        result += f"   Actual: ${surprise.get('actual', 'N/A')}\n"
-                        result += f"   Estimate: ${surprise.get('estimate', 'N/A')}\n"
-                        result += f"   Quarter: {surprise.get('quarter', 'N/A')}/{surprise.get('year', 'N/A')}\n\n"
+                        parts.extend((
+                            f"{i}. Period: {surprise.get('period', 'N/A')}",
+                            f"   Actual: ${surprise.get('actual', 'N/A')}",
+                            f"   Estimate: ${surprise.get('estimate', 'N/A')}",
+                            f"   Quarter: {surprise.get('quarter', 'N/A')}/{surprise.get('year', 'N/A')}",
+                            "",
+                        ))
             except Exception as e:
-                result += f"Could not fetch earnings surprises: {str(e)}\n"
+                parts.append(f"Could not fetch earnings surprises: {str(e)}")
 
-            return result
+            return "\n".join(parts) + "\n"
 
         except Exception as e:
             return f"Error fetching earnings data for {ticker}: {str(e)}"
@@ -197,25 +431,28 @@ class LiveFinnhubFetcher:
     def get_analyst_recommendations(self, ticker: str) -> str:
         """Get analyst recommendations from Finnhub."""
         if not self.client:
-            return f"Finnhub API not available (no API key). Please set FINNHUB_API_KEY environment variable."
+            return _FINNHUB_UNAVAILABLE
 
         try:
-            recommendations = self.client.recommendation_trends(ticker)
+            recommendations = self._call(self.data_cache_ttl, self.client.recommendation_trends, ticker)
 
             if not recommendations:
                 return f"No analyst recommendations available for {ticker}"
 
-            result = f"=== ANALYST RECOMMENDATIONS for {ticker} ===\n\n"
+            parts = [f"=== ANALYST RECOMMENDATIONS for {ticker} ===", ""]
 
             for i, rec in enumerate(recommendations[:6], 1):  # Last 6 periods
-                result += f"Period {i} ({rec.get('period', 'N/A')}):\n"
-                result += f"   Strong Buy: {rec.get('strongBuy', 0)}\n"
-                result += f"   Buy: {rec.get('buy', 0)}\n"
-                result += f"   Hold: {rec.get('hold', 0)}\n"
-                result += f"   Sell: {rec.get('sell', 0)}\n"
-                result += f"   Strong Sell: {rec.get('strongSell', 0)}\n\n"
-
-            return result
+                parts.extend((
+                    f"Period {i} ({rec.get('period', 'N/A')}):",
+                    f"   Strong Buy: {rec.get('strongBuy', 0)}",
+                    f"   Buy: {rec.get('buy', 0)}",
+                    f"   Hold: {rec.get('hold', 0)}",
+                    f"   Sell: {rec.get('sell', 0)}",
+                    f"   Strong Sell: {rec.get('strongSell', 0)}",
+                    "",
+                ))
+
+            return "\n".join(parts) + "\n"
 
         except Exception as e:
             return f"Error fetching analyst recommendations for {ticker}: {str(e)}"
@@ -223,34 +460,32 @@ class LiveFinnhubFetcher:
     def get_market_indicators(self) -> str:
         """Get general market indicators and indices."""
         if not self.client:
-            return f"Finnhub API not available (no API key). Please set FINNHUB_API_KEY environment variable."
+            return _FINNHUB_UNAVAILABLE
 
         try:
-            result = f"=== MARKET INDICATORS ===\n\n"
+            parts = [f"=== MARKET INDICATORS ===", ""]
 
             # Major indices
             indices = ["^GSPC", "^DJI", "^IXIC"]  # S&P 500, Dow, NASDAQ
             index_names = ["S&P 500", "Dow Jones", "NASDAQ"]
 
+            # One fan-out covers the indices and the VIX
+            quotes = self._batch_quote(indices + ["^VIX"])
+
             for ticker, name in zip(indices, index_names):
-                try:
-                    quote = self.client.quote(ticker)
-                    if quote and 'c' in quote:
-                        result += f"{name}: ${quote.get('c', 'N/A')} "
-                        result += f"({quote.get('dp', 'N/A')}%)\n"
-                except:
-                    continue
+                quote = quotes.get(ticker)
+                if quote and 'c' in quote:
+                    parts.append(f"{name}: ${quote.get('c', 'N/A')} ({quote.get('dp', 'N/A')}%)")
 
             # VIX Fear & Greed Index
-            try:
-                vix_quote = self.client.quote("^VIX")
-                if vix_quote and 'c' in vix_quote:
-                    result += f"\nVIX (Fear Index): {vix_quote.get('c', 'N/A')} "
-                    result += f"({vix_quote.get('dp', 'N/A')}%)\n"
-            except:
-                pass
+            vix_quote = quotes.get("^VIX")
+            if vix_quote and 'c' in vix_quote:
+                parts.extend((
+                    "",
+                    f"VIX (Fear Index): {vix_quote.get('c', 'N/A')} ({vix_quote.get('dp', 'N/A')}%)",
+                ))
 
-            return result
+            return "\n".join(parts) + "\n"
 
         except Exception as e:
             return f"Error fetching market indicators: {str(e)}"
@@ -258,10 +493,10 @@ class LiveFinnhubFetcher:
     def get_sector_performance(self) -> str:
         """Get sector performance data."""
         if not self.client:
-            return f"Finnhub API not available (no API key). Please set FINNHUB_API_KEY environment variable."
+            return _FINNHUB_UNAVAILABLE
 
         try:
-            result = f"=== SECTOR PERFORMANCE ===\n\n"
+            parts = [f"=== SECTOR PERFORMANCE ===", ""]
 
             # Common sector ETFs for performance tracking
             sectors = {
@@ -276,22 +511,25 @@ class LiveFinnhubFetcher:
                 "XLRE": "Real Estate"
             }
 
+            quotes = self._batch_quote(list(sectors))
+
             for etf, sector_name in sectors.items():
-                try:
-                    quote = self.client.quote(etf)
-                    if quote and 'c' in quote:
-                        result += f"{sector_name} ({etf}): "
-                        result += f"${quote.get('c', 'N/A')} "
-                        result += f"({quote.get('dp', 'N/A')}%)\n"
-                except:
-                    continue
+                quote = quotes.get(etf)
+                if quote and 'c' in quote:
+                    parts.append(f"{sector_name} ({etf}): ${quote.get('c', 'N/A')} ({quote.get('dp', 'N/A')}%)")
 
-            return result
+            return "\n".join(parts) + "\n"
 
         except Exception as e:
             return f"Error fetching sector performance: {str(e)}"
 
 
+# Submissions requested from each subreddit scan
+REDDIT_POSTS_PER_SUBREDDIT = 5
+
+_BY_SCORE = itemgetter('score')
+
+
 class LiveRedditFetcher:
     """Fetches live data from Reddit API."""
 
@@ -316,19 +554,65 @@ class LiveRedditFetcher:
 
         try:
             # Initialize Reddit client with environment credentials
+            session = requests.Session()
+            session.mount("https://", _SHARED_ADAPTER)
             self.reddit = praw.Reddit(
                 client_id=client_id,
                 client_secret=client_secret,
-                user_agent=user_agent
+                user_agent=user_agent,
+                requestor_kwargs={"session": session}
             )
-            # Test the connection
-            self.reddit.user.me()
             print(f"✅ Reddit client initialized successfully")
         except Exception as e:
             print(f"Warning: Reddit API configuration issue: {e}")
             print("Please check your Reddit API credentials in .env file")
             self.reddit = None
 
+    @staticmethod
+    def _iter_recent(submissions, subreddit_name: str, days_back: int, excerpt_len: int):
+        """Lazily yield post dicts for submissions from the last days_back days."""
+        # Posts less than days_back + 1 whole days old are recent enough
+        cutoff = datetime.now() - timedelta(days=days_back + 1)
+
+        for post in submissions:
+            post_date = datetime.fromtimestamp(post.created_utc)
+            if post_date > cutoff:
+                yield {
+                    'title': post.title,
+                    'subreddit': subreddit_name,
+                    'score': post.score,
+                    'num_comments': post.num_comments,
+                    'created': f"{post_date:%Y-%m-%d %H:%M:%S}",
+                    'url': f"https://reddit.com{post.permalink}",
+                    'selftext': post.selftext[:excerpt_len] + "..." if len(post.selftext) > excerpt_len else post.selftext
+                }
+
+    def _fetch_subreddit(self, subreddit_name: str, query: str, days_back: int, limit: int) -> List[Dict[str, Any]]:
+        """Search one subreddit for recent posts matching query."""
+        posts = []
+        try:
+            subreddit = self.reddit.subreddit(subreddit_name)
+
+            # Search for posts containing the ticker; PRAW pages lazily, so
+            # only `limit` submissions are requested
+            posts.extend(self._iter_recent(
+                subreddit.search(query, sort='new', time_filter='week', limit=limit),
+                subreddit_name, days_back, 200
+            ))
+        except Exception as e:
+            print(f"Error fetching from r/{subreddit_name}: {e}")
+        return posts
+
+    def _fetch_hot(self, subreddit_name: str, days_back: int, limit: int) -> List[Dict[str, Any]]:
+        """Collect recent hot posts from one subreddit."""
+        posts = []
+        try:
+            subreddit = self.reddit.subreddit(subreddit_name)
+            posts.extend(self._iter_recent(subreddit.hot(limit=limit), subreddit_name, days_back, 150))
+        except Exception as e:
+            print(f"Error fetching from r/{subreddit_name}: {e}")
+        return posts
+
     def get_stock_discussions(self, ticker: str, days_back: int = 7, max_posts: int = 10) -> str:
         """
         Get live Reddit discussions about a stock.
@@ -342,55 +626,47 @@ class LiveRedditFetcher:
             Formatted string of Reddit discussions
         """
         if not self.reddit:
-            return f"Reddit API not available. Please configure Reddit API credentials."
+            return _REDDIT_UNAVAILABLE
 
         try:
             # Search relevant subreddits
             subreddits = ['stocks', 'investing', 'SecurityAnalysis', 'ValueInvesting', 'StockMarket']
-
-            all_posts = []
             search_query = f"{ticker}"
 
-            for subreddit_name in subreddits:
-                try:
-                    subreddit = self.reddit.subreddit(subreddit_name)
-
-                    # Search for posts containing the ticker
-                    for post in subreddit.search(search_query, sort='new', time_filter='week', limit=5):
-                        # Check if post is recent enough
-                        post_date = datetime.fromtimestamp(post.created_utc)
-                        if (datetime.now() - post_date).days <= days_back:
-                            all_posts.append({
-                                'title': post.title,
-                                'subreddit': subreddit_name,
-                                'score': post.score,
-                                'num_comments': post.num_comments,
-                                'created': post_date.strftime('%Y-%m-%d %H:%M:%S'),
-                                'url': f"https://reddit.com{post.permalink}",
-                                'selftext': post.selftext[:200] + "..." if len(post.selftext) > 200 else post.selftext
-                            })
-                except Exception as e:
-                    print(f"Error fetching from r/{subreddit_name}: {e}")
-                    continue
+            # Results come back newest first, not by score, so every subreddit
+            # returns its full quota and max_posts is applied after ranking
+            limit = REDDIT_POSTS_PER_SUBREDDIT
+
+            # Subreddit searches are independent round-trips; run them concurrently
+            with ThreadPoolExecutor(max_workers=len(subreddits)) as executor:
+                results = executor.map(
+                    lambda name: _single_flight(
+                        ("search", name, search_query, days_back, limit),
+                        self._fetch_subreddit, name, search_query, days_back, limit
+                    ),
+                    subreddits
+                )
+                all_posts = list(chain.from_iterable(results))
 
             if not all_posts:
                 return f"No recent Reddit discussions found for {ticker} in the last {days_back} days"
 
-            # Sort by score (upvotes) and limit results
-            all_posts.sort(key=lambda x: x['score'], reverse=True)
-            all_posts = all_posts[:max_posts]
+            # Top posts by score (upvotes); same order as a stable descending sort
+            all_posts = heapq.nlargest(max_posts, all_posts, key=_BY_SCORE)
 
             # Format results
-            result = f"=== REDDIT DISCUSSIONS for {ticker} (Last {days_back} days) ===\n\n"
+            parts = [f"=== REDDIT DISCUSSIONS for {ticker} (Last {days_back} days) ===", ""]
 
             for i, post in enumerate(all_posts, 1):
-                result += f"{i}. r/{post['subreddit']}: {post['title']}\n"
-                result += f"   Score: {post['score']} | Comments: {post['num_comments']} | Date: {post['created']}\n"
+                parts.extend((
+                    f"{i}. r/{post['subreddit']}: {post['title']}",
+                    f"   Score: {post['score']} | Comments: {post['num_comments']} | Date: {post['created']}",
+                ))
                 if post['selftext'].strip():
-                    result += f"   Content: {post['selftext']}\n"
-                result += f"   URL: {post['url']}\n\n"
+                    parts.append(f"   Content: {post['selftext']}")
+                parts.extend((f"   URL: {post['url']}", ""))
 
-            return result
+            return "\n".join(parts) + "\n"
 
         except Exception as e:
             return f"Error fetching Reddit discussions for {ticker}: {str(e)}"
@@ -398,60 +674,68 @@ class LiveRedditFetcher:
     def get_market_sentiment(self, days_back: int = 7, max_posts: int = 15) -> str:
         """Get general market sentiment from Reddit."""
         if not self.reddit:
-            return f"Reddit API not available. Please configure Reddit API credentials."
+            return _REDDIT_UNAVAILABLE
 
         try:
             # Get hot posts from market-related subreddits
             market_subreddits = ['stocks', 'investing', 'SecurityAnalysis', 'StockMarket', 'economics']
 
-            all_posts = []
-
-            for subreddit_name in market_subreddits:
-                try:
-                    subreddit = self.reddit.subreddit(subreddit_name)
-
-                    for post in subreddit.hot(limit=5):
-                        post_date = datetime.fromtimestamp(post.created_utc)
-                        if (datetime.now() - post_date).days <= days_back:
-                            all_posts.append({
-                                'title': post.title,
-                                'subreddit': subreddit_name,
-                                'score': post.score,
-                                'num_comments': post.num_comments,
-                                'created': post_date.strftime('%Y-%m-%d %H:%M:%S'),
-                                'url': f"https://reddit.com{post.permalink}",
-                                'selftext': post.selftext[:150] + "..." if len(post.selftext) > 150 else post.selftext
-                            })
-                except Exception as e:
-                    print(f"Error fetching from r/{subreddit_name}: {e}")
-                    continue
+            # Hot listings are not ordered by score, so every subreddit returns
+            # its full quota and max_posts is applied after ranking
+            limit = REDDIT_POSTS_PER_SUBREDDIT
+
+            # Subreddit scans are independent round-trips; run them concurrently
+            with ThreadPoolExecutor(max_workers=len(market_subreddits)) as executor:
+                results = executor.map(
+                    lambda name: _single_flight(
+                        ("hot", name, days_back, limit), self._fetch_hot, name, days_back, limit
+                    ),
+                    market_subreddits
+                )
+                all_posts = list(chain.from_iterable(results))
 
             if not all_posts:
                 return f"No recent market discussions found on Reddit in the last {days_back} days"
 
-            # Sort by score and limit
-            all_posts.sort(key=lambda x: x['score'], reverse=True)
-            all_posts = all_posts[:max_posts]
+            # Top posts by score (upvotes); same order as a stable descending sort
+            all_posts = heapq.nlargest(max_posts, all_posts, key=_BY_SCORE)
 
             # Format results
-            result = f"=== REDDIT MARKET SENTIMENT (Last {days_back} days) ===\n\n"
+            parts = [f"=== REDDIT MARKET SENTIMENT (Last {days_back} days) ===", ""]
 
             for i, post in enumerate(all_posts, 1):
-                result += f"{i}. r/{post['subreddit']}: {post['title']}\n"
-                result += f"   Score: {post['score']} | Comments: {post['num_comments']} | Date: {post['created']}\n"
+                parts.extend((
+                    f"{i}. r/{post['subreddit']}: {post['title']}",
+                    f"   Score: {post['score']} | Comments: {post['num_comments']} | Date: {post['created']}",
+                ))
                 if post['selftext'].strip():
-                    result += f"   Content: {post['selftext']}\n"
-                result += f"   URL: {post['url']}\n\n"
+                    parts.append(f"   Content: {post['selftext']}")
+                parts.extend((f"   URL: {post['url']}", ""))
 
-            return result
+            return "\n".join(parts) + "\n"
 
         except Exception as e:
             return f"Error fetching Reddit market sentiment: {str(e)}"
 
 
-# Initialize global instances with environment configuration
-from .env_config import get_env_config
-_env_config = get_env_config()
+@lru_cache(maxsize=1)
+def get_live_finnhub() -> LiveFinnhubFetcher:
+    """Return the shared Finnhub fetcher, creating it on first use."""
+    from .env_config import get_env_config
+    return LiveFinnhubFetcher(get_env_config().get_config())
+
+
+@lru_cache(maxsize=1)
+def get_live_reddit() -> LiveRedditFetcher:
+    """Return the shared Reddit fetcher, creating it on first use."""
+    from .env_config import get_env_config
+    return LiveRedditFetcher(get_env_config().get_config())
+
 
-live_finnhub = LiveFinnhubFetcher(_env_config.get_config())
-live_reddit = LiveRedditFetcher(_env_config.get_config())
\ No newline at end of file
+def __getattr__(name):
+    # Backward compatibility for `from live_data_fetchers import live_finnhub, live_reddit`
+    if name == "live_finnhub":
+        return get_live_finnhub()
+    if name == "live_reddit":
+        return get_live_reddit()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
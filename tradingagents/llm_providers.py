@@ -1,10 +1,80 @@
 """Bedrock LLM Provider with dynamic model selection for TradingAgents."""
 
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from types import MappingProxyType
 from typing import Any, Dict, Optional, Tuple
+import threading
 import boto3
 from langchain_aws import ChatBedrock
 from .dynamic_model_selector import DynamicModelSelector
 
+# Map model names to Bedrock inference profile ARNs or available model IDs
+# Note: Some models require inference profiles instead of direct model IDs
+BEDROCK_MODEL_MAPPING = MappingProxyType({
+    "claude-3-5-sonnet": "us.anthropic.claude-3-5-sonnet-20241022-v2:0",
+    "claude-3-5-sonnet-v2": "us.anthropic.claude-3-5-sonnet-20241022-v2:0",
+    "claude-3-5-sonnet-latest": "us.anthropic.claude-3-5-sonnet-20241022-v2:0",
+    "claude-3-5-haiku-latest": "us.anthropic.claude-3-5-haiku-20241022-v1:0",
+    "claude-3-haiku": "us.anthropic.claude-3-haiku-20240307-v1:0",
+    "claude-3-opus": "us.anthropic.claude-3-opus-20240229-v1:0",
+    "claude-opus-4-0": "us.anthropic.claude-opus-4-0",
+    # Use the us. prefixed models which should be available
+    "claude-sonnet-4": "us.anthropic.claude-sonnet-4-20250514-v1:0",
+})
+
+# Model selectors reused per config object, keyed by id(config). The config is
+# kept alongside its selector so the id cannot be recycled while cached.
+SELECTOR_CACHE_SIZE = 8
+_selector_cache: "OrderedDict[int, Tuple[Dict[str, Any], DynamicModelSelector]]" = OrderedDict()
+_selector_cache_lock = threading.Lock()
+
+
+# ChatBedrock clients reused across agents, keyed by their full arguments
+LLM_CACHE_SIZE = 32
+
+# Client construction resolves AWS credentials, which is I/O bound; the quick
+# and deep thinking clients are built on this pool so that work overlaps
+_llm_init_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="llm-init")
+
+
+@lru_cache(maxsize=8)
+def _get_boto_session(profile: Optional[str]) -> boto3.Session:
+    """Return a boto3 session for an AWS profile, reading the AWS config files once."""
+    return boto3.Session(profile_name=profile) if profile else boto3.Session()
+
+
+@lru_cache(maxsize=LLM_CACHE_SIZE)
+def _create_cached_llm(
+    model: str,
+    temperature: float,
+    max_tokens: Optional[int],
+    aws_profile: Optional[str],
+    aws_region: str,
+    extra_kwargs: Tuple[Tuple[str, Any], ...]
+) -> ChatBedrock:
+    """Create a Bedrock LLM once per distinct set of arguments."""
+    return BedrockLLMFactory._create_bedrock_llm(
+        model, temperature, max_tokens, aws_profile, aws_region, **dict(extra_kwargs)
+    )
+
+
+def _get_model_selector(config: Dict[str, Any]) -> DynamicModelSelector:
+    """Return the DynamicModelSelector for a config, creating it on first use."""
+    key = id(config)
+    with _selector_cache_lock:
+        entry = _selector_cache.get(key)
+        if entry is not None and entry[0] is config:
+            _selector_cache.move_to_end(key)
+            return entry[1]
+
+        selector = DynamicModelSelector(config)
+        _selector_cache[key] = (config, selector)
+        while len(_selector_cache) > SELECTOR_CACHE_SIZE:
+            _selector_cache.popitem(last=False)
+        return selector
+
 
 class BedrockLLMFactory:
     """Factory for creating Bedrock LLM instances with optimized configuration."""
@@ -31,8 +101,18 @@ class BedrockLLMFactory:
         Returns:
             Bedrock LLM instance
         """
-        return BedrockLLMFactory._create_bedrock_llm(
-            model, temperature, max_tokens, aws_profile, aws_region, **kwargs
+        extra_kwargs = tuple(sorted(kwargs.items()))
+        try:
+            hash(extra_kwargs)
+        except TypeError:
+            # Unhashable extra arguments (e.g. a client object) can't be cached
+            return BedrockLLMFactory._create_bedrock_llm(
+                model, temperature, max_tokens, aws_profile, aws_region, **kwargs
+            )
+
+        # ChatBedrock instances are safe to share between independent invocations
+        return _create_cached_llm(
+            model, temperature, max_tokens, aws_profile, aws_region, extra_kwargs
         )
 
     @staticmethod
@@ -46,26 +126,10 @@ class BedrockLLMFactory:
     ) -> ChatBedrock:
         """Create AWS Bedrock Claude instance."""
         # Set up AWS session with profile if specified
-        session = None
-        if aws_profile:
-            session = boto3.Session(profile_name=aws_profile)
-
-        # Map model names to Bedrock inference profile ARNs or available model IDs
-        # Note: Some models require inference profiles instead of direct model IDs
-        bedrock_model_mapping = {
-            "claude-3-5-sonnet": "us.anthropic.claude-3-5-sonnet-20241022-v2:0",
-            "claude-3-5-sonnet-v2": "us.anthropic.claude-3-5-sonnet-20241022-v2:0",
-            "claude-3-5-sonnet-latest": "us.anthropic.claude-3-5-sonnet-20241022-v2:0",
-            "claude-3-5-haiku-latest": "us.anthropic.claude-3-5-haiku-20241022-v1:0",
-            "claude-3-haiku": "us.anthropic.claude-3-haiku-20240307-v1:0",
-            "claude-3-opus": "us.anthropic.claude-3-opus-20240229-v1:0",
-            "claude-opus-4-0": "us.anthropic.claude-opus-4-0",
-            # Use the us. prefixed models which should be available
-            "claude-sonnet-4": "us.anthropic.claude-sonnet-4-20250514-v1:0",
-        }
+        session = _get_boto_session(aws_profile) if aws_profile else None
 
         # Use the mapped model ID or the model name as-is if not in mapping
-        bedrock_model_id = bedrock_model_mapping.get(model, model)
+        bedrock_model_id = BEDROCK_MODEL_MAPPING.get(model, model)
 
         llm_kwargs = {
             "model_id": bedrock_model_id,
@@ -111,8 +175,8 @@ class BedrockLLMFactory:
         if not config:
             raise ValueError("Config required for dynamic model selection")
 
-        # Initialize model selector
-        model_selector = DynamicModelSelector(config)
+        # Reuse the model selector for this config
+        model_selector = _get_model_selector(config)
 
         # Get optimal model for the task
         selected_model, reasoning = model_selector.select_model_for_task(
@@ -145,7 +209,7 @@ class BedrockLLMFactory:
         Returns:
             Tuple of (Bedrock LLM instance, selection_reasoning)
         """
-        model_selector = DynamicModelSelector(config)
+        model_selector = _get_model_selector(config)
         recommended_model = model_selector.get_recommended_model_for_agent(agent_role)
 
         reasoning = f"Agent '{agent_role}' assigned model '{recommended_model}' based on role requirements"
@@ -160,6 +224,24 @@ class BedrockLLMFactory:
         return llm, reasoning
 
 
+def _create_llm_pair(
+    quick_kwargs: Dict[str, Any],
+    deep_kwargs: Dict[str, Any]
+) -> Tuple[ChatBedrock, ChatBedrock]:
+    """Create the quick and deep thinking LLMs from their create_llm arguments.
+
+    A single-model setup shares one client for both thinking levels; distinct
+    clients are constructed concurrently.
+    """
+    if deep_kwargs == quick_kwargs:
+        llm = BedrockLLMFactory.create_llm(**quick_kwargs)
+        return llm, llm
+
+    quick_future = _llm_init_executor.submit(partial(BedrockLLMFactory.create_llm, **quick_kwargs))
+    deep_future = _llm_init_executor.submit(partial(BedrockLLMFactory.create_llm, **deep_kwargs))
+    return quick_future.result(), deep_future.result()
+
+
 def get_configured_llms(config: Dict[str, Any]) -> Tuple[ChatBedrock, ChatBedrock]:
     """Get configured Bedrock LLM instances based on config.
 
@@ -184,20 +266,11 @@ def get_configured_llms(config: Dict[str, Any]) -> Tuple[ChatBedrock, ChatBedroc
     quick_max_tokens = config.get("quick_think_max_tokens", 4000)
     deep_max_tokens = config.get("deep_think_max_tokens", 8000)
 
-    quick_thinking_llm = BedrockLLMFactory.create_llm(
-        model=quick_model,
-        temperature=quick_temp,
-        max_tokens=quick_max_tokens,
-        aws_profile=aws_profile,
-        aws_region=aws_region,
-    )
-
-    deep_thinking_llm = BedrockLLMFactory.create_llm(
-        model=deep_model,
-        temperature=deep_temp,
-        max_tokens=deep_max_tokens,
-        aws_profile=aws_profile,
-        aws_region=aws_region,
+    quick_thinking_llm, deep_thinking_llm = _create_llm_pair(
+        dict(model=quick_model, temperature=quick_temp, max_tokens=quick_max_tokens,
+             aws_profile=aws_profile, aws_region=aws_region),
+        dict(model=deep_model, temperature=deep_temp, max_tokens=deep_max_tokens,
+             aws_profile=aws_profile, aws_region=aws_region),
     )
 
     return quick_thinking_llm, deep_thinking_llm
@@ -218,36 +291,28 @@ def get_dynamic_llms(config: Dict[str, Any]) -> Tuple[ChatBedrock, ChatBedrock,
     # Initialize model selector
     model_selector = DynamicModelSelector(config)
 
-    # Get optimal models for different thinking levels
-    quick_model, quick_reasoning = model_selector.select_model_for_task(
-        "basic_calculations",  # Simple task
-        context={"thinking_level": "quick"}
-    )
-
-    deep_model, deep_reasoning = model_selector.select_model_for_task(
-        "investment_research",  # Complex task
-        context={"thinking_level": "deep"}
-    )
+    # Get optimal models for different thinking levels. Selection is local
+    # table lookups with no I/O, so both are made in one batch on this thread
+    (quick_model, quick_reasoning), (deep_model, deep_reasoning) = model_selector.select_models_for_tasks([
+        ("basic_calculations", {"thinking_level": "quick"}),  # Simple task
+        ("investment_research", {"thinking_level": "deep"}),  # Complex task
+    ])
 
     print(f"Dynamic Model Selection:")
     print(f"  Quick thinking: {quick_reasoning}")
     print(f"  Deep thinking: {deep_reasoning}")
 
-    # Create Bedrock LLM instances
-    quick_thinking_llm = BedrockLLMFactory.create_llm(
-        model=quick_model,
-        temperature=config.get("quick_think_temperature", 0.1),
-        max_tokens=config.get("quick_think_max_tokens", 4000),
-        aws_profile=aws_profile,
-        aws_region=aws_region,
-    )
+    quick_temp = config.get("quick_think_temperature", 0.1)
+    deep_temp = config.get("deep_think_temperature", 0.1)
+    quick_max_tokens = config.get("quick_think_max_tokens", 4000)
+    deep_max_tokens = config.get("deep_think_max_tokens", 8000)
 
-    deep_thinking_llm = BedrockLLMFactory.create_llm(
-        model=deep_model,
-        temperature=config.get("deep_think_temperature", 0.1),
-        max_tokens=config.get("deep_think_max_tokens", 8000),
-        aws_profile=aws_profile,
-        aws_region=aws_region,
+    # Create Bedrock LLM instances
+    quick_thinking_llm, deep_thinking_llm = _create_llm_pair(
+        dict(model=quick_model, temperature=quick_temp, max_tokens=quick_max_tokens,
+             aws_profile=aws_profile, aws_region=aws_region),
+        dict(model=deep_model, temperature=deep_temp, max_tokens=deep_max_tokens,
+             aws_profile=aws_profile, aws_region=aws_region),
     )
 
     return quick_thinking_llm, deep_thinking_llm, model_selector
\ No newline at end of file
@@ -6,10 +6,18 @@ using TA-Lib for the TradingAgents system. It focuses on reliable patterns suita
 for daily trading decisions and provides confidence scoring for each pattern.
 """
 
+import hashlib
+import logging
+import os
+import threading
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Optional, Tuple, Any
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple, Any
 from datetime import datetime, timedelta
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
 import warnings
 
 try:
@@ -26,6 +34,280 @@ except ImportError:
     PANDAS_TA_AVAILABLE = False
     # pandas-ta is optional - TA-Lib provides core technical analysis functionality
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    # numba is optional - kernels fall back to NumPy implementations
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+logger = logging.getLogger(__name__)
+
+
+# Number of most recent bars inspected for candlestick signals
+RECENT_SIGNAL_BARS = 5
+
+# Earlier bars a TA-Lib pattern needs before it can signal on a bar. The longest
+# with default candle settings is CDLRISEFALL3METHODS (10-bar body average + 4)
+PATTERN_LOOKBACK_BARS = 14
+
+# Trailing bars pattern detection reads
+PATTERN_WINDOW_BARS = RECENT_SIGNAL_BARS + PATTERN_LOOKBACK_BARS
+
+# Fibonacci retracement ratios and their labels. The 100% level is pinned to the
+# trend low exactly rather than computed as high - diff
+FIBONACCI_RATIOS = np.array([0.0, 0.236, 0.382, 0.5, 0.618, 0.786, 1.0])
+FIBONACCI_LABELS = ('0.0%', '23.6%', '38.2%', '50.0%', '61.8%', '78.6%', '100.0%')
+
+
+# nogil lets concurrent report threads scan different symbols in parallel
+@njit(cache=True, nogil=True)
+def _latest_signal_bars_jit(signals):
+    n_patterns, n_bars = signals.shape
+    latest = np.full(n_patterns, -1, dtype=np.int64)
+    for p in range(n_patterns):
+        for i in range(n_bars - 1, -1, -1):
+            if signals[p, i] != 0:
+                latest[p] = i
+                break
+    return latest
+
+
+def _latest_signal_bars_numpy(signals):
+    n_bars = signals.shape[1]
+    if n_bars == 0:
+        return np.full(signals.shape[0], -1, dtype=np.int64)
+    nonzero = signals != 0
+    latest = n_bars - 1 - np.argmax(nonzero[:, ::-1], axis=1)
+    latest[~nonzero.any(axis=1)] = -1
+    return latest
+
+
+# Given an (n_patterns, n_bars) array of TA-Lib pattern outputs, returns the bar
+# position of each pattern's most recent non-zero signal, or -1 if none
+_latest_signal_bars = _latest_signal_bars_jit if NUMBA_AVAILABLE else _latest_signal_bars_numpy
+
+
+@njit(cache=True, nogil=True)
+def _window_extremes_jit(high, low, window):
+    n = len(high)
+    lowest = low[n - window]
+    highest = high[n - window]
+    for i in range(n - window + 1, n):
+        if low[i] < lowest:
+            lowest = low[i]
+        if high[i] > highest:
+            highest = high[i]
+    return lowest, highest
+
+
+def _window_extremes_numpy(high, low, window):
+    return low[-window:].min(), high[-window:].max()
+
+
+# Lowest low and highest high of the last window bars (window >= 1), the basis
+# of both support/resistance and the Fibonacci trend range
+_window_extremes = _window_extremes_jit if NUMBA_AVAILABLE else _window_extremes_numpy
+
+
+@njit(cache=True, nogil=True)
+def _net_signal_jit(signs, weights):
+    n_pos = 0
+    n_neg = 0
+    pos_weight = 0.0
+    neg_weight = 0.0
+    for k in range(len(signs)):
+        if signs[k] > 0:
+            n_pos += 1
+            pos_weight += weights[k]
+        elif signs[k] < 0:
+            n_neg += 1
+            neg_weight += weights[k]
+    if n_pos > n_neg:
+        return 1, n_pos, n_neg, pos_weight
+    if n_neg > n_pos:
+        return -1, n_pos, n_neg, neg_weight
+    return 0, n_pos, n_neg, 0.0
+
+
+def _net_signal_numpy(signs, weights):
+    positive = signs > 0
+    negative = signs < 0
+    n_pos = int(positive.sum())
+    n_neg = int(negative.sum())
+    if n_pos > n_neg:
+        return 1, n_pos, n_neg, float(weights[positive].sum())
+    if n_neg > n_pos:
+        return -1, n_pos, n_neg, float(weights[negative].sum())
+    return 0, n_pos, n_neg, 0.0
+
+
+# Given signal signs (+1 bullish/buy, -1 bearish/sell, 0 other) and weights,
+# returns (net direction, positive count, negative count, summed weight of the
+# winning side); the direction is 0 when neither side outnumbers the other
+_net_signal = _net_signal_jit if NUMBA_AVAILABLE else _net_signal_numpy
+
+# Signal signs passed to _net_signal, and the labels its direction decodes to
+_DIRECTION_SIGNS = {'bullish': 1, 'bearish': -1}
+_SIGNAL_SIGNS = {'BUY': 1, 'SELL': -1}
+_SENTIMENTS = {1: 'bullish', -1: 'bearish', 0: 'neutral'}
+_RECOMMENDATIONS = {1: 'BUY', -1: 'SELL', 0: 'HOLD'}
+
+
+# Analysis results keyed by (analysis, parameters, digest of the bars it reads).
+# Polling and backtests re-analyse identical bars; results are pure functions of
+# the bars, so they are computed once. Results are stored read-only and shared,
+# so no caller can change what later callers see.
+ANALYSIS_MEMO_SIZE = 1024
+_analysis_memo = OrderedDict()
+_analysis_memo_lock = threading.Lock()
+
+
+def _frame_digest(data: pd.DataFrame, rows: int) -> bytes:
+    """
+    Digest of the trailing rows an analysis reads, plus the frame's length and column names.
+
+    prepare_data only reaches back past a row to fill or drop gaps, so a tail of
+    numeric values without gaps determines the prepared tail on its own; any other
+    tail falls back to hashing the whole frame.
+    """
+    tail = data.iloc[-rows:]
+    columns = [(name, column.to_numpy()) for name, column in tail.items()]
+    if not all(
+        name == 'Date' or (values.dtype.kind in 'biuf' and not np.isnan(values).any())
+        for name, values in columns
+    ):
+        tail = data
+        columns = [(name, column.to_numpy()) for name, column in data.items()]
+
+    digest = hashlib.blake2b(repr((len(data), tuple(data.columns))).encode(), digest_size=16)
+    for values in (tail.index.to_numpy(), *(values for _, values in columns)):
+        digest.update(values.dtype.str.encode())
+        # Object arrays (text dates, mixed values) hash by value rather than by pointer
+        digest.update(pd.util.hash_array(values).tobytes() if values.dtype == object else values.tobytes())
+    return digest.digest()
+
+
+def _freeze(result):
+    """Read-only view of a result, nested dicts included, so one copy can be shared."""
+    if isinstance(result, dict):
+        return MappingProxyType({key: _freeze(value) for key, value in result.items()})
+    if isinstance(result, list):
+        return tuple(_freeze(value) for value in result)
+    return result
+
+
+def _memoized(key, compute):
+    """Return the read-only memoized result for key, computing and storing it on a miss."""
+    with _analysis_memo_lock:
+        result = _analysis_memo.get(key)
+        if result is not None:
+            _analysis_memo.move_to_end(key)
+            return result
+
+    result = _freeze(compute())
+
+    with _analysis_memo_lock:
+        _analysis_memo[key] = result
+        while len(_analysis_memo) > ANALYSIS_MEMO_SIZE:
+            _analysis_memo.popitem(last=False)
+    return result
+
+
+class RollingExtremes:
+    """Sliding-window low/high over a stream of bars using monotonic deques."""
+
+    def __init__(self, window: int):
+        self.window = window
+        self.count = 0
+        # (bar position, value) pairs; lows increasing, highs decreasing
+        self._lows = deque()
+        self._highs = deque()
+
+    def push(self, low: float, high: float):
+        """Add the next bar and drop bars that fell out of the window (O(1) amortized)."""
+        position = self.count
+        self.count += 1
+
+        while self._lows and self._lows[-1][1] >= low:
+            self._lows.pop()
+        self._lows.append((position, low))
+        while self._highs and self._highs[-1][1] <= high:
+            self._highs.pop()
+        self._highs.append((position, high))
+
+        expired = position - self.window
+        while self._lows[0][0] <= expired:
+            self._lows.popleft()
+        while self._highs[0][0] <= expired:
+            self._highs.popleft()
+
+    @property
+    def low(self) -> float:
+        return self._lows[0][1]
+
+    @property
+    def high(self) -> float:
+        return self._highs[0][1]
+
+
+@dataclass
+class SRState:
+    """
+    Incremental state for support/resistance or Fibonacci extremes of one symbol.
+
+    Tracks the last bar processed so later calls only push newer bars.
+    """
+    window: int
+    last_date: Any = None
+    last_close: float = float('nan')
+    extremes: RollingExtremes = field(default=None)
+
+    def __post_init__(self):
+        if self.extremes is None:
+            self.extremes = RollingExtremes(self.window)
+
+
+@dataclass(frozen=True)
+class OHLCV:
+    """
+    Prepared bars as C-contiguous float64 arrays, one per field.
+
+    Extracted from the prepared frame once and shared by the pattern,
+    support/resistance and Fibonacci analyses.
+    """
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+    index: pd.Index
+
+    def __len__(self) -> int:
+        return len(self.close)
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> 'OHLCV':
+        """Build from a frame that has already been through prepare_data."""
+        def column(name):
+            return np.ascontiguousarray(df[name].to_numpy(dtype=np.float64))
+
+        return cls(
+            open=column('open'),
+            high=column('high'),
+            low=column('low'),
+            close=column('close'),
+            volume=column('volume'),
+            index=df.index
+        )
+
 
 class TechnicalPatternAnalyzer:
     """
@@ -62,6 +344,16 @@ class TechnicalPatternAnalyzer:
         }
     }
 
+    # RELIABLE_PATTERNS flattened once: code -> pattern info, and code -> category
+    _ALL_PATTERNS = {code: info for patterns in RELIABLE_PATTERNS.values() for code, info in patterns.items()}
+    _PATTERN_BUCKETS = {code: category for category, patterns in RELIABLE_PATTERNS.items() for code in patterns}
+
+    # (code, TA-Lib function) pairs resolved once rather than looked up per call.
+    # Codes the installed TA-Lib build lacks are dropped here, not on every call
+    _PATTERN_FUNCS = tuple(
+        (code, getattr(talib, code)) for code in _ALL_PATTERNS if hasattr(talib, code)
+    ) if TALIB_AVAILABLE else ()
+
     def __init__(self, config: Dict[str, Any] = None):
         """
         Initialize the Technical Pattern Analyzer.
@@ -81,7 +373,7 @@ class TechnicalPatternAnalyzer:
         Prepare OHLCV data for technical analysis.
 
         Args:
-            data: DataFrame with OHLCV columns
+            data: DataFrame with OHLCV columns, dated by a "Date" column or a DatetimeIndex
 
         Returns:
             Cleaned and prepared DataFrame
@@ -92,8 +384,14 @@ class TechnicalPatternAnalyzer:
             'Adj Close': 'adj_close'
         }
 
-        df = data.copy()
-        df = df.rename(columns=column_mapping)
+        # A shallow copy shares the column arrays with data; the steps below only
+        # ever replace whole columns, so data itself is never modified
+        df = data.copy(deep=False)
+
+        # Frames straight from yf.download keep dates in a DatetimeIndex
+        if isinstance(df.index, pd.DatetimeIndex):
+            df.reset_index(inplace=True)
+        df.rename(columns=column_mapping, inplace=True)
 
         # Ensure required columns exist
         required_cols = ['open', 'high', 'low', 'close']
@@ -109,19 +407,36 @@ class TechnicalPatternAnalyzer:
         if 'volume' not in df.columns:
             df['volume'] = 0
 
-        # Convert to float and handle missing values
-        for col in ['open', 'high', 'low', 'close', 'volume']:
-            df[col] = pd.to_numeric(df[col], errors='coerce')
+        # Convert to float64 (inputs may be stored as float32) and handle missing values
+        ohlcv_cols = ['open', 'high', 'low', 'close', 'volume']
+        for col in ohlcv_cols:
+            if df[col].dtype != np.float64:
+                df[col] = pd.to_numeric(df[col], errors='coerce').astype(np.float64)
 
-        # Forward fill missing values (max 3 consecutive)
-        df[['open', 'high', 'low', 'close', 'volume']] = df[['open', 'high', 'low', 'close', 'volume']].ffill(limit=3)
+        # A single NaN scan decides whether cleaning is needed at all; clean
+        # frames, the common case, skip the fill and drop passes
+        if any(np.isnan(df[col].to_numpy()).any() for col in ohlcv_cols):
+            # Forward fill missing values (max 3 consecutive)
+            df[ohlcv_cols] = df[ohlcv_cols].ffill(limit=3)
 
-        # Remove rows with still missing values
-        df = df.dropna(subset=['open', 'high', 'low', 'close'])
+            # Remove rows with still missing values
+            df = df.dropna(subset=['open', 'high', 'low', 'close'])
 
         return df
 
-    def detect_candlestick_patterns(self, data: pd.DataFrame) -> Dict[str, Any]:
+    def to_ohlcv(self, data: pd.DataFrame) -> OHLCV:
+        """
+        Prepare data and extract its OHLCV columns as contiguous arrays.
+
+        Args:
+            data: Raw OHLCV DataFrame
+
+        Returns:
+            OHLCV arrays of the prepared bars
+        """
+        return OHLCV.from_frame(self.prepare_data(data))
+
+    def detect_candlestick_patterns(self, data: pd.DataFrame) -> Mapping[str, Any]:
         """
         Detect all supported candlestick patterns in the data.
 
@@ -129,54 +444,73 @@ class TechnicalPatternAnalyzer:
             data: Prepared OHLCV DataFrame
 
         Returns:
-            Dictionary with pattern detection results
+            Read-only mapping with pattern detection results
         """
+        return _memoized(
+            ('patterns', self.min_periods, _frame_digest(data, PATTERN_WINDOW_BARS)),
+            lambda: self._detect_candlestick_patterns(data)
+        )
+
+    def _detect_candlestick_patterns(self, data: pd.DataFrame, bars: Optional[OHLCV] = None) -> Dict[str, Any]:
+        """Pattern detection for data, reusing bars if they were already extracted from it."""
         if len(data) < self.min_periods:
             return {'error': f'Insufficient data. Need at least {self.min_periods} periods.'}
 
-        df = self.prepare_data(data)
+        if bars is None:
+            bars = self.to_ohlcv(data)
+
+        # Only the recent signals are used, so TA-Lib just needs the bars that
+        # can influence them rather than the whole history
+        window = PATTERN_WINDOW_BARS
 
-        # Convert to numpy arrays for TA-Lib
-        open_prices = df['open'].values
-        high_prices = df['high'].values
-        low_prices = df['low'].values
-        close_prices = df['close'].values
-        volumes = df['volume'].values
+        # Every CDL function takes the same open/high/low/close inputs, so they
+        # are sliced once and shared. Tail slices of contiguous arrays stay
+        # contiguous, as TA-Lib expects. The direct functions are used rather
+        # than the abstract Function API, which wraps the same C calls in
+        # per-call input dict handling
+        inputs = (bars.open[-window:], bars.high[-window:], bars.low[-window:], bars.close[-window:])
 
         detected_patterns = {}
-        pattern_signals = {}
 
         # Detect all patterns from our reliable patterns dictionary
-        all_patterns = {}
-        for category in self.RELIABLE_PATTERNS:
-            all_patterns.update(self.RELIABLE_PATTERNS[category])
-
-        for pattern_func, pattern_info in all_patterns.items():
-            try:
-                # Call TA-Lib pattern function
-                pattern_result = getattr(talib, pattern_func)(open_prices, high_prices, low_prices, close_prices)
-
-                # Check for recent patterns (last 5 days)
-                recent_signals = pattern_result[-5:]
-                if any(signal != 0 for signal in recent_signals):
-                    # Find the most recent non-zero signal
-                    for i in range(len(recent_signals) - 1, -1, -1):
-                        if recent_signals[i] != 0:
-                            signal_strength = abs(recent_signals[i])
-                            signal_direction = 'bullish' if recent_signals[i] > 0 else 'bearish'
-
-                            detected_patterns[pattern_info['name']] = {
-                                'signal_strength': signal_strength,
-                                'direction': signal_direction,
-                                'reliability': pattern_info['strength'],
-                                'type': pattern_info['type'],
-                                'days_ago': i,
-                                'pattern_code': pattern_func
-                            }
-                            break
-
-            except Exception as e:
-                print(f"Error detecting pattern {pattern_func}: {e}")
+        pattern_funcs = self._PATTERN_FUNCS
+
+        # Recent signals of every pattern, one row per pattern. The calls stay
+        # sequential: each covers only the trailing window, so thread dispatch
+        # would cost more than the work, and parallelism comes from analysing
+        # different symbols concurrently instead
+        n_recent = min(RECENT_SIGNAL_BARS, len(inputs[-1]))
+        recent_signals = np.zeros((len(pattern_funcs), n_recent), dtype=np.int64)
+        # The pattern list is validated at import, so a TA-Lib failure here means
+        # the bars themselves are unusable and the remaining patterns would fail too
+        try:
+            for row, (pattern_code, pattern_func) in enumerate(pattern_funcs):
+                pattern_result = pattern_func(*inputs)
+                if n_recent:
+                    recent_signals[row] = pattern_result[-n_recent:]
+        except Exception as e:
+            logger.warning("Error detecting pattern %s: %s", pattern_code, e)
+            return {'error': f'Candlestick pattern detection failed: {str(e)}'}
+
+        # Only build entries for patterns that actually fired. Their bar positions
+        # and signed signal values are gathered in one indexing step
+        latest = _latest_signal_bars(recent_signals)
+        fired = np.flatnonzero(latest >= 0)
+        fired_bars = latest[fired]
+        signals = recent_signals[fired, fired_bars]
+        for row, i, signal in zip(fired.tolist(), fired_bars.tolist(), signals.tolist()):
+            pattern_code = pattern_funcs[row][0]
+            pattern_info = self._ALL_PATTERNS[pattern_code]
+
+            detected_patterns[pattern_info['name']] = {
+                'signal_strength': abs(signal),
+                'direction': 'bullish' if signal > 0 else 'bearish',
+                'reliability': pattern_info['strength'],
+                'type': pattern_info['type'],
+                'bucket': self._PATTERN_BUCKETS[pattern_code],
+                'days_ago': i,
+                'pattern_code': pattern_code
+            }
 
         return {
             'patterns_detected': detected_patterns,
@@ -184,7 +518,7 @@ class TechnicalPatternAnalyzer:
             'analysis_date': data.index[-1] if hasattr(data, 'index') else datetime.now().strftime('%Y-%m-%d')
         }
 
-    def analyze_support_resistance(self, data: pd.DataFrame, window: int = 20) -> Dict[str, float]:
+    def analyze_support_resistance(self, data: pd.DataFrame, window: int = 20) -> Mapping[str, float]:
         """
         Calculate dynamic support and resistance levels.
 
@@ -193,41 +527,125 @@ class TechnicalPatternAnalyzer:
             window: Lookback window for calculations
 
         Returns:
-            Dictionary with support/resistance levels
+            Read-only mapping with support/resistance levels
         """
-        df = self.prepare_data(data)
-
-        if len(df) < window:
+        return _memoized(
+            ('support_resistance', window, _frame_digest(data, window)),
+            lambda: self._support_resistance(self.to_ohlcv(data), window)
+        )
+
+    def _support_resistance(self, bars: OHLCV, window: int = 20) -> Dict[str, float]:
+        """Support/resistance on bars extracted by to_ohlcv."""
+        if len(bars) < window:
             return {'error': 'Insufficient data for support/resistance analysis'}
 
-        # Calculate pivot points using rolling windows
-        high_prices = df['high']
-        low_prices = df['low']
-        close_prices = df['close']
+        # Only the last window of bars matters, so reduce the tail rather than
+        # rolling over the whole history. Support is the lowest low in the
+        # window, resistance the highest high
+        support, resistance = _window_extremes(bars.high, bars.low, window)
 
-        # Support: Lowest low in the window
-        support = low_prices.rolling(window=window).min().iloc[-1]
+        # Current price
+        current_price = bars.close[-1]
 
-        # Resistance: Highest high in the window
-        resistance = high_prices.rolling(window=window).max().iloc[-1]
+        return self._support_resistance_levels(support, resistance, current_price)
 
-        # Current price
-        current_price = close_prices.iloc[-1]
+    def update_support_resistance(self, state: SRState, data: pd.DataFrame) -> Dict[str, float]:
+        """
+        Support and resistance levels, reusing the rolling extremes from the previous call.
+
+        Only bars after state.last_date are pushed into the window. Falls back to
+        rebuilding the window when the previous bar is missing or was revised.
+
+        Args:
+            state: Incremental state for this symbol, updated in place
+            data: OHLCV DataFrame
+
+        Returns:
+            Dictionary with support/resistance levels
+        """
+        return self._update_support_resistance(state, self.prepare_data(data))
+
+    def _update_support_resistance(self, state: SRState, df: pd.DataFrame) -> Dict[str, float]:
+        """Incremental support/resistance on a frame that has already been through prepare_data."""
+        if len(df) < state.window:
+            return {'error': 'Insufficient data for support/resistance analysis'}
 
+        self._advance_extremes(state, df)
+        return self._support_resistance_levels(
+            state.extremes.low, state.extremes.high, df['close'].iloc[-1]
+        )
+
+    @staticmethod
+    def _support_resistance_levels(support, resistance, current_price) -> Dict[str, float]:
         # Calculate distance to levels as percentages
         support_distance = ((current_price - support) / current_price) * 100
         resistance_distance = ((resistance - current_price) / current_price) * 100
 
+        # Values are left unrounded; reports format them to two decimals
         return {
-            'support_level': round(support, 2),
-            'resistance_level': round(resistance, 2),
-            'current_price': round(current_price, 2),
-            'support_distance_pct': round(support_distance, 2),
-            'resistance_distance_pct': round(resistance_distance, 2),
+            'support_level': support,
+            'resistance_level': resistance,
+            'current_price': current_price,
+            'support_distance_pct': support_distance,
+            'resistance_distance_pct': resistance_distance,
             'in_range': support < current_price < resistance
         }
 
-    def calculate_fibonacci_levels(self, data: pd.DataFrame, trend_window: int = 50) -> Dict[str, Any]:
+    @staticmethod
+    def _bar_dates(df: pd.DataFrame) -> Optional[np.ndarray]:
+        """
+        Dates of a prepared frame as naive datetime64, or None if bars cannot be matched.
+
+        Offline CSVs carry dates as text and online frames as datetimes; both are
+        normalised so one state can follow either. Missing, unparseable or
+        unsorted dates give None.
+        """
+        if 'Date' not in df.columns:
+            return None
+        dates = df['Date']
+        if not pd.api.types.is_datetime64_any_dtype(dates):
+            try:
+                dates = pd.to_datetime(dates)
+            except (ValueError, TypeError, OverflowError):
+                return None
+        if isinstance(dates.dtype, pd.DatetimeTZDtype):
+            dates = dates.dt.tz_localize(None)
+        if dates.isna().any() or not dates.is_monotonic_increasing:
+            return None
+        return dates.to_numpy(dtype='datetime64[ns]')
+
+    @staticmethod
+    def _advance_extremes(state: SRState, df: pd.DataFrame):
+        """Push the bars of a prepared frame that state has not seen yet."""
+        # Without usable dates bars cannot be matched across calls
+        dates = TechnicalPatternAnalyzer._bar_dates(df)
+        lows = df['low'].to_numpy()
+        highs = df['high'].to_numpy()
+        closes = df['close'].to_numpy()
+
+        # Resume only from a state built on comparable dates that this frame
+        # still covers; anything else (another date type, or a frame that ends
+        # before the last bar seen, as in a backtest stepping back) starts cold
+        start = None
+        if dates is not None and isinstance(state.last_date, np.datetime64) \
+                and len(dates) and state.last_date <= dates[-1]:
+            position = np.searchsorted(dates, state.last_date)
+            if position < len(dates) and dates[position] == state.last_date \
+                    and closes[position] == state.last_close:
+                start = position + 1
+
+        if start is None:
+            # Cold start, or history changed (e.g. split/dividend adjustment)
+            state.extremes = RollingExtremes(state.window)
+            start = len(df) - state.window
+
+        for i in range(start, len(df)):
+            state.extremes.push(lows[i], highs[i])
+
+        state.last_date = dates[-1] if dates is not None else None
+        state.last_close = closes[-1]
+
+    def calculate_fibonacci_levels(self, data: pd.DataFrame, trend_window: int = 50) -> Mapping[str, Any]:
         """
         Calculate Fibonacci retracement levels based on recent trend.
 
@@ -235,82 +653,146 @@ class TechnicalPatternAnalyzer:
             data: OHLCV DataFrame
             trend_window: Window to determine high/low points
 
+        Returns:
+            Read-only mapping with Fibonacci levels
+        """
+        return _memoized(
+            ('fibonacci', trend_window, _frame_digest(data, trend_window)),
+            lambda: self._fibonacci(self.to_ohlcv(data), trend_window)
+        )
+
+    def _fibonacci(self, bars: OHLCV, trend_window: int = 50) -> Dict[str, Any]:
+        """Fibonacci levels on bars extracted by to_ohlcv."""
+        if len(bars) < trend_window:
+            return {'error': 'Insufficient data for Fibonacci analysis'}
+
+        # Get recent high and low
+        low_price, high_price = _window_extremes(bars.high, bars.low, trend_window)
+        current_price = bars.close[-1]
+
+        return self._fibonacci_levels(high_price, low_price, current_price)
+
+    def update_fibonacci_levels(self, state: SRState, data: pd.DataFrame) -> Dict[str, Any]:
+        """
+        Fibonacci levels, reusing the trend extremes from the previous call.
+
+        Args:
+            state: Incremental state for this symbol (window = trend window), updated in place
+            data: OHLCV DataFrame
+
         Returns:
             Dictionary with Fibonacci levels
         """
-        df = self.prepare_data(data)
+        return self._update_fibonacci_levels(state, self.prepare_data(data))
 
-        if len(df) < trend_window:
+    def _update_fibonacci_levels(self, state: SRState, df: pd.DataFrame) -> Dict[str, Any]:
+        """Incremental Fibonacci levels on a frame that has already been through prepare_data."""
+        if len(df) < state.window:
             return {'error': 'Insufficient data for Fibonacci analysis'}
 
-        # Get recent high and low
-        recent_data = df.tail(trend_window)
-        high_price = recent_data['high'].max()
-        low_price = recent_data['low'].min()
-        current_price = df['close'].iloc[-1]
+        self._advance_extremes(state, df)
+        return self._fibonacci_levels(
+            state.extremes.high, state.extremes.low, df['close'].iloc[-1]
+        )
 
-        # Calculate Fibonacci levels
+    @staticmethod
+    def _fibonacci_levels(high_price, low_price, current_price) -> Dict[str, Any]:
+        # Calculate Fibonacci levels, all at once
         diff = high_price - low_price
-        fib_levels = {
-            '0.0%': high_price,
-            '23.6%': high_price - (diff * 0.236),
-            '38.2%': high_price - (diff * 0.382),
-            '50.0%': high_price - (diff * 0.500),
-            '61.8%': high_price - (diff * 0.618),
-            '78.6%': high_price - (diff * 0.786),
-            '100.0%': low_price
-        }
+        levels = high_price - diff * FIBONACCI_RATIOS
+        levels[-1] = low_price
 
         # Determine which levels are nearby (within 2% of current price)
-        nearby_levels = {}
-        for level_name, level_price in fib_levels.items():
-            distance_pct = abs((current_price - level_price) / current_price) * 100
-            if distance_pct <= 2.0:
-                nearby_levels[level_name] = {
-                    'price': round(level_price, 2),
-                    'distance_pct': round(distance_pct, 2)
-                }
+        distance_pct = np.abs((current_price - levels) / current_price) * 100
+        level_prices = levels.tolist()
+        distances = distance_pct.tolist()
+        nearby_levels = {
+            FIBONACCI_LABELS[i]: {'price': level_prices[i], 'distance_pct': distances[i]}
+            for i in np.flatnonzero(distance_pct <= 2.0).tolist()
+        }
 
+        # Values are left unrounded; reports format them to two decimals
         return {
-            'fibonacci_levels': {k: round(v, 2) for k, v in fib_levels.items()},
+            'fibonacci_levels': dict(zip(FIBONACCI_LABELS, level_prices)),
             'nearby_levels': nearby_levels,
-            'trend_high': round(high_price, 2),
-            'trend_low': round(low_price, 2),
-            'current_price': round(current_price, 2)
+            'trend_high': high_price,
+            'trend_low': low_price,
+            'current_price': current_price
         }
 
-    def generate_technical_summary(self, data: pd.DataFrame) -> Dict[str, Any]:
+    def generate_technical_summary(
+        self,
+        data: pd.DataFrame,
+        sr_state: Optional[SRState] = None,
+        fib_state: Optional[SRState] = None
+    ) -> Dict[str, Any]:
         """
         Generate comprehensive technical analysis summary.
 
+        When polling the same symbol, pass its SRState objects (windows 20 and 50)
+        so support/resistance and Fibonacci levels only push the new bars, as in
+        update_support_resistance and update_fibonacci_levels.
+
         Args:
             data: OHLCV DataFrame
+            sr_state: Optional incremental support/resistance state, updated in place
+            fib_state: Optional incremental Fibonacci state, updated in place
 
         Returns:
             Complete technical analysis summary
         """
         try:
-            # Get all analysis components
-            patterns = self.detect_candlestick_patterns(data)
-            support_resistance = self.analyze_support_resistance(data)
-            fibonacci = self.calculate_fibonacci_levels(data)
+            # Reuse memoized components for these bars; prepare the data and
+            # extract its arrays at most once, sharing them between the
+            # components that must be computed
+            shared = {}
+
+            def prepared_data():
+                if 'frame' not in shared:
+                    shared['frame'] = self.prepare_data(data)
+                return shared['frame']
+
+            def bars():
+                if 'bars' not in shared:
+                    shared['bars'] = OHLCV.from_frame(prepared_data())
+                return shared['bars']
+
+            patterns = _memoized(
+                ('patterns', self.min_periods, _frame_digest(data, PATTERN_WINDOW_BARS)),
+                lambda: self._detect_candlestick_patterns(data, bars())
+            )
+            if sr_state is not None:
+                support_resistance = self._update_support_resistance(sr_state, prepared_data())
+            else:
+                support_resistance = _memoized(
+                    ('support_resistance', 20, _frame_digest(data, 20)),
+                    lambda: self._support_resistance(bars())
+                )
+            if fib_state is not None:
+                fibonacci = self._update_fibonacci_levels(fib_state, prepared_data())
+            else:
+                fibonacci = _memoized(
+                    ('fibonacci', 50, _frame_digest(data, 50)), lambda: self._fibonacci(bars())
+                )
 
             # Calculate overall signal strength
-            total_signals = len(patterns.get('patterns_detected', {}))
-            bullish_signals = sum(1 for p in patterns.get('patterns_detected', {}).values()
-                                 if p.get('direction') == 'bullish')
-            bearish_signals = sum(1 for p in patterns.get('patterns_detected', {}).values()
-                                 if p.get('direction') == 'bearish')
+            detected = patterns.get('patterns_detected', {})
+            total_signals = len(detected)
+            signs = np.fromiter(
+                (_DIRECTION_SIGNS.get(p.get('direction'), 0) for p in detected.values()),
+                dtype=np.int8, count=total_signals
+            )
+            reliabilities = np.fromiter(
+                (p.get('reliability', 0) for p in detected.values()), dtype=np.int16, count=total_signals
+            )
+            direction, bullish_signals, bearish_signals, _ = _net_signal(signs, reliabilities)
 
             # Generate overall sentiment
-            if bullish_signals > bearish_signals:
-                overall_sentiment = 'bullish'
-                confidence = min(90, (bullish_signals / max(total_signals, 1)) * 100)
-            elif bearish_signals > bullish_signals:
-                overall_sentiment = 'bearish'
-                confidence = min(90, (bearish_signals / max(total_signals, 1)) * 100)
+            overall_sentiment = _SENTIMENTS[direction]
+            if direction:
+                side_signals = bullish_signals if direction > 0 else bearish_signals
+                confidence = min(90, (side_signals / max(total_signals, 1)) * 100)
             else:
-                overall_sentiment = 'neutral'
                 confidence = 50
 
             return {
@@ -396,18 +878,18 @@ class TechnicalPatternAnalyzer:
                         'strength': 60
                     })
 
-        # Aggregate signals into recommendation
-        buy_signals = [s for s in signals if s['type'] == 'BUY']
-        sell_signals = [s for s in signals if s['type'] == 'SELL']
-
-        if len(buy_signals) > len(sell_signals):
-            recommendation = 'BUY'
-            confidence = min(85, sum(s['strength'] for s in buy_signals) / len(buy_signals))
-        elif len(sell_signals) > len(buy_signals):
-            recommendation = 'SELL'
-            confidence = min(85, sum(s['strength'] for s in sell_signals) / len(sell_signals))
+        # Aggregate signals into recommendation: the average strength of the
+        # side with more signals
+        signs = np.fromiter(
+            (_SIGNAL_SIGNS.get(s['type'], 0) for s in signals), dtype=np.int8, count=len(signals)
+        )
+        strengths = np.fromiter((s['strength'] for s in signals), dtype=np.int16, count=len(signals))
+        direction, buy_count, sell_count, side_strength = _net_signal(signs, strengths)
+
+        recommendation = _RECOMMENDATIONS[direction]
+        if direction:
+            confidence = min(85, side_strength / (buy_count if direction > 0 else sell_count))
         else:
-            recommendation = 'HOLD'
             confidence = 50
 
         return {
@@ -415,8 +897,8 @@ class TechnicalPatternAnalyzer:
             'confidence': round(confidence, 1),
             'signals': signals,
             'signal_summary': {
-                'buy_signals': len(buy_signals),
-                'sell_signals': len(sell_signals),
+                'buy_signals': buy_count,
+                'sell_signals': sell_count,
                 'total_signals': len(signals)
             }
         }
@@ -434,8 +916,44 @@ def analyze_stock_patterns(ticker: str, data: pd.DataFrame, config: Dict[str, An
     Returns:
         Formatted technical analysis report
     """
+    return _stock_patterns_report(TechnicalPatternAnalyzer(config), ticker, data)
+
+
+def analyze_stock_patterns_batch(
+    frames: Dict[str, pd.DataFrame],
+    config: Dict[str, Any] = None,
+    max_workers: Optional[int] = None
+) -> Dict[str, str]:
+    """
+    Analyze several stocks concurrently, e.g. for a scanner over many tickers.
+
+    One analyzer is shared by all tickers and the per-ticker analyses run in a
+    thread pool, so the interpreter overhead is paid once per batch rather than
+    per call site.
+
+    Args:
+        frames: OHLCV DataFrame per ticker symbol
+        config: Optional configuration parameters
+        max_workers: Thread pool size (default: one per ticker, up to the CPU count)
+
+    Returns:
+        Formatted technical analysis report per ticker, in the order of frames
+    """
+    if not frames:
+        return {}
+
     analyzer = TechnicalPatternAnalyzer(config)
+    workers = max_workers or min(len(frames), os.cpu_count() or 1)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        reports = executor.map(
+            lambda item: _stock_patterns_report(analyzer, *item), frames.items()
+        )
+        return dict(zip(frames, reports))
 
+
+def _stock_patterns_report(analyzer: TechnicalPatternAnalyzer, ticker: str, data: pd.DataFrame) -> str:
+    """Format the technical analysis report for one ticker with the given analyzer."""
     try:
         # Generate technical summary
         technical_summary = analyzer.generate_technical_summary(data)
@@ -446,8 +964,8 @@ def analyze_stock_patterns(ticker: str, data: pd.DataFrame, config: Dict[str, An
         # Get trading signals
         trading_signals = analyzer.get_trading_signals(technical_summary)
 
-        # Format report
-        report = f"""# Technical Analysis Report: {ticker}
+        # Format report; sections are collected and joined once at the end
+        parts = [f"""# Technical Analysis Report: {ticker}
 
 ## Overall Assessment
 - **Technical Sentiment:** {technical_summary['overall_sentiment'].upper()}
@@ -455,42 +973,47 @@ def analyze_stock_patterns(ticker: str, data: pd.DataFrame, config: Dict[str, An
 - **Recommendation:** {trading_signals['recommendation']} (Confidence: {trading_signals['confidence']}%)
 
 ## Candlestick Pattern Analysis
-"""
+"""]
 
         patterns = technical_summary['candlestick_patterns']['patterns_detected']
         if patterns:
             for pattern_name, pattern_data in patterns.items():
-                report += f"- **{pattern_name}** ({pattern_data['direction']}): Reliability {pattern_data['reliability']}%, detected {pattern_data['days_ago']} days ago\n"
+                parts.append(f"- **{pattern_name}** ({pattern_data['direction']}): Reliability {pattern_data['reliability']}%, detected {pattern_data['days_ago']} days ago\n")
         else:
-            report += "- No significant candlestick patterns detected in recent trading\n"
+            parts.append("- No significant candlestick patterns detected in recent trading\n")
 
         # Support/Resistance section
         sr_data = technical_summary['support_resistance']
         if 'error' not in sr_data:
-            report += f"""
+            parts.append(f"""
 ## Support & Resistance Analysis
-- **Current Price:** ${sr_data['current_price']}
-- **Support Level:** ${sr_data['support_level']} ({sr_data['support_distance_pct']}% below current)
-- **Resistance Level:** ${sr_data['resistance_level']} ({sr_data['resistance_distance_pct']}% above current)
+- **Current Price:** ${sr_data['current_price']:.2f}
+- **Support Level:** ${sr_data['support_level']:.2f} ({sr_data['support_distance_pct']:.2f}% below current)
+- **Resistance Level:** ${sr_data['resistance_level']:.2f} ({sr_data['resistance_distance_pct']:.2f}% above current)
 - **Price Range Status:** {'Within range' if sr_data['in_range'] else 'Outside range'}
-"""
+""")
 
         # Fibonacci section
         fib_data = technical_summary['fibonacci_analysis']
         if 'error' not in fib_data and fib_data['nearby_levels']:
-            report += "\n## Fibonacci Analysis\n"
-            report += f"**Key Levels Near Current Price:**\n"
+            parts.append("\n## Fibonacci Analysis\n")
+            parts.append("**Key Levels Near Current Price:**\n")
             for level_name, level_data in fib_data['nearby_levels'].items():
-                report += f"- {level_name}: ${level_data['price']} ({level_data['distance_pct']}% away)\n"
+                parts.append(f"- {level_name}: ${level_data['price']:.2f} ({level_data['distance_pct']:.2f}% away)\n")
 
         # Trading signals section
         if trading_signals['signals']:
-            report += "\n## Trading Signals\n"
+            parts.append("\n## Trading Signals\n")
             for signal in trading_signals['signals']:
-                report += f"- **{signal['type']}** signal from {signal['source']} (Strength: {signal['strength']}%)\n"
+                parts.append(f"- **{signal['type']}** signal from {signal['source']} (Strength: {signal['strength']}%)\n")
 
         # Summary table
-        report += f"""
+        if 'error' in sr_data:
+            support_distance = resistance_distance = 'N/A'
+        else:
+            support_distance = f"{sr_data['support_distance_pct']:.2f}"
+            resistance_distance = f"{sr_data['resistance_distance_pct']:.2f}"
+        parts.append(f"""
 ## Signal Summary
 
 | Metric | Value |
@@ -501,13 +1024,13 @@ def analyze_stock_patterns(ticker: str, data: pd.DataFrame, config: Dict[str, An
 | Patterns Detected | {technical_summary['signal_counts']['total']} |
 | Bullish Signals | {technical_summary['signal_counts']['bullish']} |
 | Bearish Signals | {technical_summary['signal_counts']['bearish']} |
-| Support Distance | {sr_data.get('support_distance_pct', 'N/A')}% |
-| Resistance Distance | {sr_data.get('resistance_distance_pct', 'N/A')}% |
+| Support Distance | {support_distance}% |
+| Resistance Distance | {resistance_distance}% |
 
 *Analysis generated on {technical_summary['analysis_timestamp'][:19]}*
-"""
+""")
 
-        return report
+        return ''.join(parts)
 
     except Exception as e:
         return f"Technical Analysis Error for {ticker}: {str(e)}"
\ No newline at end of file